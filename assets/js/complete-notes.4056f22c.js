@@ -0,0 +1,89 @@
+/*
+ * Complete notes: load each lecture's notes as it approaches the viewport.
+ *
+ * Lectures after the first are placeholders with a data-fragment URL (see
+ * scripts/complete_notes.py). A placeholder is filled in shortly before it
+ * scrolls into view, or right away when a contents link or the address
+ * points inside it. Without JavaScript the placeholders link to the
+ * lecture pages.
+ */
+(function () {
+  'use strict';
+
+  var bodies = document.querySelectorAll('[data-fragment]');
+  if (!bodies.length || !window.fetch) return;
+
+  var PRELOAD_MARGIN = '1200px 0px';
+  var loading = {};
+  var observer = null;
+
+  function load(body) {
+    var url = body.getAttribute('data-fragment');
+    if (!url) return Promise.resolve();
+    if (!loading[url]) {
+      loading[url] = fetch(url).then(function (response) {
+        if (!response.ok) throw new Error(response.status);
+        return response.text();
+      }).then(function (html) {
+        body.innerHTML = html;
+        body.removeAttribute('data-fragment');
+        // Math left for the browser by the build
+        if (window.renderMathInElement) window.renderMathInElement(body);
+      }).catch(function () {
+        // Keep the link to the lecture page and try again when it next scrolls into view
+        loading[url] = null;
+        if (observer) observer.observe(body);
+      });
+    }
+    return loading[url];
+  }
+
+  function loadAll() {
+    return Promise.all(Array.prototype.map.call(document.querySelectorAll('[data-fragment]'), load));
+  }
+
+  if ('IntersectionObserver' in window) {
+    observer = new IntersectionObserver(function (entries) {
+      entries.forEach(function (entry) {
+        if (entry.isIntersecting) {
+          observer.unobserve(entry.target);
+          load(entry.target);
+        }
+      });
+    }, { rootMargin: PRELOAD_MARGIN });
+    Array.prototype.forEach.call(bodies, function (body) { observer.observe(body); });
+  } else {
+    loadAll();
+  }
+
+  // A link to a section of a lecture that has not loaded yet: load it, then jump
+  function reveal(hash) {
+    var id = decodeURIComponent(hash.slice(1));
+    if (!id) return;
+    var sections = document.querySelectorAll('.book-lecture');
+    for (var i = 0; i < sections.length; i++) {
+      var section = sections[i];
+      if (id !== section.id && id.indexOf(section.id + '-') !== 0) continue;
+      var body = section.querySelector('[data-fragment]');
+      if (body) {
+        load(body).then(function () {
+          var target = document.getElementById(id);
+          if (target) target.scrollIntoView();
+        });
+      }
+      return;
+    }
+  }
+
+  window.addEventListener('hashchange', function () { reveal(location.hash); });
+  reveal(location.hash);
+
+  var button = document.querySelector('.book-load-all');
+  if (button) {
+    button.hidden = false;
+    button.addEventListener('click', function () {
+      button.disabled = true;
+      loadAll().then(function () { button.hidden = true; });
+    });
+  }
+})();
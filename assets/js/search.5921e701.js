@@ -0,0 +1,281 @@
+/*
+ * Lecture search.
+ *
+ * Queries the prebuilt index in assets/search/ (see scripts/search_index.py).
+ * index.json is fetched on first use, then only the shards holding the
+ * query's terms. Every word must match; the last word also matches as a
+ * prefix while typing, and "quoted phrases" must appear in order.
+ */
+(function () {
+  'use strict';
+
+  var form = document.getElementById('lecture-search');
+  if (!form || !window.fetch || !String.prototype.normalize) return;
+
+  var input = form.querySelector('input');
+  var output = document.getElementById('search-results');
+  var base = form.getAttribute('data-index');
+  var MAX_RESULTS = 10;
+  var HEADING_BOOST = 3;
+  var K1 = 1.2;
+  var B = 0.75;
+
+  var indexPromise = null;
+  var shards = {};
+  var querySerial = 0;
+
+  // Same tokenizer as search_index.tokenize()
+  function tokenize(text) {
+    return text.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '').match(/[a-z0-9]+/g) || [];
+  }
+
+  function loadIndex() {
+    if (!indexPromise) {
+      indexPromise = fetch(base + 'index.json').then(function (response) {
+        if (!response.ok) throw new Error(response.status);
+        return response.json();
+      }).then(function (index) {
+        var total = 0;
+        index.docs.forEach(function (doc) { total += doc[3]; });
+        index.averageLength = total / Math.max(index.docs.length, 1);
+        index.shardSet = {};
+        index.shards.forEach(function (name) { index.shardSet[name] = true; });
+        return index;
+      });
+      indexPromise.catch(function () { indexPromise = null; });
+    }
+    return indexPromise;
+  }
+
+  function shardName(index, term) {
+    var name = term.slice(0, index.prefix).replace(/[^a-z0-9]/g, '_');
+    while (name.length < index.prefix) name += '_';
+    return name;
+  }
+
+  function readVarint(bytes, state) {
+    var value = 0;
+    var scale = 1;
+    var byte;
+    do {
+      byte = bytes[state.pos++];
+      value += (byte & 0x7f) * scale;
+      scale *= 128;
+    } while (byte & 0x80);
+    return value;
+  }
+
+  // Map each term of a shard to the offset of its postings; postings are decoded on demand
+  function parseShard(bytes) {
+    var state = { pos: 0 };
+    var terms = {};
+    var count = readVarint(bytes, state);
+    var previous = '';
+    var decoder = new TextDecoder();
+    for (var i = 0; i < count; i++) {
+      var shared = readVarint(bytes, state);
+      var suffixLength = readVarint(bytes, state);
+      var term = previous.slice(0, shared) + decoder.decode(bytes.subarray(state.pos, state.pos + suffixLength));
+      state.pos += suffixLength;
+      var length = readVarint(bytes, state);
+      terms[term] = state.pos;
+      state.pos += length;
+      previous = term;
+    }
+    return { bytes: bytes, terms: terms };
+  }
+
+  function loadShard(index, name) {
+    if (!index.shardSet[name]) return Promise.resolve(null);
+    if (!shards[name]) {
+      shards[name] = fetch(base + 'shards/' + name + '.bin').then(function (response) {
+        if (!response.ok) throw new Error(response.status);
+        return response.arrayBuffer();
+      }).then(function (buffer) {
+        return parseShard(new Uint8Array(buffer));
+      });
+      shards[name].catch(function () { delete shards[name]; });
+    }
+    return shards[name];
+  }
+
+  // { doc: [positions...] } for one term
+  function decodePostings(shard, term) {
+    var state = { pos: shard.terms[term] };
+    var postings = {};
+    var count = readVarint(shard.bytes, state);
+    var doc = 0;
+    for (var i = 0; i < count; i++) {
+      doc += readVarint(shard.bytes, state);
+      var positions = [];
+      var n = readVarint(shard.bytes, state);
+      var position = 0;
+      for (var j = 0; j < n; j++) {
+        position += readVarint(shard.bytes, state);
+        positions.push(position);
+      }
+      postings[doc] = positions;
+    }
+    return postings;
+  }
+
+  // Postings of a word, merged over every indexed term it is a prefix of
+  function lookup(shard, word, prefix) {
+    if (!shard) return {};
+    if (!prefix) return shard.terms.hasOwnProperty(word) ? decodePostings(shard, word) : {};
+    var merged = {};
+    Object.keys(shard.terms).forEach(function (term) {
+      if (term.lastIndexOf(word, 0) !== 0) return;
+      var postings = decodePostings(shard, term);
+      Object.keys(postings).forEach(function (doc) {
+        merged[doc] = (merged[doc] || []).concat(postings[doc]);
+      });
+    });
+    Object.keys(merged).forEach(function (doc) {
+      merged[doc].sort(function (a, b) { return a - b; });
+    });
+    return merged;
+  }
+
+  function parseQuery(query) {
+    var groups = [];
+    var re = /"([^"]*)"?|[^\s"]+/g;
+    var match;
+    while ((match = re.exec(query))) {
+      var words = tokenize(match[1] !== undefined ? match[1] : match[0]);
+      // A quoted phrase, or a word like MIPS-32 that splits into several terms, must match in order
+      if (words.length) groups.push({ words: words, phrase: words.length > 1 });
+    }
+    // Complete the last word as a prefix while it is still being typed
+    var last = groups[groups.length - 1];
+    if (last && !last.phrase && !/[\s"]$/.test(query)) {
+      last.prefix = last.words[last.words.length - 1].length >= 2;
+    }
+    return groups;
+  }
+
+  // Positions where a phrase starts in a doc, given the postings of each of its words
+  function phrasePositions(wordPostings, doc) {
+    var starts = wordPostings[0][doc] || [];
+    for (var k = 1; k < wordPostings.length && starts.length; k++) {
+      var next = wordPostings[k][doc] || [];
+      starts = starts.filter(function (position) { return next.indexOf(position + k) !== -1; });
+    }
+    return starts;
+  }
+
+  function search(index, groups) {
+    var words = [];
+    groups.forEach(function (group) {
+      group.words.forEach(function (word, i) {
+        words.push({ word: word, prefix: group.prefix && i === group.words.length - 1 });
+      });
+    });
+    var names = words.map(function (entry) { return shardName(index, entry.word); });
+
+    return Promise.all(names.map(function (name) { return loadShard(index, name); })).then(function (loaded) {
+      var w = 0;
+      var matches = groups.map(function (group) {
+        var wordPostings = group.words.map(function () {
+          var entry = words[w];
+          return lookup(loaded[w++], entry.word, entry.prefix);
+        });
+        if (!group.phrase) return wordPostings[0];
+        var postings = {};
+        Object.keys(wordPostings[0]).forEach(function (doc) {
+          var starts = phrasePositions(wordPostings, doc);
+          if (starts.length) postings[doc] = starts;
+        });
+        return postings;
+      });
+
+      // Every group must match; rank by BM25 with heading matches boosted
+      var docs = Object.keys(matches[0] || {}).filter(function (doc) {
+        return matches.every(function (postings) { return postings[doc]; });
+      });
+      var total = index.docs.length;
+      var scored = docs.map(function (doc) {
+        var info = index.docs[doc];
+        var score = 0;
+        matches.forEach(function (postings) {
+          var df = Object.keys(postings).length;
+          var idf = Math.log(1 + (total - df + 0.5) / (df + 0.5));
+          var tf = 0;
+          postings[doc].forEach(function (position) { tf += position < info[2] ? HEADING_BOOST : 1; });
+          score += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * info[3] / index.averageLength));
+        });
+        return { doc: info, score: score };
+      });
+      scored.sort(function (a, b) { return b.score - a.score; });
+      return { results: scored.slice(0, MAX_RESULTS), total: scored.length };
+    });
+  }
+
+  function resultLink(index, doc) {
+    var lecture = index.lectures[doc[0]];
+    if (doc[1] === lecture[1]) return lecture[2];
+    // Scroll to the heading with a text fragment where the browser supports it
+    return lecture[2] + '#:~:text=' + encodeURIComponent(doc[1]).replace(/-/g, '%2D');
+  }
+
+  function render(index, found) {
+    output.textContent = '';
+    if (!found.results.length) {
+      output.textContent = 'No matching sections.';
+      return;
+    }
+    var list = document.createElement('ol');
+    found.results.forEach(function (result) {
+      var lecture = index.lectures[result.doc[0]];
+      var item = document.createElement('li');
+      var link = document.createElement('a');
+      link.href = resultLink(index, result.doc);
+      link.textContent = result.doc[1];
+      var where = document.createElement('span');
+      where.className = 'search-lecture';
+      where.textContent = lecture[1];
+      item.appendChild(link);
+      item.appendChild(where);
+      list.appendChild(item);
+    });
+    output.appendChild(list);
+    if (found.total > found.results.length) {
+      var more = document.createElement('p');
+      more.textContent = found.total - found.results.length + ' more sections match; refine the search to narrow them down.';
+      output.appendChild(more);
+    }
+  }
+
+  function run() {
+    var serial = ++querySerial;
+    var groups = parseQuery(input.value);
+    if (!groups.length) {
+      output.textContent = '';
+      output.hidden = true;
+      return;
+    }
+    loadIndex().then(function (index) {
+      return search(index, groups).then(function (found) {
+        if (serial !== querySerial) return;
+        output.hidden = false;
+        render(index, found);
+      });
+    }).catch(function () {
+      if (serial !== querySerial) return;
+      output.hidden = false;
+      output.textContent = 'Search is unavailable right now.';
+    });
+  }
+
+  var timer = null;
+  input.addEventListener('input', function () {
+    clearTimeout(timer);
+    timer = setTimeout(run, 120);
+  });
+  input.addEventListener('focus', loadIndex, { once: true });
+  form.addEventListener('submit', function (event) {
+    event.preventDefault();
+    clearTimeout(timer);
+    run();
+  });
+})();
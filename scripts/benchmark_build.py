@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Benchmark the lecture converters and fixers, and catch slowdowns.
+
+Synthetic corpora are generated at several scales: 1x has as many lectures
+as Lectures/lectures.json, each the average size of the real markdown
+files, and 10x and 100x have ten and a hundred times as many. Lectures are
+built from the same blocks as benchmark_markdown.py (numbered headings,
+nested lists, fenced code, tables, images, emphasis) plus a flow diagram,
+so every converter and fixer has realistic work to do.
+
+Stages timed over each corpus (best of --repeat runs):
+
+    markdown-to-html    convert_lectures.convert_markdown_to_html
+    markdown-to-latex   MarkdownToLatexConverter on the parsed markdown
+    fix:<name>          every fixer of fix_lectures.py, on the markdown,
+                        LaTeX or HTML of the corpus as fits its kind
+
+Every run is appended to .cache/benchmark/history.json. With a baseline
+saved (--save-baseline), a stage whose time per MB grew by more than
+--threshold against it is reported and the exit status is 1. Stages that
+take under MIN_GATED_SECONDS at a scale are shown but not gated, since
+their timings are mostly noise. Baselines are machine-specific; save one
+on the machine that runs the comparison.
+
+Usage:
+    python scripts/benchmark_build.py                      # 1x, 10x and 100x
+    python scripts/benchmark_build.py --scales 1,10        # quicker
+    python scripts/benchmark_build.py --save-baseline      # record the current timings
+"""
+
+import argparse
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import convert_lectures
+import fix_lectures
+import lecture_manifest
+import markdown_engine
+from benchmark_markdown import make_synthetic_lecture
+from build_cache import load_manifest, save_manifest
+from md_to_latex_converter import MarkdownToLatexConverter
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+BENCHMARK_DIR = ROOT_DIR / '.cache' / 'benchmark'
+HISTORY_FILE = BENCHMARK_DIR / 'history.json'
+BASELINE_FILE = BENCHMARK_DIR / 'baseline.json'
+
+DEFAULT_SCALES = '1,10,100'
+DEFAULT_THRESHOLD = 0.25
+# Stages faster than this (per corpus) are too noisy to fail a build on
+MIN_GATED_SECONDS = 0.25
+
+FLOW_DIAGRAM = '''**Instruction Flow:**
+
+Fetch the instruction from memory
+↓
+Decode it and read the registers
+↓
+Execute the operation in the ALU
+↓
+Write the result back
+
+'''
+
+
+def corpus_shape():
+    """(lectures, average bytes per lecture) of the real corpus."""
+    lectures = lecture_manifest.load_lectures()
+    sizes = [lecture_manifest.source_path(lecture).stat().st_size for lecture in lectures]
+    return len(lectures), sum(sizes) // len(sizes)
+
+
+def make_corpus(count, lecture_bytes):
+    """count synthetic lectures of about lecture_bytes each."""
+    return [make_synthetic_lecture(lecture_bytes - len(FLOW_DIAGRAM), number) + FLOW_DIAGRAM
+            for number in range(1, count + 1)]
+
+
+def markdown_to_latex(md_content):
+    return MarkdownToLatexConverter().render(markdown_engine.parse_markdown(md_content))
+
+
+def stage_names():
+    return ['markdown-to-html', 'markdown-to-latex'] + [f'fix:{name}' for name in fix_lectures.FIXERS]
+
+
+def time_corpus(corpus):
+    """
+    Time every stage over a corpus once; returns {stage: seconds}.
+
+    Lectures go through one at a time: the HTML and LaTeX each converter
+    produces are the input of the fixers for that kind.
+    """
+    totals = dict.fromkeys(stage_names(), 0.0)
+    clock = time.perf_counter
+    for md_content in corpus:
+        start = clock()
+        html = convert_lectures.convert_markdown_to_html(md_content)
+        totals['markdown-to-html'] += clock() - start
+
+        start = clock()
+        latex = markdown_to_latex(md_content)
+        totals['markdown-to-latex'] += clock() - start
+
+        inputs = {'markdown': md_content, 'latex': latex, 'html': html}
+        for name, entry in fix_lectures.FIXERS.items():
+            content = inputs[entry['kind']]
+            start = clock()
+            entry['fix'](content)
+            totals[f'fix:{name}'] += clock() - start
+    return totals
+
+
+def run_benchmark(scales, repeat):
+    """Best-of-repeat stage times for each scale, keyed like '10x'."""
+    count, lecture_bytes = corpus_shape()
+    # Warm up first (lazily loaded manifests, compiled patterns) so the first scale is not penalised
+    time_corpus(make_corpus(1, lecture_bytes))
+    results = {}
+    for scale in scales:
+        corpus = make_corpus(count * scale, lecture_bytes)
+        size_mb = sum(len(md.encode('utf-8')) for md in corpus) / (1024 * 1024)
+        best = None
+        for _ in range(repeat):
+            run = time_corpus(corpus)
+            best = run if best is None else {stage: min(best[stage], run[stage]) for stage in run}
+        results[f'{scale}x'] = {'lectures': len(corpus), 'mb': round(size_mb, 3),
+                                'seconds': {stage: round(seconds, 6) for stage, seconds in best.items()}}
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Stages slower than the baseline by more than threshold, in time per MB.
+
+    Returns {(scale, stage): ratio} for every stage both runs measured, and
+    the list of (scale, stage) pairs that regressed.
+    """
+    ratios, regressions = {}, []
+    for scale, result in results.items():
+        base = baseline.get('results', {}).get(scale)
+        if not base:
+            continue
+        for stage, seconds in result['seconds'].items():
+            base_seconds = base['seconds'].get(stage)
+            if not base_seconds:
+                continue
+            ratio = (seconds / result['mb']) / (base_seconds / base['mb'])
+            ratios[scale, stage] = ratio
+            if ratio > 1 + threshold and max(seconds, base_seconds) >= MIN_GATED_SECONDS:
+                regressions.append((scale, stage))
+    return ratios, regressions
+
+
+def make_record(results, repeat):
+    return {
+        'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': f'{platform.system()} {platform.machine()}',
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def print_results(results, ratios):
+    print(f"{'scale':>6}  {'stage':<22} {'time':>9}  {'MB/s':>8}  {'vs baseline':>11}")
+    for scale, result in results.items():
+        for stage, seconds in result['seconds'].items():
+            speed = result['mb'] / seconds if seconds else float('inf')
+            ratio = ratios.get((scale, stage))
+            versus = f'{ratio:>10.2f}x' if ratio is not None else f"{'-':>11}"
+            print(f"{scale:>6}  {stage:<22} {seconds:>8.3f}s  {speed:>8.1f}  {versus}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the converters and fixers on synthetic corpora.')
+    parser.add_argument('--scales', default=DEFAULT_SCALES, metavar='N,...',
+                        help=f'corpus sizes as multiples of the real lecture count (default {DEFAULT_SCALES})')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per corpus (best is kept)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'allowed slowdown against the baseline (default {DEFAULT_THRESHOLD * 100:.0f}%%)')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE, help='baseline file to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='store this run as the new baseline')
+    args = parser.parse_args(argv)
+
+    try:
+        scales = [int(scale) for scale in args.scales.split(',')]
+    except ValueError:
+        parser.error(f'--scales must be a comma-separated list of integers, not {args.scales!r}')
+
+    count, lecture_bytes = corpus_shape()
+    print(f"⏱️  Benchmarking {count} lectures of ~{lecture_bytes / 1024:.0f} KB at "
+          f"{', '.join(f'{scale}x' for scale in scales)} (best of {args.repeat})\n")
+
+    results = run_benchmark(scales, args.repeat)
+    record = make_record(results, args.repeat)
+    baseline = load_manifest(args.baseline)
+    ratios, regressions = compare(results, baseline, args.threshold)
+    print_results(results, ratios)
+
+    history = load_manifest(HISTORY_FILE)
+    history['runs'] = history.get('runs', []) + [record]
+    save_manifest(HISTORY_FILE, history)
+
+    if args.save_baseline:
+        save_manifest(args.baseline, record)
+        print(f"\n📦 Saved the baseline to {args.baseline}")
+        return 0
+    if not baseline:
+        print(f"\n⚠️  No baseline at {args.baseline}; run with --save-baseline to record one")
+        return 0
+    if regressions:
+        print(f"\n❌ {len(regressions)} stage(s) slower than the baseline by more than {args.threshold:.0%}:")
+        for scale, stage in regressions:
+            print(f"   {scale} {stage}: {ratios[scale, stage]:.2f}x")
+        return 1
+    print(f"\n✅ No stage regressed by more than {args.threshold:.0%} against the baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
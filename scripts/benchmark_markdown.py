@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Markdown engine against the old chained re.sub converter.
+
+Builds synthetic lectures of increasing size (up to 10 MB by default) out of
+realistic blocks - numbered headings, nested lists, fenced code, tables,
+images and bold/italic text - and times both converters on each. A linear
+converter keeps a constant time per MB as the document grows.
+
+Usage:
+    python scripts/benchmark_markdown.py [--max-mb 10] [--repeat 3]
+"""
+
+import argparse
+import re
+import time
+
+from markdown_engine import parse_markdown, render_html
+
+SECTION_TEMPLATE = '''## {n}.1 Section {n}
+
+Intro paragraph for section {n} with **bold text**, *italic text*, `inline code`
+and a [link](lecture-{n:02d}.html) spread over
+two lines.
+
+### {n}.1.1 Details
+
+**Key Points:**
+
+- First point about register_file_{n} and the ALU
+- Second point with **emphasis** and `LW $t1, 8($t0)`
+  - Nested point one
+  - Nested point two
+    1. Deep ordered item
+    2. Another deep item
+- Third point
+
+```assembly
+ADD R1, R2, R3    ; R1 = R2 + R3
+LDR R0, [R1, #4]  ; load word
+B   loop_{n}
+```
+
+| Component | Delay (ps) | Notes |
+| --------- | ---------: | :---: |
+| ALU       | 200        | `add` |
+| Memory    | 200        | *slow* |
+
+<img src="../img/Pipeline Stages.jpeg" alt="Pipeline stages" width="600">
+
+> "Make the common case fast"
+
+1. Fetch
+2. Decode
+3. Execute
+
+'''
+
+
+def make_synthetic_lecture(target_bytes, number=99):
+    """Generate a synthetic lecture of roughly target_bytes bytes."""
+    parts = [f'# Lecture {number}: Synthetic Benchmark Lecture\n\n*By Dr. Isuru Nawinne*\n\n']
+    size = len(parts[0])
+    n = 1
+    while size < target_bytes:
+        section = SECTION_TEMPLATE.format(n=n)
+        parts.append(section)
+        size += len(section)
+        n += 1
+    return ''.join(parts)
+
+
+def legacy_convert_markdown_to_html(md_content):
+    """The previous convert_markdown_to_html: a chain of whole-document passes."""
+    html = md_content
+    html = re.sub(r'^# .*?\n', '', html, count=1, flags=re.MULTILINE)
+    html = re.sub(r'^# (.*?)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
+    html = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
+    html = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
+    html = re.sub(r'^#### (.*?)$', r'<h4>\1</h4>', html, flags=re.MULTILINE)
+    html = re.sub(r'\*\*\*(.*?)\*\*\*', r'<strong><em>\1</em></strong>', html)
+    html = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', html)
+    html = re.sub(r'\*(.*?)\*', r'<em>\1</em>', html)
+    html = re.sub(r'_(.*?)_', r'<em>\1</em>', html)
+    html = re.sub(r'`([^`]+)`', r'<code>\1</code>', html)
+    html = re.sub(r'<img src="img/', r'<img src="../img/', html)
+    html = re.sub(r'!\[(.*?)\]\((.*?)\)', r'<img src="\2" alt="\1" style="max-width: 100%;">', html)
+    html = re.sub(r'\[(.*?)\]\((.*?)\)', r'<a href="\2">\1</a>', html)
+
+    lines = html.split('\n')
+    in_ul = False
+    result_lines = []
+    for line in lines:
+        if re.match(r'^- ', line):
+            if not in_ul:
+                result_lines.append('<ul>')
+                in_ul = True
+            result_lines.append('<li>' + line[2:] + '</li>')
+        else:
+            if in_ul:
+                result_lines.append('</ul>')
+                in_ul = False
+            result_lines.append(line)
+    if in_ul:
+        result_lines.append('</ul>')
+    html = '\n'.join(result_lines)
+
+    lines = html.split('\n')
+    result_lines = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('<') and not line.endswith('>'):
+            result_lines.append(f'<p>{line}</p>')
+        else:
+            result_lines.append(line)
+    return '\n'.join(result_lines)
+
+
+def engine_convert_markdown_to_html(md_content):
+    return render_html(parse_markdown(md_content))
+
+
+def time_converter(convert, md_content, repeat):
+    """Best-of-N wall time for one conversion."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        convert(md_content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark markdown converters on synthetic lectures.')
+    parser.add_argument('--max-mb', type=float, default=10.0, help='largest synthetic lecture in MB')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement (best is kept)')
+    args = parser.parse_args()
+
+    sizes = [args.max_mb / 8, args.max_mb / 4, args.max_mb / 2, args.max_mb]
+    converters = [
+        ('engine', engine_convert_markdown_to_html),
+        ('legacy re.sub', legacy_convert_markdown_to_html),
+    ]
+
+    print("=" * 72)
+    print("Markdown converter benchmark (best of %d runs)" % args.repeat)
+    print("=" * 72)
+    print(f"{'size':>9}  {'converter':<14} {'time':>9}  {'s/MB':>7}  {'vs smallest':>11}")
+
+    baseline = {}
+    for size_mb in sizes:
+        md_content = make_synthetic_lecture(int(size_mb * 1024 * 1024))
+        actual_mb = len(md_content.encode('utf-8')) / (1024 * 1024)
+        for name, convert in converters:
+            elapsed = time_converter(convert, md_content, args.repeat)
+            per_mb = elapsed / actual_mb
+            baseline.setdefault(name, per_mb)
+            print(f"{actual_mb:>7.2f}MB  {name:<14} {elapsed:>8.3f}s  {per_mb:>7.3f}  "
+                  f"{per_mb / baseline[name]:>10.2f}x")
+
+    print("\nA linear converter keeps 'vs smallest' close to 1.00x as the input grows.")
+
+
+if __name__ == '__main__':
+    main()
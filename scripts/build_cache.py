@@ -0,0 +1,32 @@
+"""
+JSON state files shared by the incremental build scripts.
+
+Build manifests, the PDF part state, the compression manifest and the task
+graph state are all small JSON objects that are read at the start of a run
+and written back at the end. A missing or corrupt file is treated as empty,
+so the next build simply redoes the work, and files are replaced
+atomically, so an interrupted build never leaves half a manifest behind.
+"""
+
+import json
+import os
+
+
+def load_manifest(manifest_file):
+    """Load a JSON state file, treating a missing or corrupt file as empty."""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(manifest_file, manifest):
+    """Write a JSON state file atomically."""
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = manifest_file.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_file, manifest_file)
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Incremental PDF build of the complete lecture notes.
+
+Compiling Lectures/latex/main.tex runs pdflatex over every lecture, twice
+for the table of contents, even when one paragraph changed. This script
+splits the book into parts instead: the front matter (cover, contents,
+preface) and one part per \\input{lecture-NN} line of main.tex, each a
+standalone document with main.tex's preamble. Then:
+
+1. lecture-NN.tex is regenerated only when its markdown changed (see
+   md_to_latex_converter.update_latex_files). A .tex file that differs
+   from what the build last generated is curated by hand: it is kept,
+   with a warning when its markdown changes, until it is deleted or
+   --force is given.
+2. Every part whose inputs changed is compiled to its own cached PDF in
+   .cache/pdf/, in parallel with --jobs. A part starts with the page,
+   chapter, section, figure, table and equation counters its predecessor
+   ended with, so numbering matches the single-document build.
+3. The front matter is only recompiled when the table of contents it
+   prints changed, i.e. when headings were added, renamed or moved to
+   another page. When a part's length changes, the parts after it are
+   recompiled with the shifted counters until nothing moves any more.
+4. The cached parts are stitched into materials/CO224-Complete-Notes.pdf
+   with pypdf, with PDF bookmarks rebuilt from the collected headings.
+
+Each part starts on a fresh page, so lectures that share a chapter no
+longer run on from each other mid-page.
+
+Usage:
+    python scripts/build_pdf.py [--jobs N] [--force] [--no-convert]
+"""
+
+import argparse
+import hashlib
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:  # stitching is optional
+    PdfWriter = None
+
+import build_trace
+from build_cache import load_manifest, save_manifest
+from build_pool import map_ordered
+from md_to_latex_converter import LATEX_DIR, update_latex_files
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MAIN_TEX = LATEX_DIR / 'main.tex'
+BUILD_DIR = ROOT_DIR / '.cache' / 'pdf'
+# Keys, counters, page counts and headings of the cached parts
+STATE_FILE = BUILD_DIR / 'state.json'
+OUTPUT_PDF = ROOT_DIR / 'materials' / 'CO224-Complete-Notes.pdf'
+
+FRONT_PART = 'part-front'
+# Counters carried from one part to the next (book class resets the last four per chapter)
+COUNTERS = ['page', 'chapter', 'section', 'figure', 'table', 'equation']
+CHAPTER_COUNTERS = {'section', 'figure', 'table', 'equation'}
+FRESH_COUNTERS = {'page': 1, 'chapter': 0, 'section': 0, 'figure': 0, 'table': 0, 'equation': 0}
+# Enough for a first build: one round per propagated change plus the front matter
+MAX_ROUNDS = 6
+# pdflatex runs per part when a lecture's own cross-references move
+MAX_LATEX_RUNS = 3
+
+COMMENT_RE = re.compile(r'(?<!\\)%.*')
+INPUT_RE = re.compile(r'\\input\{(lecture-\d+)\}')
+GRAPHICS_RE = re.compile(r'\\includegraphics(?:\[[^\]]*\])?\{(?:\\detokenize\{([^}]+)\}|([^}]+))\}')
+PART_END_RE = re.compile(r'\\partend\{(\w+)\}\{(-?\d+)\}')
+PAGES_RE = re.compile(r'Output written on .*? \((\d+) pages?')
+TOC_WRITE = '\\@writefile{toc}{'
+
+# Appended to every part: record where the counters ended for the next part
+PART_END = (
+    '\\clearpage\n'
+    '\\makeatletter\n'
+    '\\immediate\\write\\@mainaux{\\string\\providecommand\\string\\partend[2]{}}\n'
+    + ''.join(f'\\immediate\\write\\@mainaux{{\\string\\partend{{{counter}}}{{\\the\\value{{{counter}}}}}}}\n'
+              for counter in COUNTERS)
+    + '\\makeatother\n'
+)
+
+
+def uncommented(line):
+    return COMMENT_RE.sub('', line).strip()
+
+
+def load_book(main_tex=MAIN_TEX):
+    """
+    Split main.tex into its preamble and parts.
+
+    Returns (preamble, parts); the first part is the front matter, then one
+    part per uncommented \\input{lecture-NN}, carrying any \\chapter lines
+    that precede it.
+    """
+    text = main_tex.read_text(encoding='utf-8')
+    preamble, rest = text.split('\\begin{document}', 1)
+    body = rest.split('\\end{document}', 1)[0]
+
+    front = {'name': FRONT_PART, 'lines': [], 'inputs': [], 'chapter': False}
+    parts = [front]
+    pending = []
+    in_front = True
+    for line in body.splitlines():
+        code = uncommented(line)
+        match = INPUT_RE.fullmatch(code)
+        in_front = in_front and not match and not code.startswith('\\chapter')
+        if in_front:
+            front['lines'].append(line)
+        elif match:
+            parts.append({
+                'name': f'part-{match.group(1)}',
+                'lines': pending + [line],
+                'inputs': [LATEX_DIR / f'{match.group(1)}.tex'],
+                'chapter': any(uncommented(pending_line).startswith('\\chapter') for pending_line in pending),
+            })
+            pending = []
+        else:
+            pending.append(line)
+    # Anything after the last lecture belongs to it
+    parts[-1]['lines'] += pending
+    return preamble, parts
+
+
+def part_source(preamble, part, start):
+    """The standalone .tex document for one part."""
+    counters = ''
+    if part['name'] != FRONT_PART:
+        counters = ''.join(
+            f'\\setcounter{{{counter}}}{{{start[counter]}}}\n' for counter in COUNTERS)
+    return (f'{preamble}\\begin{{document}}\n{counters}'
+            + '\n'.join(part['lines']) + f'\n{PART_END}\\end{{document}}\n')
+
+
+def input_files(part):
+    """The files a part reads: its lecture source and every image it includes."""
+    files = list(part['inputs'])
+    text = '\n'.join(part['lines'])
+    for path in part['inputs']:
+        text += path.read_text(encoding='utf-8') if path.exists() else ''
+    for detokenized, plain in GRAPHICS_RE.findall(text):
+        name = detokenized or plain
+        for candidate in (LATEX_DIR / name, LATEX_DIR / 'img' / name):
+            if candidate.is_file():
+                files.append(candidate)
+                break
+    return files
+
+
+def part_key(source, toc, files):
+    """Combine everything a part's PDF depends on into a single content hash."""
+    h = hashlib.sha256(source.encode('utf-8'))
+    h.update(f'\0{toc}\0'.encode('utf-8'))
+    for path in files:
+        h.update(f'\0{path.name}\0'.encode('utf-8'))
+        h.update(path.read_bytes() if path.exists() else b'')
+    return h.hexdigest()
+
+
+def read_group(text, pos):
+    """Return the contents of the brace group starting at text[pos] and the index after it."""
+    depth = 0
+    for end in range(pos, len(text)):
+        if text[end] == '{' and text[end - 1] != '\\':
+            depth += 1
+        elif text[end] == '}' and text[end - 1] != '\\':
+            depth -= 1
+            if depth == 0:
+                return text[pos + 1:end], end + 1
+    raise ValueError(f'unbalanced braces: {text[pos:pos + 60]}')
+
+
+def parse_aux(aux_text):
+    """
+    The table of contents entries and final counters written by one part.
+
+    Entries are [level, title, page, anchor] lists, as in the
+    \\contentsline lines of a .toc file.
+    """
+    entries = []
+    for line in aux_text.splitlines():
+        if not line.startswith(TOC_WRITE + '\\contentsline '):
+            continue
+        pos = len(TOC_WRITE + '\\contentsline ')
+        entry = []
+        try:
+            for _ in range(4):
+                group, pos = read_group(line, pos)
+                entry.append(group)
+        except ValueError:
+            continue
+        entries.append(entry)
+    counters = {name: int(value) for name, value in PART_END_RE.findall(aux_text)}
+    return entries, counters
+
+
+def combined_toc(parts, state):
+    """
+    The .toc file for the front matter: its own entries, then every lecture's.
+
+    Lecture entries drop their hyperref anchor, which only exists in the
+    lecture's own PDF; the stitched file gets bookmarks instead.
+    """
+    lines = []
+    for part in parts:
+        record = state.get(part['name'])
+        for level, title, page, anchor in (record['toc'] if record else []):
+            anchor = anchor if part['name'] == FRONT_PART else ''
+            lines.append(f'\\contentsline {{{level}}}{{{title}}}{{{page}}}{{{anchor}}}%\n')
+    return ''.join(lines)
+
+
+def predict_end(part, record, start):
+    """
+    Where a part's counters will end when it starts at start.
+
+    Shifting a part's start shifts its end by the same amount, except for
+    counters a \\chapter inside the part resets.
+    """
+    if not record:
+        return dict(start, page=start['page'] + 1)
+    end = {}
+    for counter in COUNTERS:
+        if part['chapter'] and counter in CHAPTER_COUNTERS:
+            end[counter] = record['end'][counter]
+        else:
+            end[counter] = record['end'][counter] + start[counter] - record['start'][counter]
+    return end
+
+
+def plan_round(preamble, parts, state):
+    """Work out every part's starting counters and return the stale parts as jobs."""
+    jobs = []
+    counters = dict(FRESH_COUNTERS)
+    for part in parts:
+        front = part['name'] == FRONT_PART
+        start = dict(FRESH_COUNTERS) if front else counters
+        source = part_source(preamble, part, start)
+        toc = combined_toc(parts, state) if front else ''
+        key = part_key(source, toc, input_files(part))
+
+        record = state.get(part['name'])
+        if not record or record['key'] != key or not (BUILD_DIR / f"{part['name']}.pdf").exists():
+            jobs.append({'name': part['name'], 'source': source, 'toc': toc, 'key': key, 'start': start})
+        counters = predict_end(part, record, start)
+
+    # The contents page waits until the lecture page numbers have settled
+    if len(jobs) > 1 and jobs[0]['name'] == FRONT_PART and state.get(FRONT_PART):
+        jobs = jobs[1:]
+    return jobs
+
+
+def run_pdflatex(tex_file):
+    return subprocess.run(['pdflatex', '-interaction=nonstopmode', '-halt-on-error',
+                           f'-output-directory={BUILD_DIR}', str(tex_file)],
+                          cwd=LATEX_DIR, capture_output=True, text=True, errors='replace')
+
+
+def compile_part(job):
+    """Compile one part to .cache/pdf/<name>.pdf; runs in a worker process when --jobs > 1."""
+    with build_trace.span('compile part', 'pdf', part=job['name']):
+        return compile_part_source(job)
+
+
+def compile_part_source(job):
+    tex_file = BUILD_DIR / f"{job['name']}.tex"
+    tex_file.write_text(job['source'], encoding='utf-8')
+    log_file = tex_file.with_suffix('.log')
+
+    for _ in range(MAX_LATEX_RUNS):
+        # pdflatex rewrites the .toc at the end of every run
+        if job['toc']:
+            tex_file.with_suffix('.toc').write_text(job['toc'], encoding='utf-8')
+        result = run_pdflatex(tex_file)
+        log = log_file.read_text(encoding='utf-8', errors='replace') if log_file.exists() else result.stdout
+        if result.returncode != 0:
+            return {'error': '\n'.join(log.splitlines()[-20:])}
+        if 'Rerun to get cross-references right' not in log:
+            break
+
+    toc, end = parse_aux(tex_file.with_suffix('.aux').read_text(encoding='utf-8', errors='replace'))
+    if not set(COUNTERS) <= set(end):
+        return {'error': f"{tex_file.name} did not record its final counters"}
+    pages = PAGES_RE.search(log)
+    return {
+        'key': job['key'],
+        'start': job['start'],
+        'end': end,
+        'pages': int(pages.group(1)) if pages else 0,
+        'toc': toc,
+    }
+
+
+def build_parts(preamble, parts, state, jobs):
+    """Compile stale parts until no part's counters or contents change; returns the number of compiles."""
+    compiled = 0
+    for round_num in range(1, MAX_ROUNDS + 1):
+        stale = plan_round(preamble, parts, state)
+        if not stale:
+            return compiled
+
+        print(f"Round {round_num}: compiling {', '.join(job['name'] for job in stale)}")
+        for job, result in zip(stale, map_ordered(compile_part, stale, jobs)):
+            if 'error' in result:
+                print(f"❌ pdflatex failed on {job['name']}.tex:\n{result['error']}")
+                save_manifest(STATE_FILE, state)
+                sys.exit(1)
+            state[job['name']] = result
+        compiled += len(stale)
+        save_manifest(STATE_FILE, state)
+
+    print(f"⚠️  Page numbering still moving after {MAX_ROUNDS} rounds; run again to settle it")
+    return compiled
+
+
+def bookmark_title(title):
+    """Plain text for a PDF bookmark from a LaTeX heading."""
+    title = re.sub(r'\\numberline\s*\{([^}]*)\}', r'\1 ', title)
+    title = re.sub(r'\\([&%$#_{}])', r'\1', title)
+    title = re.sub(r'\\[A-Za-z@]+\s*', '', title)
+    return ' '.join(title.replace('{', '').replace('}', '').split())
+
+
+def stitch(parts, state, output_file):
+    """Concatenate the cached part PDFs and rebuild the bookmarks from the headings."""
+    writer = PdfWriter()
+    offset = 0
+    chapter = None
+    for part in parts:
+        record = state[part['name']]
+        reader = PdfReader(BUILD_DIR / f"{part['name']}.pdf")
+        writer.append(reader, import_outline=False)
+        if part['name'] == FRONT_PART and reader.metadata:
+            writer.add_metadata(dict(reader.metadata))
+
+        for level, title, page, _ in record['toc']:
+            if level not in ('chapter', 'section') or not page.isdigit():
+                continue
+            # Physical page: count back from the part's last page
+            index = offset + record['pages'] - (record['end']['page'] - int(page))
+            if level == 'chapter':
+                chapter = writer.add_outline_item(bookmark_title(title), index)
+            else:
+                writer.add_outline_item(bookmark_title(title), index,
+                                        parent=None if part['name'] == FRONT_PART else chapter)
+        offset += record['pages']
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_suffix('.tmp')
+    with open(tmp_file, 'wb') as f:
+        writer.write(f)
+    tmp_file.replace(output_file)
+    return offset
+
+
+def stitch_key(parts, state):
+    return hashlib.sha256(''.join(state[part['name']]['key'] for part in parts).encode('ascii')).hexdigest()
+
+
+def missing_tools():
+    """Why the PDF cannot be built on this machine, or None if it can."""
+    if shutil.which('pdflatex') is None:
+        return "pdflatex not found; install TeX Live (texlive-latex-extra) to build the PDF"
+    if PdfWriter is None:
+        return "Stitching the parts needs pypdf (pip install pypdf)"
+    return None
+
+
+def build_notes_pdf(jobs=1, force=False):
+    """Compile the stale parts of main.tex and stitch them into OUTPUT_PDF if anything changed."""
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    preamble, parts = load_book()
+    state = {} if force else load_manifest(STATE_FILE)
+    # Forget parts that are no longer in main.tex
+    state = {name: record for name, record in state.items()
+             if name == 'stitched' or any(part['name'] == name for part in parts)}
+
+    compiled = build_parts(preamble, parts, state, jobs)
+
+    key = stitch_key(parts, state)
+    if compiled or state.get('stitched') != key or not OUTPUT_PDF.exists():
+        with build_trace.span('stitch pdf', 'pdf'):
+            pages = stitch(parts, state, OUTPUT_PDF)
+        state['stitched'] = key
+        save_manifest(STATE_FILE, state)
+        print(f"\n✅ Stitched {len(parts)} parts ({pages} pages, {compiled} recompiled) "
+              f"into {OUTPUT_PDF.relative_to(ROOT_DIR)}")
+    else:
+        print(f"\n✅ {OUTPUT_PDF.relative_to(ROOT_DIR)} is up to date")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the complete lecture notes PDF incrementally.')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='compile parts in N worker processes (0 = one per CPU)')
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate and recompile every lecture even if its inputs are unchanged')
+    parser.add_argument('--no-convert', action='store_true',
+                        help='build from the existing lecture-NN.tex files without regenerating them')
+    args = parser.parse_args(argv)
+
+    missing = missing_tools()
+    if missing:
+        print(f"❌ {missing}")
+        sys.exit(1)
+
+    if not args.no_convert:
+        changed = update_latex_files(args.force, args.jobs)
+        print(f"📝 {len(changed)} lecture .tex files regenerated")
+
+    build_notes_pdf(args.jobs, args.force)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Process pool helper for the per-lecture build loops.
+
+map_ordered() fans work items out across worker processes and returns the
+results in input order, so a parallel build writes exactly the same files,
+in the same order, as a serial one. Counters from the workers (document
+cache hits and anything added with register_stats()) and their trace spans
+(see build_trace.py) are folded back into this process for the end-of-build
+summary.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import build_trace
+import document_cache
+
+# Module-level counter dicts that workers report back to the parent
+_stats = [document_cache.STATS]
+
+
+def register_stats(stats):
+    """Have map_ordered() merge a counter dict from the worker processes."""
+    if not any(stats is tracked for tracked in _stats):
+        _stats.append(stats)
+
+
+def resolve_jobs(jobs):
+    """Turn a --jobs value into a worker count (0 means one per CPU)."""
+    if jobs is None or jobs < 0:
+        return 1
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _call_with_stats(func, item):
+    before = [dict(stats) for stats in _stats]
+    position = build_trace.mark()
+    result = func(item)
+    deltas = [{key: stats[key] - old[key] for key in old} for stats, old in zip(_stats, before)]
+    return result, deltas, build_trace.events_since(position)
+
+
+def map_ordered(func, items, jobs=1):
+    """
+    Apply func to every item and return the results in input order.
+
+    Runs in-process when jobs <= 1. func must be a module-level function so
+    it can be sent to worker processes.
+    """
+    items = list(items)
+    jobs = resolve_jobs(jobs)
+    if jobs <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as executor:
+        for result, deltas, events in executor.map(partial(_call_with_stats, func), items):
+            for stats, delta in zip(_stats, deltas):
+                for key, count in delta.items():
+                    stats[key] += count
+            build_trace.add_events(events)
+            results.append(result)
+    return results
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Build everything that is out of date, as one dependency graph.
+
+Each step of the build is a task that declares the files it reads and the
+files it writes; a task depends on whichever tasks write its inputs. Per
+lecture the chain is
+
+    fix-markdown:<slug>   markdown fixers of fix_lectures.py, in place
+      ├─ html:<slug>      the lecture page (template, <head> assets, video)
+      └─ latex:<slug>     lecture-NN.tex via md_to_latex_converter.py
+           └─ fix-latex:<slug>   LaTeX fixers (flow diagrams, itemize, spacing)
+
+and the whole-site tasks gather the lectures: search-index and
+complete-notes read every markdown file, index-page reads
+Lectures/lectures.json, service-worker reads every page and asset it
+precaches, and pdf reads main.tex and every lecture .tex.
+
+A task runs only when the content hash of its inputs (plus the code that
+shapes its output) differs from its last successful run, recorded in
+.cache/build/graph.json, or when an output is missing. Tasks whose
+dependencies are done run together, in worker processes with --jobs, so
+the lectures' chains are built in parallel. A task that rewrites a file
+without changing it does not dirty the tasks after it, so editing one
+lecture runs only that lecture's chain and the whole-site tasks.
+
+Only the lectures main.tex \inputs get a .tex file. Those files may carry
+hand edits: a .tex file that differs from what the build last wrote is
+neither regenerated nor fixed (as in build_pdf.py), only reported, until
+it is deleted or --force is given.
+Each page the graph renders is also recorded in convert_lectures.py's
+manifest, so a later convert_lectures.py run does not render it again. The
+pdf task is skipped when pdflatex or pypdf is missing.
+
+The individual scripts still work on their own; this one only decides
+which of their steps need to run.
+
+Usage:
+    python scripts/build_site.py                   # everything out of date
+    python scripts/build_site.py -j 4              # in 4 worker processes
+    python scripts/build_site.py html:lecture-05   # one task and what it needs
+    python scripts/build_site.py latex pdf         # every task of a kind
+    python scripts/build_site.py --dry-run         # list what would run
+"""
+
+import argparse
+import hashlib
+import inspect
+import sys
+from functools import partial
+from pathlib import Path
+
+import build_pdf
+import build_trace
+import complete_notes
+import convert_lectures
+import fix_lectures
+import lecture_manifest
+import md_to_latex_converter
+import search_index
+import service_worker
+from build_cache import load_manifest, save_manifest
+from build_pool import map_ordered
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+STATE_FILE = ROOT_DIR / '.cache' / 'build' / 'graph.json'
+HTML_DIR = ROOT_DIR / 'Lectures' / 'html'
+
+
+# ---------------------------------------------------------------- actions
+
+def fix_lecture_file(path):
+    """Run every default fixer for the kind of file at path."""
+    names = [name for name, entry in fix_lectures.FIXERS.items() if entry['default']]
+    fix_lectures.fix_file((str(path), names, False))
+
+
+def render_lecture_page(index):
+    """Write the page of the index-th lecture of the manifest."""
+    lectures = lecture_manifest.load_lectures()
+    md_bytes = lecture_manifest.source_path(lectures[index]).read_bytes()
+    job = convert_lectures.make_lecture_job(lectures, index, md_bytes)
+    job['output_file'] = HTML_DIR / f'{job["slug"]}.html'
+    convert_lectures.write_lecture_page(job)
+
+
+def record_lecture_page(index):
+    """Record the index-th lecture's page in convert_lectures.py's manifest, as convert_lectures.py would."""
+    lectures = lecture_manifest.load_lectures()
+    lecture_file = lecture_manifest.source_path(lectures[index])
+    md_bytes = lecture_file.read_bytes()
+    job = convert_lectures.make_lecture_job(lectures, index, md_bytes)
+    entry = {'source': lecture_file.name,
+             'key': convert_lectures.get_build_key(md_bytes, convert_lectures.get_template_hash(), job)}
+    manifest_file = ROOT_DIR / convert_lectures.MANIFEST_FILE
+    manifest = load_manifest(manifest_file)
+    if manifest.get(f'{job["slug"]}.html') != entry:
+        manifest[f'{job["slug"]}.html'] = entry
+        save_manifest(manifest_file, manifest)
+
+
+def write_latex_file(md_file, latex_file):
+    """Convert one lecture to LaTeX, leaving the file alone if nothing changed."""
+    latex_content = md_to_latex_converter.convert_lecture_file(md_file)
+    if latex_file.exists() and latex_file.read_text(encoding='utf-8') == latex_content:
+        return
+    latex_file.write_text(latex_content, encoding='utf-8')
+
+
+def record_latex_file(md_file, latex_file):
+    """Record a lecture's .tex file as generated, in md_to_latex_converter.py's manifest."""
+    md_to_latex_converter.record_output(latex_file, md_file)
+
+
+def latex_hand_edits(latex_file):
+    """Why a lecture's .tex file must be left alone, or None if the build may rewrite it."""
+    entry = load_manifest(md_to_latex_converter.MANIFEST_FILE).get(latex_file.name)
+    if md_to_latex_converter.hand_edited(latex_file, entry):
+        return f'{latex_file.name} {md_to_latex_converter.HAND_EDITED}'
+    return None
+
+
+def update_search_index():
+    search_index.update_index(search_index.lecture_entries())
+
+
+def build_complete_notes():
+    complete_notes.build_book(complete_notes.lecture_jobs())
+
+
+# ---------------------------------------------------------------- graph
+
+def task(name, action, args=(), inputs=(), outputs=(), code='', keep=None, pool=True, missing=None,
+         done=None):
+    """
+    Declare a build step.
+
+    action(*args) does the work; it must be a module-level function so it
+    can run in a worker process. code is a hash of the code that shapes the
+    outputs, so editing it reruns the task. keep() is asked before the
+    task reruns and returns why its existing outputs must be left alone
+    (they were edited by hand), or None. pool=False runs the task in this
+    process (for steps that start worker processes of their own); missing
+    is why the task cannot run on this machine, if it cannot. done(*args)
+    runs in this process after the task succeeded, one task at a time, for
+    bookkeeping that workers must not race on.
+    """
+    return {'name': name, 'action': action, 'args': tuple(args), 'inputs': [Path(p) for p in inputs],
+            'outputs': [Path(p) for p in outputs], 'code': code, 'keep': keep, 'pool': pool,
+            'missing': missing, 'done': done}
+
+
+def source_hash(*objects):
+    return hashlib.sha256(''.join(inspect.getsource(obj) for obj in objects).encode('utf-8')).hexdigest()
+
+
+def lecture_tasks(jobs=1):
+    """Every task of the site build, each declared after the tasks that write its inputs."""
+    lectures = lecture_manifest.load_lectures()
+    fixer_code = source_hash(fix_lectures)
+    template_code = convert_lectures.get_template_hash()
+    tasks = []
+    for i, lecture in enumerate(lectures):
+        md_file = lecture_manifest.source_path(lecture)
+        tasks.append(task(f"fix-markdown:{lecture['slug']}", fix_lecture_file, [md_file],
+                          inputs=[md_file], outputs=[md_file], code=fixer_code))
+        tasks.append(task(f"html:{lecture['slug']}", render_lecture_page, [i],
+                          inputs=[md_file, lecture_manifest.LECTURES_FILE],
+                          outputs=[HTML_DIR / f"{lecture['slug']}.html"], code=template_code,
+                          done=record_lecture_page))
+
+    latex_code = md_to_latex_converter.get_converter_hash()
+    # Only the lectures the book includes; the others would be untracked files nobody reads
+    included = {path for part in build_pdf.load_book()[1] for path in part['inputs']}
+    latex_files = []
+    for number, filename in enumerate(md_to_latex_converter.LECTURE_ORDER, 1):
+        md_file = md_to_latex_converter.MARKDOWN_DIR / filename
+        latex_file = md_to_latex_converter.LATEX_DIR / f'lecture-{number:02d}.tex'
+        if not md_file.exists() or latex_file not in included:
+            continue
+        latex_files.append(latex_file)
+        # A hand-edited file is left to its author, by the converter and the fixers alike
+        keep = partial(latex_hand_edits, latex_file)
+        tasks.append(task(f'latex:{latex_file.stem}', write_latex_file, [md_file, latex_file],
+                          inputs=[md_file], outputs=[latex_file], code=latex_code, keep=keep,
+                          done=record_latex_file))
+        tasks.append(task(f'fix-latex:{latex_file.stem}', fix_lecture_file, [latex_file],
+                          inputs=[latex_file], outputs=[latex_file], code=fixer_code, keep=keep,
+                          done=md_to_latex_converter.record_output))
+
+    md_files = [lecture_manifest.source_path(lecture) for lecture in lectures]
+    tasks.append(task('search-index', update_search_index, inputs=md_files + [lecture_manifest.LECTURES_FILE],
+                      outputs=[search_index.INDEX_FILE], code=source_hash(search_index)))
+    tasks.append(task('complete-notes', build_complete_notes, inputs=md_files + [lecture_manifest.LECTURES_FILE],
+                      outputs=[complete_notes.BOOK_FILE], code=template_code + source_hash(complete_notes)))
+    fingerprints = ROOT_DIR / 'assets' / 'fingerprints.json'
+    tasks.append(task('index-page', lecture_manifest.update_index_page,
+                      inputs=[lecture_manifest.LECTURES_FILE, fingerprints, lecture_manifest.INDEX_FILE],
+                      outputs=[lecture_manifest.INDEX_FILE], code=source_hash(lecture_manifest)))
+    pages = [t['outputs'][0] for t in tasks if t['name'].startswith('html:')]
+    generated = pages + [complete_notes.BOOK_FILE, lecture_manifest.INDEX_FILE, search_index.INDEX_FILE]
+    tasks.append(task('service-worker', service_worker.write_service_worker,
+                      inputs=list(dict.fromkeys(generated + service_worker.source_files() + [fingerprints])),
+                      outputs=[service_worker.SERVICE_WORKER_FILE], code=source_hash(service_worker)))
+    images = sorted(path for path in (md_to_latex_converter.LATEX_DIR / 'img').glob('**/*') if path.is_file())
+    tasks.append(task('pdf', build_pdf.build_notes_pdf, [jobs],
+                      inputs=[build_pdf.MAIN_TEX] + latex_files + images, outputs=[build_pdf.OUTPUT_PDF],
+                      code=source_hash(build_pdf), pool=False, missing=build_pdf.missing_tools()))
+    return tasks
+
+
+def link(tasks):
+    """
+    Work out each task's dependencies from the files it reads.
+
+    A task depends on the last task declared before it that writes one of
+    its inputs, so a fixer that rewrites a file in place sits between the
+    task that wrote the file and the tasks that read it. Returns
+    {name: set of dependency names}.
+    """
+    producers = {}
+    deps = {}
+    for t in tasks:
+        deps[t['name']] = {producers[path] for path in t['inputs'] if path in producers}
+        for path in t['outputs']:
+            producers[path] = t['name']
+    return deps
+
+
+def waves(tasks, deps):
+    """Group the tasks into waves that only depend on earlier waves."""
+    remaining = [t['name'] for t in tasks]
+    done = set()
+    result = []
+    while remaining:
+        wave = [name for name in remaining if deps[name] <= done]
+        if not wave:
+            raise ValueError(f"Dependency cycle between {', '.join(remaining)}")
+        result.append(wave)
+        done.update(wave)
+        remaining = [name for name in remaining if name not in done]
+    return result
+
+
+def select(tasks, deps, targets):
+    """The named tasks (or every task of a kind, e.g. 'html') and everything they depend on."""
+    names = {t['name'] for t in tasks}
+    wanted = set()
+    for target in targets:
+        matches = {name for name in names if name == target or name.split(':', 1)[0] == target}
+        if not matches:
+            raise ValueError(f"Unknown task: {target}")
+        wanted |= matches
+    pending = list(wanted)
+    while pending:
+        for dep in deps[pending.pop()] - wanted:
+            wanted.add(dep)
+            pending.append(dep)
+    return [t for t in tasks if t['name'] in wanted]
+
+
+# ---------------------------------------------------------------- executor
+
+def file_hash(path, hashes):
+    if path not in hashes:
+        try:
+            hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            hashes[path] = 'missing'
+    return hashes[path]
+
+
+def task_key(t, hashes):
+    """Hash of a task's code and the content of everything it reads."""
+    h = hashlib.sha256(f"{t['name']}\0{t['code']}\0".encode('utf-8'))
+    for path in t['inputs']:
+        h.update(f'{path}\0{file_hash(path, hashes)}\0'.encode('utf-8'))
+    return h.hexdigest()
+
+
+def run_task(item):
+    """Run one task's action; returns an error message or None. Runs in a worker process with --jobs."""
+    name, action, args = item
+    with build_trace.span(name, 'graph'):
+        try:
+            action(*args)
+        except (Exception, SystemExit) as e:
+            return f'{type(e).__name__}: {e}'
+    return None
+
+
+def run_graph(tasks, deps, jobs=1, force=False, dry_run=False):
+    """
+    Run the dirty tasks wave by wave; returns (ran, up to date, failed, skipped) task names.
+
+    Tasks after a failed or skipped task are skipped too.
+    """
+    by_name = {t['name']: t for t in tasks}
+    state = load_manifest(STATE_FILE)
+    hashes = {}
+    ran, fresh, failed, skipped = [], [], [], []
+    for wave in waves(tasks, deps):
+        dirty = []
+        for name in wave:
+            t = by_name[name]
+            if deps[name] & set(failed + skipped) or t['missing']:
+                if t['missing']:
+                    print(f"⚠️  Skipping {name}: {t['missing']}")
+                skipped.append(name)
+                continue
+            key = task_key(t, hashes)
+            record = state.get(name)
+            outputs_exist = all(path.exists() for path in t['outputs'])
+            if not (force or record is None or record.get('key') != key or not outputs_exist):
+                fresh.append(name)
+                continue
+            reason = t['keep']() if t['keep'] and not force else None
+            if reason:
+                # Reported once per change of the inputs
+                print(f"⚠️  Keeping {name}: {reason}")
+                state[name] = {'key': key}
+                fresh.append(name)
+            else:
+                dirty.append(t)
+        if not dirty:
+            continue
+
+        for t in dirty:
+            print(f"{'Would run' if dry_run else '▶'} {t['name']}")
+        if dry_run:
+            # Assume the dirty tasks change their outputs, so everything after them is dirty too
+            ran += [t['name'] for t in dirty]
+            for t in dirty:
+                state.pop(t['name'], None)
+                for path in t['outputs']:
+                    hashes[path] = f"rebuilt by {t['name']}"
+            continue
+
+        pooled = [t for t in dirty if t['pool']]
+        errors = dict(zip([t['name'] for t in pooled],
+                          map_ordered(run_task, [(t['name'], t['action'], t['args']) for t in pooled], jobs)))
+        for t in dirty:
+            if not t['pool']:
+                errors[t['name']] = run_task((t['name'], t['action'], t['args']))
+
+        for t in dirty:
+            for path in t['outputs']:
+                hashes.pop(path, None)
+            if errors[t['name']]:
+                print(f"❌ {t['name']} failed: {errors[t['name']]}")
+                failed.append(t['name'])
+                state.pop(t['name'], None)
+            else:
+                # Fixers rewrite their own input, so record the key of what they left behind
+                state[t['name']] = {'key': task_key(t, hashes)}
+                ran.append(t['name'])
+                if t['done']:
+                    t['done'](*t['args'])
+        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        save_manifest(STATE_FILE, state)
+
+    if not dry_run and state != load_manifest(STATE_FILE):
+        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        save_manifest(STATE_FILE, state)
+    return ran, fresh, failed, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the out-of-date parts of the site as a dependency graph.')
+    parser.add_argument('targets', nargs='*', help='tasks or kinds of task to build (default: everything)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='run independent tasks in N worker processes (0 = one per CPU)')
+    parser.add_argument('--force', action='store_true', help='run every selected task even if it is up to date')
+    parser.add_argument('--dry-run', '-n', action='store_true', help='list the tasks that would run and stop')
+    args = parser.parse_args(argv)
+
+    tasks = lecture_tasks(args.jobs)
+    deps = link(tasks)
+    if args.targets:
+        try:
+            tasks = select(tasks, deps, args.targets)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 2
+
+    ran, fresh, failed, skipped = run_graph(tasks, deps, args.jobs, args.force, args.dry_run)
+    if args.dry_run:
+        print(f"\n{len(ran)} of {len(tasks)} tasks would run")
+        return 0
+    if failed:
+        print(f"\n❌ {len(failed)} task(s) failed, {len(ran)} ran, {len(skipped)} skipped")
+        return 1
+    if ran:
+        print(f"\n✅ Ran {len(ran)} of {len(tasks)} tasks ({len(fresh)} up to date"
+              f"{f', {len(skipped)} skipped' if skipped else ''})")
+    else:
+        print(f"\n✅ All {len(fresh)} tasks are up to date"
+              f"{f' ({len(skipped)} skipped)' if skipped else ''}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Per-stage build tracing.
+
+Set BUILD_TRACE to a file name to trace any of the build scripts:
+
+    BUILD_TRACE=build-trace.json python scripts/convert_lectures.py
+
+The scripts mark their stages with span():
+
+    with build_trace.span('render page', 'html', lecture='lecture-02'):
+        ...
+
+Each span records its wall time, CPU time (including child processes such
+as pdflatex) and the tracemalloc high-water mark above the memory in use
+when it started. When the script exits, the spans are written to the
+BUILD_TRACE file as Chrome trace-event JSON, which chrome://tracing and
+https://ui.perfetto.dev open as a timeline, and a summary of the time per
+stage and the slowest individual spans is printed. Spans recorded in
+--jobs worker processes are passed back by build_pool.map_ordered() and
+show up as one track per worker.
+
+Without BUILD_TRACE, span() does nothing and tracemalloc stays off.
+Spans must be entered and left on the thread that started the build.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+TRACE_ENV = 'BUILD_TRACE'
+# Set by the process that writes the trace, so worker processes only record
+OWNER_ENV = 'BUILD_TRACE_OWNER'
+SLOWEST_SPANS = 10
+
+# Complete ('X') trace events recorded in this process
+EVENTS = []
+_stack = []
+_state = {'enabled': False, 'owner': None}
+
+
+def enabled():
+    return _state['enabled']
+
+
+def enable(trace_file=None):
+    """Start recording spans; with trace_file, write the trace and a summary at exit."""
+    if not _state['enabled']:
+        _state['enabled'] = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+    if trace_file and _state['owner'] is None:
+        _state['owner'] = os.getpid()
+        os.environ[TRACE_ENV] = str(trace_file)
+        os.environ[OWNER_ENV] = str(os.getpid())
+        atexit.register(finish, trace_file)
+
+
+def cpu_time_ns():
+    """CPU time of this process and of the child processes it has waited for."""
+    times = os.times()
+    return time.process_time_ns() + int((times.children_user + times.children_system) * 1e9)
+
+
+@contextmanager
+def span(name, category='build', **args):
+    """Record the block as one trace event; args are shown with it in the trace viewer."""
+    if not _state['enabled']:
+        yield
+        return
+    current, peak = tracemalloc.get_traced_memory()
+    if _stack:
+        _stack[-1]['peak'] = max(_stack[-1]['peak'], peak)
+    tracemalloc.reset_peak()
+    frame = {'peak': current}
+    _stack.append(frame)
+    start, cpu_start = time.perf_counter_ns(), cpu_time_ns()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter_ns() - start
+        cpu = cpu_time_ns() - cpu_start
+        _stack.pop()
+        # The peak counter was reset for this span, so hand its high-water mark to the enclosing one
+        peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+        if _stack:
+            _stack[-1]['peak'] = max(_stack[-1]['peak'], peak)
+        EVENTS.append({
+            'name': name, 'cat': category, 'ph': 'X',
+            'ts': start // 1000, 'dur': wall // 1000,
+            'pid': os.getpid(), 'tid': threading.get_native_id(),
+            'args': dict(args, cpu_ms=round(cpu / 1e6, 3), peak_kb=round((peak - current) / 1024, 1)),
+        })
+
+
+def mark():
+    """Position in EVENTS, for collecting the events a piece of work records (see events_since)."""
+    return len(EVENTS)
+
+
+def events_since(position):
+    """Remove and return the events recorded after mark() returned position."""
+    events = EVENTS[position:]
+    del EVENTS[position:]
+    return events
+
+
+def add_events(events):
+    EVENTS.extend(events)
+
+
+def write_trace(trace_file, events=None):
+    """Write events as Chrome trace-event JSON, naming the build and worker processes."""
+    events = EVENTS if events is None else events
+    metadata = [{'name': 'process_name', 'ph': 'M', 'pid': pid,
+                 'args': {'name': 'build' if pid == _state['owner'] else f'worker {pid}'}}
+                for pid in sorted({event['pid'] for event in events})]
+    tmp_file = f'{trace_file}.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, f)
+    os.replace(tmp_file, trace_file)
+
+
+def describe(event):
+    """Name of a span with its identifying args, e.g. 'render page lecture-02'."""
+    details = [str(value) for key, value in event['args'].items() if key not in ('cpu_ms', 'peak_kb')]
+    return ' '.join([event['name']] + details)
+
+
+def format_summary(events=None):
+    """Table of wall time, CPU time and peak memory per stage, then the slowest spans."""
+    events = EVENTS if events is None else events
+    stages = {}
+    for event in events:
+        stage = stages.setdefault((event['cat'], event['name']), {'count': 0, 'wall': 0, 'cpu': 0.0, 'peak': 0.0})
+        stage['count'] += 1
+        stage['wall'] += event['dur']
+        stage['cpu'] += event['args']['cpu_ms']
+        stage['peak'] = max(stage['peak'], event['args']['peak_kb'])
+
+    lines = [f"{'category':<10} {'stage':<24} {'count':>6} {'wall':>10} {'cpu':>10} {'peak mem':>10}"]
+    for (category, name), stage in sorted(stages.items(), key=lambda item: -item[1]['wall']):
+        lines.append(f"{category:<10} {name:<24} {stage['count']:>6} {stage['wall'] / 1000:>8.1f}ms "
+                     f"{stage['cpu']:>8.1f}ms {stage['peak']:>8.0f}KB")
+
+    slowest = sorted(events, key=lambda event: -event['dur'])[:SLOWEST_SPANS]
+    lines += ['', f'Slowest {len(slowest)} spans:']
+    for event in slowest:
+        lines.append(f"  {event['dur'] / 1000:>8.1f}ms  {describe(event)}")
+    return '\n'.join(lines)
+
+
+def finish(trace_file):
+    """Write the trace and print the summary (registered with atexit by enable())."""
+    if os.getpid() != _state['owner'] or not EVENTS:
+        return
+    write_trace(trace_file)
+    print(f"\n⏱️  Build trace written to {trace_file} (open it in https://ui.perfetto.dev)\n")
+    print(format_summary())
+
+
+if os.environ.get(TRACE_ENV):
+    # Worker processes inherit the variable; only the process that set it up writes the file
+    owner = os.environ.get(OWNER_ENV)
+    enable(None if owner and owner != str(os.getpid()) else os.environ[TRACE_ENV])
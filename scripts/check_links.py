@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Check every link, anchor and asset reference of the generated site.
+
+Each page (index.html, the lecture pages, the complete notes and their
+fragments) is parsed once. Every href, src, srcset, poster, data-src and
+data-fragment is then resolved against the output tree: relative URLs
+must name an existing file, and a #fragment must match an id (or a name)
+on the page it points to. This catches broken image paths, prev/next
+links to pages that do not exist and #video-lecture-NN style anchors with
+nothing behind them. Fragments of the complete notes are resolved against
+the book page they are inserted into, and its anchors include theirs.
+
+External http(s) URLs are checked concurrently with asyncio, at most
+--concurrency at a time, through a fetcher: an async function taking a
+URL and returning its HTTP status. The default sends a HEAD request (GET
+if HEAD is refused) from a thread pool; check_site() accepts any other,
+e.g. one that asks a local stand-in server. Results are cached in
+.cache/links/external.json: a URL that answered is not asked again for
+--ttl hours. Failures are not cached, so they are retried on every run.
+
+Usage:
+    python scripts/check_links.py                  # internal and external links
+    python scripts/check_links.py --no-external    # internal links only, no network
+    python scripts/check_links.py --ttl 0          # ignore the external cache
+"""
+
+import argparse
+import asyncio
+import posixpath
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote
+
+from build_cache import load_manifest, save_manifest
+from fingerprint_assets import FRAGMENT_GLOBS, split_url
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CACHE_FILE = ROOT_DIR / '.cache' / 'links' / 'external.json'
+
+PAGE_GLOBS = ['index.html', 'Lectures/html/*.html']
+URL_ATTRS = {'href', 'src', 'poster', 'data-src', 'data-fragment'}
+SKIPPED_SCHEMES = ('mailto:', 'tel:', 'javascript:', 'data:')
+# Hosts that only answer browsers, or links that exist for the browser to resolve
+SKIPPED_HOSTS = ('fonts.gstatic.com',)
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_TIMEOUT = 10
+DEFAULT_TTL_HOURS = 24
+USER_AGENT = 'Mozilla/5.0 (compatible; lecture-link-checker)'
+# Statuses that say nothing about whether the link is broken
+INCONCLUSIVE_STATUSES = {429}
+
+
+class PageParser(HTMLParser):
+    """Collect a page's anchors (ids and names) and the URLs it references, with their lines."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.anchors = set()
+        self.references = []
+
+    def handle_starttag(self, tag, attrs):
+        line = self.getpos()[0]
+        for name, value in attrs:
+            if value is None:
+                continue
+            if name == 'id' or (name == 'name' and tag == 'a'):
+                self.anchors.add(value)
+            elif name in URL_ATTRS:
+                self.references.append((line, value.strip()))
+            elif name == 'srcset':
+                for candidate in value.split(','):
+                    url = candidate.strip().split(' ', 1)[0]
+                    if url:
+                        self.references.append((line, url))
+
+    handle_startendtag = handle_starttag
+
+
+def parse_page(path):
+    """(anchors, [(line, url), ...]) of one HTML file."""
+    parser = PageParser()
+    parser.feed(path.read_text(encoding='utf-8', errors='replace'))
+    parser.close()
+    return parser.anchors, parser.references
+
+
+def collect_pages(root=ROOT_DIR):
+    """
+    Parse every page of the site once.
+
+    Returns {site path: page}, where a page has the site path its URLs are
+    relative to ('base'), its anchors and its references. Fragments are
+    relative to the page they are inserted into, which gets their anchors.
+    """
+    pages = {}
+    for pattern in PAGE_GLOBS:
+        for path in sorted(root.glob(pattern)):
+            anchors, references = parse_page(path)
+            site_path = path.relative_to(root).as_posix()
+            pages[site_path] = {'base': site_path, 'anchors': anchors, 'references': references}
+    for pattern, page_path in FRAGMENT_GLOBS.items():
+        for path in sorted(root.glob(pattern)):
+            anchors, references = parse_page(path)
+            if page_path in pages:
+                pages[page_path]['anchors'] |= anchors
+            pages[path.relative_to(root).as_posix()] = {'base': page_path, 'anchors': anchors,
+                                                        'references': references}
+    return pages
+
+
+def resolve(url, base_path, root, pages):
+    """
+    Check one internal URL from the page at base_path.
+
+    Returns an error message, or None if the target (and its anchor) exists.
+    """
+    path, rest = split_url(url)
+    fragment = rest.split('#', 1)[1] if '#' in rest else None
+    if path:
+        start = '' if path.startswith('/') else posixpath.dirname(base_path)
+        target = posixpath.normpath(posixpath.join(start, unquote(path).lstrip('/')))
+        if target == '..' or target.startswith('../'):
+            return 'points outside the site'
+        if (root / target).is_dir():
+            target = posixpath.normpath(posixpath.join(target, 'index.html'))
+        if not (root / target).is_file():
+            return 'file not found'
+    else:
+        target = base_path
+    if not fragment or not target.endswith('.html'):
+        return None
+
+    if target not in pages:
+        anchors, references = parse_page(root / target)
+        pages[target] = {'base': target, 'anchors': anchors, 'references': references, 'extra': True}
+    if unquote(fragment) not in pages[target]['anchors']:
+        return f'no element with id "{unquote(fragment)}" on {target}'
+    return None
+
+
+def check_internal(pages, root=ROOT_DIR):
+    """Resolve the internal references of every page; returns (problems, external URLs, internal count)."""
+    problems = []
+    external = {}
+    checked = 0
+    for site_path, page in list(pages.items()):
+        if page.get('extra'):
+            continue
+        for line, url in page['references']:
+            if not url or url.startswith(SKIPPED_SCHEMES):
+                continue
+            if url.startswith(('http://', 'https://', '//')):
+                url = 'https:' + url if url.startswith('//') else url
+                if not any(f'//{host}' in url for host in SKIPPED_HOSTS):
+                    external.setdefault(url, []).append((site_path, line))
+                continue
+            checked += 1
+            error = resolve(url, page['base'], root, pages)
+            if error:
+                problems.append({'page': site_path, 'line': line, 'url': url, 'message': error})
+    return problems, external, checked
+
+
+class UrllibFetcher:
+    """Default fetcher: a HEAD request (GET if HEAD is refused), run in a thread pool."""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, workers=DEFAULT_CONCURRENCY):
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def status(self, url):
+        for method in ('HEAD', 'GET'):
+            request = urllib.request.Request(url, method=method, headers={'User-Agent': USER_AGENT})
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    return response.status
+            except urllib.error.HTTPError as e:
+                if method == 'HEAD' and e.code in (403, 405, 501):
+                    continue
+                return e.code
+        return None
+
+    async def __call__(self, url):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self.status, url)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def check_external(urls, fetcher, concurrency=DEFAULT_CONCURRENCY, cache=None, ttl=DEFAULT_TTL_HOURS * 3600):
+    """
+    Check external URLs, at most concurrency at a time.
+
+    Returns {url: error message} for the broken ones and the number of
+    URLs answered from cache (which is updated in place).
+    """
+    cache = {} if cache is None else cache
+    now = time.time()
+    fresh = [url for url in urls if url in cache and now - cache[url]['checked'] < ttl]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def check(url):
+        async with semaphore:
+            try:
+                status = await fetcher(url)
+            except Exception as e:
+                return url, None, f'{type(e).__name__}: {getattr(e, "reason", e)}'
+        if status is None or status >= 400:
+            return url, status, f'HTTP {status}'
+        return url, status, None
+
+    errors = {}
+    for url, status, error in await asyncio.gather(*(check(url) for url in urls if url not in fresh)):
+        if status in INCONCLUSIVE_STATUSES:
+            continue
+        if error:
+            errors[url] = error
+            cache.pop(url, None)
+        else:
+            cache[url] = {'status': status, 'checked': now}
+    return errors, len(fresh)
+
+
+def check_site(root=ROOT_DIR, fetcher=None, concurrency=DEFAULT_CONCURRENCY, ttl=DEFAULT_TTL_HOURS * 3600,
+               external=True, cache_file=CACHE_FILE):
+    """
+    Check the whole site; returns (problems, summary).
+
+    fetcher is an async function url -> HTTP status (see UrllibFetcher);
+    with external=False no external URL is checked.
+    """
+    pages = collect_pages(root)
+    problems, urls, internal_count = check_internal(pages, root)
+    summary = {'pages': len(pages), 'internal': internal_count, 'external': len(urls), 'cached': 0}
+    if not external or not urls:
+        summary['external'] = 0
+        return problems, summary
+
+    cache = load_manifest(cache_file)
+    own_fetcher = fetcher is None
+    fetcher = UrllibFetcher(workers=concurrency) if own_fetcher else fetcher
+    try:
+        errors, summary['cached'] = asyncio.run(check_external(sorted(urls), fetcher, concurrency, cache, ttl))
+    finally:
+        if own_fetcher:
+            fetcher.close()
+    save_manifest(cache_file, cache)
+    for url, error in sorted(errors.items()):
+        for page, line in urls[url]:
+            problems.append({'page': page, 'line': line, 'url': url, 'message': error})
+    return problems, summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check the links, anchors and assets of the generated site.')
+    parser.add_argument('--no-external', action='store_true', help='only check links within the site')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, metavar='N',
+                        help=f'external URLs checked at once (default {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--ttl', type=float, default=DEFAULT_TTL_HOURS, metavar='HOURS',
+                        help=f'how long a working external URL is trusted (default {DEFAULT_TTL_HOURS})')
+    parser.add_argument('--root', type=Path, default=ROOT_DIR, help='site tree to check (default: the repository)')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    problems, summary = check_site(args.root.resolve(), concurrency=max(1, args.concurrency),
+                                   ttl=args.ttl * 3600, external=not args.no_external)
+    elapsed = time.perf_counter() - start
+
+    for problem in sorted(problems, key=lambda p: (p['page'], p['line'], p['url'])):
+        print(f"❌ {problem['page']}:{problem['line']}: {problem['url']}: {problem['message']}")
+    external = (f", {summary['external']} external URLs ({summary['cached']} from cache)"
+                if summary['external'] else '')
+    counts = f"{summary['internal']} internal links{external} in {summary['pages']} pages ({elapsed:.1f}s)"
+    if problems:
+        print(f"\n❌ {len(problems)} broken links: checked {counts}")
+        return 1
+    print(f"✅ Checked {counts}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Build the complete notes as one HTML book: every lecture on a single page.
+
+Lectures/html/complete-notes.html has a generated table of contents (each
+lecture and its sections) followed by every lecture. Only the first
+lecture's notes are in the page itself; the others are written as
+fragments to Lectures/html/notes/<slug>.html, and
+assets/js/complete-notes.js fetches each one as it approaches the viewport
+(IntersectionObserver) or when a contents link points into it. The first
+download is therefore about the size of one lecture page, and without
+JavaScript each lecture links to its own page instead.
+
+Math is pre-rendered and code highlighted exactly as on the lecture pages,
+and every image loads lazily. convert_lectures.py rebuilds the book when
+any lecture or the page template changed; fragments whose content is
+unchanged are not rewritten.
+
+Usage:
+    python scripts/complete_notes.py          # rebuild if anything changed
+    python scripts/complete_notes.py --force  # rebuild regardless
+"""
+
+import argparse
+import hashlib
+import inspect
+import os
+import re
+from pathlib import Path
+
+import build_trace
+import convert_lectures
+import fingerprint_assets
+import image_pipeline
+import lecture_manifest
+import markdown_engine
+import math_prerender
+import page_optimizer
+import service_worker
+import syntax_highlight
+import vendor_assets
+from build_cache import load_manifest, save_manifest
+from document_cache import load_document
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+HTML_DIR = ROOT_DIR / 'Lectures' / 'html'
+BOOK_FILE = HTML_DIR / 'complete-notes.html'
+FRAGMENT_DIR = HTML_DIR / 'notes'
+MANIFEST_FILE = ROOT_DIR / '.cache' / 'book' / 'manifest.json'
+BOOK_PATH = 'Lectures/html/complete-notes.html'
+
+# Lectures whose notes are part of the page itself; the rest are fetched
+INLINE_LECTURES = 1
+# Headings that get an id, and the deepest level listed in the table of contents
+ANCHOR_LEVELS = 3
+TOC_LEVEL = 2
+
+
+def heading_slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'section'
+
+
+class BookRenderer(markdown_engine.HtmlRenderer):
+    """
+    Lecture renderer that gives headings ids unique within the book
+    (<lecture slug>-<heading slug>) and records the table of contents.
+    """
+
+    def __init__(self, prefix, image_hook=None, math_hook=None, code_hook=None):
+        super().__init__(image_hook, math_hook, code_hook)
+        self.prefix = prefix
+        self.toc = []
+        self.seen = set()
+
+    def render_heading(self, node):
+        html = super().render_heading(node)
+        level = node['level']
+        if level > ANCHOR_LEVELS:
+            return html
+        text = markdown_engine.inline_text(node['children'])
+        anchor = base = f'{self.prefix}-{heading_slug(text)}'
+        n = 2
+        while anchor in self.seen:
+            anchor, n = f'{base}-{n}', n + 1
+        self.seen.add(anchor)
+        if level <= TOC_LEVEL:
+            self.toc.append((anchor, text))
+        return html.replace(f'<h{level}>', f'<h{level} id="{anchor}">', 1)
+
+
+def render_lecture(job, doc):
+    """Render one lecture's notes; returns (html, toc, math mode)."""
+    expressions = math_prerender.document_math(doc)
+    rendered_math = math_prerender.prerender(expressions)
+    renderer = BookRenderer(job['slug'],
+                            image_hook=image_pipeline.load_picture_rewriter(),
+                            math_hook=math_prerender.make_math_hook(rendered_math),
+                            code_hook=syntax_highlight.highlight)
+    html = renderer.render(convert_lectures.without_title_heading(doc))
+    return html, renderer.toc, math_prerender.math_mode(expressions, rendered_math)
+
+
+def combined_math_mode(modes):
+    """The KaTeX loading the book needs: runtime if any lecture needs it."""
+    modes = {mode for mode in modes if mode}
+    if not modes:
+        return None
+    return 'runtime' if 'runtime' in modes else 'static'
+
+
+def render_toc(lectures):
+    lines = ['<nav class="book-toc" aria-label="Contents">', '<h2>Contents</h2>', '<ol>']
+    for job, toc in lectures:
+        lines.append(f'<li><details><summary><a href="#{job["slug"]}">{lecture_manifest.escape_text(job["title"])}</a>'
+                     f'</summary>')
+        lines.append('<ol>')
+        lines += [f'<li><a href="#{anchor}">{lecture_manifest.escape_text(text)}</a></li>' for anchor, text in toc]
+        lines.append('</ol></details></li>')
+    lines.append('</ol>')
+    lines.append('<button type="button" class="btn btn-secondary book-load-all" hidden>'
+                 'Load every lecture (to print or read offline)</button>')
+    lines.append('</nav>')
+    return '\n'.join(lines)
+
+
+def iter_book_html(toc_html, sections, head_assets):
+    """Yield the book page: the template around the table of contents and the lecture sections."""
+    yield f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Complete Notes - Lectures on Computer Architecture</title>
+    <link rel="stylesheet" href="../../assets/css/style.css">
+{head_assets}
+    <script src="../../assets/js/complete-notes.js" defer></script>
+</head>
+<body>
+    <header class="lecture-header">
+        <div class="container">
+            <a href="../../index.html" class="back-link">
+                <svg width="20" height="20" aria-hidden="true"><use href="../../assets/icons.svg#icon-back"></use></svg>
+                Back to All Lectures
+            </a>
+            <h1 class="lecture-title">Complete Notes</h1>
+            <p class="lecture-meta">Lectures on Computer Architecture</p>
+        </div>
+    </header>
+
+    <main class="lecture-content-area container">
+        <div class="content-body">
+{toc_html}
+'''
+    yield from sections
+    yield f'''
+        </div>
+    </main>
+
+    <footer>
+        <div class="container">
+            <p>&copy; 2025 CO224 Computer Architecture Lecture Series. All rights reserved.</p>
+            <p>Department of Computer Engineering, University of Peradeniya</p>
+        </div>
+    </footer>
+    {service_worker.registration_script('../../sw.js')}
+</body>
+</html>
+'''
+
+
+def render_section(job, body_html=None):
+    """A lecture's section of the book, with its notes inline or as a placeholder for the fragment."""
+    title = lecture_manifest.escape_text(job['title'])
+    if body_html is None:
+        body = (f'<div class="book-lecture-body" data-fragment="notes/{job["slug"]}.html">\n'
+                f'<p class="book-loading"><a href="{job["slug"]}.html">Read {title}</a></p>\n</div>')
+    else:
+        body = f'<div class="book-lecture-body">\n{body_html}</div>'
+    return (f'\n<section class="book-lecture" id="{job["slug"]}">\n'
+            f'<h2 class="book-lecture-title">{title}</h2>\n'
+            f'<p class="book-lecture-links"><a href="{job["slug"]}.html">Lecture page and video</a></p>\n'
+            f'{body}\n</section>\n')
+
+
+def fragment_html(html, fingerprints):
+    """Minified fragment with asset URLs relative to the book page, which it is inserted into."""
+    return fingerprint_assets.rewrite_references(page_optimizer.minify_html(html), BOOK_PATH, fingerprints)
+
+
+def write_if_changed(path, text):
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except OSError:
+        pass
+    tmp_file = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    tmp_file.write_text(text, encoding='utf-8')
+    os.replace(tmp_file, path)
+    return True
+
+
+def get_book_key(jobs):
+    """Hash of everything the book depends on: each lecture, the page template and this module."""
+    h = hashlib.sha256()
+    h.update(convert_lectures.get_template_hash().encode('utf-8'))
+    h.update(inspect.getsource(inspect.getmodule(get_book_key)).encode('utf-8'))
+    for job in jobs:
+        h.update(hashlib.sha256(job['md_bytes']).digest())
+        h.update(f'\0{job["slug"]}\0{job["title"]}\0'.encode('utf-8'))
+    return h.hexdigest()
+
+
+def build_book(jobs, force=False):
+    """
+    Write the book page and its fragments if any input changed.
+
+    jobs are convert_lectures lecture jobs, in lecture order. Returns the
+    number of files written, or None if the book was up to date.
+    """
+    key = get_book_key(jobs)
+    manifest = load_manifest(MANIFEST_FILE)
+    if not force and manifest.get('key') == key and BOOK_FILE.exists():
+        return None
+
+    FRAGMENT_DIR.mkdir(parents=True, exist_ok=True)
+    fingerprints = fingerprint_assets.load_manifest()
+    toc, inline, modes = [], [], []
+    written = 0
+    # One lecture at a time: fragments go straight to disk, and of the HTML only the inline
+    # lectures are kept (document_cache still holds each lecture's parsed tree)
+    for i, job in enumerate(jobs):
+        with build_trace.span('render lecture', 'book', lecture=job['slug']):
+            doc = load_document(job['source'], job['md_bytes'])
+            html, lecture_toc, mode = render_lecture(job, doc)
+        toc.append((job, lecture_toc))
+        modes.append(mode)
+        if i < INLINE_LECTURES:
+            inline.append(html)
+        else:
+            written += write_if_changed(FRAGMENT_DIR / f'{job["slug"]}.html', fragment_html(html, fingerprints))
+
+    # Fragments of lectures that no longer exist
+    slugs = {job['slug'] for job in jobs[INLINE_LECTURES:]}
+    for path in FRAGMENT_DIR.glob('*.html'):
+        if path.stem not in slugs:
+            path.unlink()
+
+    sections = (render_section(job, inline[i] if i < INLINE_LECTURES else None) for i, job in enumerate(jobs))
+    head_assets = vendor_assets.head_assets(combined_math_mode(modes))
+    chunks = page_optimizer.iter_optimized_page(iter_book_html(render_toc(toc), sections, head_assets))
+    with build_trace.span('write book page', 'book'):
+        convert_lectures.write_page(BOOK_FILE, (fingerprint_assets.rewrite_references(chunk, BOOK_PATH, fingerprints)
+                                                for chunk in chunks))
+    written += 1
+
+    MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    save_manifest(MANIFEST_FILE, {'key': key})
+    return written
+
+
+def lecture_jobs():
+    """convert_lectures jobs for every lecture of the manifest, read from disk."""
+    lectures = lecture_manifest.load_lectures()
+    jobs = []
+    for i, lecture in enumerate(lectures):
+        with open(lecture_manifest.source_path(lecture), 'rb') as f:
+            jobs.append(convert_lectures.make_lecture_job(lectures, i, f.read()))
+    return jobs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the single-page complete notes.')
+    parser.add_argument('--force', action='store_true', help='rebuild even if nothing changed')
+    args = parser.parse_args(argv)
+
+    written = build_book(lecture_jobs(), args.force)
+    if written is None:
+        print(f"✅ {BOOK_FILE.name} is up to date")
+    else:
+        size = BOOK_FILE.stat().st_size
+        print(f"📖 Wrote {BOOK_FILE.name} ({size / 1024:.0f} KB) and {written - 1} changed lecture fragments")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Write precompressed .gz and .br siblings for the site's text files.
+
+Every HTML page, stylesheet, script, JSON file, SVG and search shard gets
+a gzip (level 9) and a brotli (quality 11) copy next to it, e.g.
+Lectures/html/lecture-02.html.gz and lecture-02.html.br, so a server can
+send them as-is instead of compressing on every request. preview_server.py
+serves them with Content-Encoding when the browser accepts them.
+
+A variant is only kept when it is smaller than the original.
+.cache/compress/manifest.json records a hash of each source, so files that
+have not changed since the last run are skipped, and siblings of deleted
+files are removed.
+
+brotli is optional: without it only the .gz files are written.
+
+Usage:
+    python scripts/compress_assets.py          # compress new and changed files
+    python scripts/compress_assets.py --force  # recompress everything
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+import build_trace
+from build_cache import load_manifest, save_manifest
+from build_pool import map_ordered
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MANIFEST_FILE = ROOT_DIR / '.cache' / 'compress' / 'manifest.json'
+
+# What gets compressed: the pages and everything text-like under assets/
+SITE_GLOBS = ['*.html', 'sw.js', 'Lectures/html/*.html', 'Lectures/html/notes/*.html', 'assets/**/*']
+TEXT_SUFFIXES = {'.html', '.css', '.js', '.mjs', '.json', '.svg', '.xml', '.txt', '.map', '.bin'}
+# Below this the compression framing outweighs any saving
+MIN_SIZE = 256
+
+# Content-Encoding token -> file suffix, in order of preference
+ENCODINGS = {'br': '.br', 'gzip': '.gz'}
+
+
+def available_encodings():
+    return [encoding for encoding in ENCODINGS if encoding != 'br' or brotli is not None]
+
+
+def compress(data, encoding):
+    """Compress bytes at maximum compression; gzip output is reproducible (mtime 0)."""
+    if encoding == 'br':
+        return brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def is_compressible(path):
+    return Path(path).suffix.lower() in TEXT_SUFFIXES
+
+
+def collect_files(root=ROOT_DIR):
+    """Site files that should have compressed siblings, as paths relative to root."""
+    files = set()
+    for pattern in SITE_GLOBS:
+        for path in root.glob(pattern):
+            if path.is_file() and is_compressible(path):
+                files.add(path.relative_to(root).as_posix())
+    return sorted(files)
+
+
+def compress_file(job):
+    """Write the compressed siblings of one file; runs in a worker process with --jobs."""
+    path = ROOT_DIR / job['path']
+    data = path.read_bytes()
+    written = {}
+    with build_trace.span('compress file', 'deploy', file=job['path']):
+        for encoding in job['encodings']:
+            sibling = path.with_name(path.name + ENCODINGS[encoding])
+            compressed = compress(data, encoding) if len(data) >= MIN_SIZE else None
+            if compressed is None or len(compressed) >= len(data):
+                sibling.unlink(missing_ok=True)
+                continue
+            tmp_file = sibling.with_name(f'{sibling.name}.{os.getpid()}.tmp')
+            tmp_file.write_bytes(compressed)
+            os.replace(tmp_file, sibling)
+            written[encoding] = len(compressed)
+    return job['path'], len(data), written
+
+
+def remove_siblings(rel_path):
+    path = ROOT_DIR / rel_path
+    for suffix in ENCODINGS.values():
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def siblings_present(rel_path, encodings):
+    path = ROOT_DIR / rel_path
+    return all(path.with_name(path.name + ENCODINGS[encoding]).exists() for encoding in encodings)
+
+
+def refresh_siblings(rel_path, encodings):
+    """
+    Keep unchanged siblings at least as new as their source.
+
+    preview_server.py ignores siblings older than the file, so a file that
+    was rewritten with the same bytes would otherwise be served uncompressed.
+    """
+    path = ROOT_DIR / rel_path
+    source_mtime = path.stat().st_mtime_ns
+    for encoding in encodings:
+        sibling = path.with_name(path.name + ENCODINGS[encoding])
+        if sibling.stat().st_mtime_ns < source_mtime:
+            os.utime(sibling, ns=(source_mtime, source_mtime))
+
+
+def compress_site(force=False, jobs=1):
+    """
+    Bring every compressed sibling up to date.
+
+    Returns (compressed, skipped, original_bytes, compressed_bytes) where the
+    byte counts cover the files compressed in this run (best variant each).
+    """
+    manifest = {} if force else load_manifest(MANIFEST_FILE)
+    encodings = available_encodings()
+    new_manifest = {}
+    pending = []
+    for rel_path in collect_files():
+        key = hashlib.sha256((ROOT_DIR / rel_path).read_bytes()).hexdigest()
+        previous = manifest.get(rel_path)
+        if (previous and previous.get('key') == key and set(previous.get('requested', [])) == set(encodings)
+                and siblings_present(rel_path, previous.get('encodings', []))):
+            refresh_siblings(rel_path, previous['encodings'])
+            new_manifest[rel_path] = previous
+            continue
+        new_manifest[rel_path] = {'key': key, 'requested': encodings}
+        pending.append({'path': rel_path, 'encodings': encodings})
+
+    # Siblings of files that no longer exist
+    for rel_path in manifest.keys() - new_manifest.keys():
+        remove_siblings(rel_path)
+
+    original_bytes = compressed_bytes = 0
+    for rel_path, size, written in map_ordered(compress_file, pending, jobs):
+        new_manifest[rel_path]['encodings'] = sorted(written)
+        original_bytes += size
+        compressed_bytes += min(written.values(), default=size)
+
+    if new_manifest != manifest:
+        MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+        save_manifest(MANIFEST_FILE, new_manifest)
+    return len(pending), len(new_manifest) - len(pending), original_bytes, compressed_bytes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write .gz and .br siblings for the site\'s text files.')
+    parser.add_argument('--force', action='store_true', help='recompress every file')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='compress in N worker processes (0 = one per CPU)')
+    args = parser.parse_args(argv)
+
+    if brotli is None:
+        print("⚠️  brotli not installed; writing .gz files only")
+
+    compressed, skipped, original_bytes, compressed_bytes = compress_site(args.force, args.jobs)
+    if compressed:
+        print(f"📦 Compressed {compressed} files ({skipped} unchanged): "
+              f"{original_bytes / 1024:.0f} KB -> {compressed_bytes / 1024:.0f} KB")
+    else:
+        print(f"✅ All {skipped} compressed files are up to date")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,84 +1,74 @@
+import argparse
+import hashlib
+import inspect
 import os
-import re
 from pathlib import Path
 
+import build_trace
+import complete_notes
+import image_pipeline
+import lecture_manifest
+import markdown_engine
+import math_prerender
+import page_optimizer
+import search_index
+import service_worker
+import syntax_highlight
+import vendor_assets
+from build_cache import load_manifest, save_manifest
+from build_pool import map_ordered
+import document_cache
+import fingerprint_assets
+from document_cache import load_document
+
+# Build manifest recording the inputs each generated page was built from
+MANIFEST_FILE = Path('Lectures/html/.build-manifest.json')
+
+# Where the lecture content goes in the page template
+CONTENT_MARKER = '<!-- lecture content -->'
+
 def convert_markdown_to_html(md_content):
     """Convert markdown content to HTML"""
-    html = md_content
-    
+    return convert_document_to_html(markdown_engine.parse_markdown(md_content))
+
+def convert_document_to_html(doc, rendered_math=None):
+    """Render a parsed lecture document to HTML"""
+    return ''.join(iter_document_html(doc, rendered_math))
+
+def iter_document_html(doc, rendered_math=None):
+    """Render a parsed lecture document to HTML, one top-level block at a time"""
     # Remove the first H1 heading (which duplicates the lecture title)
     # This removes lines like "# Lecture 1: Computer Abstractions and Technology"
-    html = re.sub(r'^# .*?\n', '', html, count=1, flags=re.MULTILINE)
-    
-    # Convert headers
-    html = re.sub(r'^# (.*?)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-    html = re.sub(r'^#### (.*?)$', r'<h4>\1</h4>', html, flags=re.MULTILINE)
-    
-    # Convert bold and italic
-    html = re.sub(r'\*\*\*(.*?)\*\*\*', r'<strong><em>\1</em></strong>', html)
-    html = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', html)
-    html = re.sub(r'\*(.*?)\*', r'<em>\1</em>', html)
-    html = re.sub(r'_(.*?)_', r'<em>\1</em>', html)
-    
-    # Convert inline code
-    html = re.sub(r'`([^`]+)`', r'<code>\1</code>', html)
-    
-    # Convert images
-    html = re.sub(r'<img src="img/', r'<img src="../img/', html)
-    html = re.sub(r'!\[(.*?)\]\((.*?)\)', r'<img src="\2" alt="\1" style="max-width: 100%;">', html)
-    
-    # Convert links
-    html = re.sub(r'\[(.*?)\]\((.*?)\)', r'<a href="\2">\1</a>', html)
-    
-    # Convert unordered lists
-    lines = html.split('\n')
-    in_ul = False
-    result_lines = []
-    
-    for line in lines:
-        if re.match(r'^- ', line):
-            if not in_ul:
-                result_lines.append('<ul>')
-                in_ul = True
-            result_lines.append('<li>' + line[2:] + '</li>')
-        else:
-            if in_ul:
-                result_lines.append('</ul>')
-                in_ul = False
-            result_lines.append(line)
-    
-    if in_ul:
-        result_lines.append('</ul>')
-    
-    html = '\n'.join(result_lines)
-    
-    # Convert paragraphs (lines that aren't already HTML tags)
-    lines = html.split('\n')
-    result_lines = []
-    for line in lines:
-        line = line.strip()
-        if line and not line.startswith('<') and not line.endswith('>'):
-            result_lines.append(f'<p>{line}</p>')
-        else:
-            result_lines.append(line)
-    
-    return '\n'.join(result_lines)
+    # Images with generated variants become responsive <picture> elements,
+    # math pre-rendered by KaTeX is inlined as static HTML, and code blocks
+    # are syntax-highlighted here instead of by Prism in the browser
+    return markdown_engine.iter_html(without_title_heading(doc),
+                                     image_hook=image_pipeline.load_picture_rewriter(),
+                                     math_hook=math_prerender.make_math_hook(rendered_math or {}),
+                                     code_hook=syntax_highlight.highlight)
 
-def get_lecture_title(filename):
-    """Extract lecture title from filename"""
-    match = re.match(r'Lecture (\d+) - (.+)\.md', filename)
-    if match:
-        num, title = match.groups()
-        return f"Lecture {num}: {title}"
-    return filename.replace('.md', '')
+def without_title_heading(doc):
+    """Return a copy of a parsed lecture without its first H1 (the page title)"""
+    children = list(doc['children'])
+    for i, node in enumerate(children):
+        if node['type'] == 'heading' and node['level'] == 1:
+            del children[i]
+            break
+    return dict(doc, children=children)
 
-def create_lecture_html(lecture_num, title, content, prev_num=None, next_num=None):
+def create_lecture_html(lecture_num, title, content, video_id, prev_slug=None, next_slug=None, head_assets=None):
     """Create HTML page for a lecture"""
+    return ''.join(iter_lecture_html(lecture_num, title, [content], video_id, prev_slug, next_slug, head_assets))
+
+def iter_lecture_html(lecture_num, title, content_chunks, video_id, prev_slug=None, next_slug=None,
+                      head_assets=None):
+    """Yield the HTML page for a lecture: the template around the streamed content chunks"""
+    if head_assets is None:
+        head_assets = vendor_assets.head_assets()
     
-    prev_link = f'<a href="lecture-{prev_num:02d}.html" class="nav-btn">← Previous Lecture</a>' if prev_num else '<span class="nav-btn disabled">← Previous Lecture</span>'
-    next_link = f'<a href="lecture-{next_num:02d}.html" class="nav-btn">Next Lecture →</a>' if next_num else '<span class="nav-btn disabled">Next Lecture →</span>'
+    prev_link = f'<a href="{prev_slug}.html" class="nav-btn">← Previous Lecture</a>' if prev_slug else '<span class="nav-btn disabled">← Previous Lecture</span>'
+    next_link = f'<a href="{next_slug}.html" class="nav-btn">Next Lecture →</a>' if next_slug else '<span class="nav-btn disabled">Next Lecture →</span>'
+    video_url = lecture_manifest.video_url(video_id)
     
     html_template = f'''<!DOCTYPE html>
 <html lang="en">
@@ -87,16 +77,13 @@ def create_lecture_html(lecture_num, title, content, prev_num=None, next_num=Non
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title} - Lectures on Computer Architecture</title>
     <link rel="stylesheet" href="../../assets/css/style.css">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
+{head_assets}
 </head>
 <body>
     <header class="lecture-header">
         <div class="container">
             <a href="../../index.html" class="back-link">
-                <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                    <line x1="19" y1="12" x2="5" y2="12"></line>
-                    <polyline points="12 19 5 12 12 5"></polyline>
-                </svg>
+                <svg width="20" height="20" aria-hidden="true"><use href="../../assets/icons.svg#icon-back"></use></svg>
                 Back to All Lectures
             </a>
             <h1 class="lecture-title">{title}</h1>
@@ -109,31 +96,24 @@ def create_lecture_html(lecture_num, title, content, prev_num=None, next_num=Non
             <!-- Video Section -->
             <div class="video-container">
                 <div class="video-thumbnail">
-                    <a href="#video-lecture-{lecture_num:02d}" target="_blank" class="video-play-overlay">
-                        <img src="https://img.youtube.com/vi/VIDEO_ID_{lecture_num:02d}/maxresdefault.jpg" 
+                    <a href="{video_url}" target="_blank" class="video-play-overlay">
+                        <img src="{lecture_manifest.thumbnail_url(video_id)}" 
                              alt="Lecture {lecture_num} Video Thumbnail"
-                             onerror="this.src='https://img.youtube.com/vi/VIDEO_ID_{lecture_num:02d}/hqdefault.jpg'">
+                             onerror="this.src='{lecture_manifest.thumbnail_url(video_id, 'hqdefault')}'">
                         <div class="play-button">
-                            <svg width="68" height="48" viewBox="0 0 68 48" fill="none">
-                                <path d="M66.52 7.74c-.78-2.93-2.49-5.41-5.42-6.19C55.79.13 34 0 34 0S12.21.13 6.9 1.55c-2.93.78-4.63 3.26-5.42 6.19C.06 13.05 0 24 0 24s.06 10.95 1.48 16.26c.78 2.93 2.49 5.41 5.42 6.19C12.21 47.87 34 48 34 48s21.79-.13 27.1-1.55c2.93-.78 4.64-3.26 5.42-6.19C67.94 34.95 68 24 68 24s-.06-10.95-1.48-16.26z" fill="red"/>
-                                <path d="M45 24L27 14v20" fill="white"/>
-                            </svg>
+                            <svg width="68" height="48" aria-hidden="true"><use href="../../assets/icons.svg#icon-youtube-play"></use></svg>
                         </div>
                     </a>
                 </div>
                 <div class="video-info">
                     <p class="video-notice">
-                        <svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                            <circle cx="12" cy="12" r="10"></circle>
-                            <line x1="12" y1="16" x2="12" y2="12"></line>
-                            <line x1="12" y1="8" x2="12.01" y2="8"></line>
-                        </svg>
+                        <svg width="20" height="20" aria-hidden="true"><use href="../../assets/icons.svg#icon-info"></use></svg>
                         Click the thumbnail above to watch the video lecture on YouTube
                     </p>
                 </div>
             </div>
 
-            {content}
+            {CONTENT_MARKER}
             
             <div class="lecture-nav">
                 {prev_link}
@@ -148,54 +128,173 @@ def create_lecture_html(lecture_num, title, content, prev_num=None, next_num=Non
             <p>Department of Computer Engineering, University of Peradeniya</p>
         </div>
     </footer>
+    {service_worker.registration_script('../../sw.js')}
 </body>
 </html>
 '''
-    return html_template
+    header, footer = html_template.split(CONTENT_MARKER)
+    yield header
+    yield from content_chunks
+    yield footer
+
+def get_template_hash():
+    """Hash the code that shapes every page, so template edits rebuild all lectures"""
+    source = (inspect.getsource(iter_lecture_html) + inspect.getsource(iter_document_html)
+              + inspect.getsource(markdown_engine) + inspect.getsource(image_pipeline)
+              + inspect.getsource(vendor_assets) + inspect.getsource(math_prerender)
+              + inspect.getsource(syntax_highlight) + inspect.getsource(lecture_manifest)
+              + inspect.getsource(page_optimizer) + page_optimizer.stylesheet_hash()
+              + inspect.getsource(service_worker.registration_script)
+              + image_pipeline.manifest_hash() + vendor_assets.manifest_hash()
+              + math_prerender.runtime_hash() + fingerprint_assets.manifest_hash())
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+def get_build_key(md_bytes, template_hash, job):
+    """Combine everything a lecture page depends on into a single content hash"""
+    h = hashlib.sha256()
+    h.update(md_bytes)
+    h.update(f'\0{template_hash}\0{job["lecture_num"]}\0{job["title"]}\0{job["video_id"]}'
+             f'\0{job["prev_slug"]}\0{job["next_slug"]}'.encode('utf-8'))
+    return h.hexdigest()
 
-def main():
+def make_lecture_job(lectures, i, md_bytes):
+    """Describe the page for the i-th lecture of the manifest, including its prev/next links"""
+    lecture = lectures[i]
+    previous, following = lecture_manifest.neighbours(lectures, i)
+    return {
+        'source': str(lecture_manifest.source_path(lecture)),
+        'md_bytes': md_bytes,
+        'lecture_num': lecture['number'],
+        'title': lecture_manifest.page_title(lecture),
+        'slug': lecture['slug'],
+        'video_id': lecture['video_id'],
+        'prev_slug': previous['slug'] if previous else None,
+        'next_slug': following['slug'] if following else None,
+    }
+
+def lecture_page_chunks(job, doc):
+    """Yield a lecture page in pieces, from the markdown blocks through the template to the optimized HTML"""
+    expressions = math_prerender.document_math(doc)
+    rendered_math = math_prerender.prerender(expressions)
+    
+    # Link KaTeX only where there is math
+    head_assets = vendor_assets.head_assets(math_prerender.math_mode(expressions, rendered_math))
+    
+    # Wrap the rendered blocks in the page template, then inline the critical CSS, minify and
+    # point the page at fingerprinted assets as the chunks go by
+    page_chunks = iter_lecture_html(job['lecture_num'], job['title'], iter_document_html(doc, rendered_math),
+                                    job['video_id'], job['prev_slug'], job['next_slug'], head_assets)
+    page_path = f"Lectures/html/{job['slug']}.html"
+    fingerprints = fingerprint_assets.load_manifest()
+    for chunk in page_optimizer.iter_optimized_page(page_chunks):
+        yield fingerprint_assets.rewrite_references(chunk, page_path, fingerprints)
+
+def build_lecture_page(job):
+    """Render one lecture page and its search sections in memory"""
+    # The parsed document is shared with the LaTeX build
+    doc = load_document(job['source'], job['md_bytes'])
+    return ''.join(lecture_page_chunks(job, doc)), search_index.document_sections(doc, job['title'])
+
+def write_page(output_file, chunks):
+    """Write a page chunk by chunk, replacing the old file only once it is complete"""
+    tmp_file = output_file.with_name(f'{output_file.name}.{os.getpid()}.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_file, output_file)
+
+def write_lecture_page(job):
+    """Stream one lecture page to disk and return its search sections; runs in a worker process with --jobs"""
+    with build_trace.span('render page', 'html', lecture=job['slug']):
+        doc = load_document(job['source'], job['md_bytes'])
+        write_page(job['output_file'], lecture_page_chunks(job, doc))
+        return search_index.document_sections(doc, job['title'])
+
+def main(argv=None):
     """Main function to convert all lecture markdown files to HTML"""
-    lectures_dir = Path('Lectures/markdown')
+    parser = argparse.ArgumentParser(description='Convert lecture markdown files to HTML pages.')
+    parser.add_argument('--force', action='store_true',
+                        help='rebuild every page even if its inputs are unchanged')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='render lectures in N worker processes (0 = one per CPU)')
+    args = parser.parse_args(argv)
+
     output_dir = Path('Lectures/html')
     output_dir.mkdir(exist_ok=True)
     
-    # Get all lecture files and sort them numerically by lecture number
-    def get_lecture_number(filename):
-        match = re.match(r'Lecture (\d+)', filename.name)
-        return int(match.group(1)) if match else 0
+    # Lecture order, titles, videos and prev/next links all come from Lectures/lectures.json
+    lectures = lecture_manifest.load_lectures()
     
-    lecture_files = sorted([f for f in lectures_dir.glob('Lecture *.md')], key=get_lecture_number)
+    print(f"Found {len(lectures)} lectures in {lecture_manifest.LECTURES_FILE.name}")
     
-    print(f"Found {len(lecture_files)} lecture files")
+    manifest = {} if args.force else load_manifest(MANIFEST_FILE)
+    new_manifest = {}
+    template_hash = get_template_hash()
+    jobs = []
+    all_jobs = []
     
-    for i, lecture_file in enumerate(lecture_files):
-        lecture_num = i + 1
-        prev_num = i if i > 0 else None
-        next_num = i + 2 if i < len(lecture_files) - 1 else None
-        
-        print(f"Processing: {lecture_file.name}")
-        
+    for i, lecture in enumerate(lectures):
         # Read markdown content
-        with open(lecture_file, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-        
-        # Get title
-        title = get_lecture_title(lecture_file.name)
+        lecture_file = lecture_manifest.source_path(lecture)
+        with open(lecture_file, 'rb') as f:
+            md_bytes = f.read()
         
-        # Convert to HTML
-        html_content = convert_markdown_to_html(md_content)
+        job = make_lecture_job(lectures, i, md_bytes)
+        output_file = output_dir / f'{job["slug"]}.html'
         
-        # Create full HTML page
-        full_html = create_lecture_html(lecture_num, title, html_content, prev_num, next_num)
+        # Skip pages whose inputs are unchanged since the last build
+        build_key = get_build_key(md_bytes, template_hash, job)
+        new_manifest[output_file.name] = {'source': lecture_file.name, 'key': build_key}
+        all_jobs.append(job)
+        previous = manifest.get(output_file.name)
+        if previous and previous.get('key') == build_key and output_file.exists():
+            continue
         
-        # Write to file
-        output_file = output_dir / f'lecture-{lecture_num:02d}.html'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(full_html)
+        print(f"Processing: {lecture_file.name}")
+        job['output_file'] = output_file
+        jobs.append(job)
+    
+    # Render stale pages straight to disk (in parallel with --jobs); results come back in lecture order
+    pages = map_ordered(write_lecture_page, jobs, args.jobs)
+    
+    for job, sections in zip(jobs, pages):
+        job['sections'] = sections
         
-        print(f"Created: {output_file.name}")
+        print(f"Created: {job['output_file'].name}")
+    
+    # Merge the sections of rebuilt pages with the cached ones into the search index
+    with build_trace.span('update search index', 'search'):
+        search_written = search_index.update_index([
+            (job['lecture_num'], job['title'], f"Lectures/html/{job['slug']}.html",
+             job['source'], job['md_bytes'], job.get('sections'))
+            for job in all_jobs
+        ])
+    if search_written:
+        print(f"Updated search index ({search_written} files)")
+    
+    # The single-page book of every lecture, rebuilt when any of them changed
+    with build_trace.span('build complete notes', 'book'):
+        book_written = complete_notes.build_book(all_jobs, args.force)
+    if book_written:
+        print(f"Updated the complete notes ({book_written} files)")
+    
+    with build_trace.span('update index page', 'html'):
+        index_changed = lecture_manifest.update_index_page(lectures)
+    if index_changed:
+        print("Updated the lecture cards in index.html")
+    
+    # Leave the manifest untouched on a no-op rebuild so no mtimes change
+    if new_manifest != manifest:
+        save_manifest(MANIFEST_FILE, new_manifest)
     
-    print(f"\nSuccessfully created {len(lecture_files)} lecture HTML pages!")
+    built = len(jobs)
+    if built:
+        print(f"\nSuccessfully created {built} lecture HTML pages "
+              f"({len(lectures) - built} up to date)!")
+    else:
+        print("\nAll lecture HTML pages are up to date.")
+    print(document_cache.format_stats())
+    print(math_prerender.format_stats())
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,85 @@
+"""
+Shared, on-disk cache of parsed lecture documents.
+
+Every back-end (HTML and LaTeX) gets its document tree from load_document(),
+so each lecture is parsed at most once per source revision. Trees are stored
+as JSON under .cache/documents/, keyed on a hash of the markdown source and
+of the parser itself, so editing markdown_engine.py invalidates the cache.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+
+import build_trace
+import markdown_engine
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = ROOT_DIR / '.cache' / 'documents'
+
+# Hash of the parser source; part of every cache key
+PARSER_HASH = hashlib.sha256(inspect.getsource(markdown_engine).encode('utf-8')).hexdigest()
+
+# Counters for reporting how much work the cache saved
+STATS = {'parsed': 0, 'disk_hits': 0, 'memory_hits': 0}
+
+# Latest (key, tree) per source file, so a long-running watcher holds one tree per lecture
+_memory_cache = {}
+
+
+def source_hash(md_bytes):
+    """Cache key for a markdown source under the current parser."""
+    h = hashlib.sha256(PARSER_HASH.encode('ascii'))
+    h.update(md_bytes)
+    return h.hexdigest()
+
+
+def load_document(md_path, md_bytes=None):
+    """
+    Return the parsed document tree for a markdown file.
+
+    Looks in memory, then on disk, and only parses on a miss. Callers must
+    treat the returned tree as read-only since it is shared between them.
+    Pass md_bytes if the file has already been read.
+    """
+    if md_bytes is None:
+        with open(md_path, 'rb') as f:
+            md_bytes = f.read()
+    key = source_hash(md_bytes)
+    path = os.path.abspath(md_path)
+
+    cached_key, doc = _memory_cache.get(path, (None, None))
+    if cached_key == key:
+        STATS['memory_hits'] += 1
+        return doc
+
+    cache_file = CACHE_DIR / f'{key}.json'
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            doc = json.load(f)
+        STATS['disk_hits'] += 1
+    except (OSError, ValueError):
+        with build_trace.span('parse markdown', 'parse', file=os.path.basename(md_path)):
+            doc = markdown_engine.parse_markdown(md_bytes.decode('utf-8'))
+        STATS['parsed'] += 1
+        save_document(cache_file, doc)
+
+    _memory_cache[path] = (key, doc)
+    return doc
+
+
+def save_document(cache_file, doc):
+    """Write a document tree to the cache atomically."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(doc, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_file, cache_file)
+
+
+def format_stats():
+    """One-line summary of cache activity, for the end of a build."""
+    return (f"Documents: {STATS['parsed']} parsed, {STATS['disk_hits']} from disk cache, "
+            f"{STATS['memory_hits']} from memory")
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Fingerprint static assets with a content hash so they can be cached forever.
+
+Every stylesheet, script, icon sprite, font, vendored file and lecture
+image gets a copy named after its content, e.g.
+assets/css/style.css -> assets/css/style.3f2a9c1e.css, and
+assets/fingerprints.json maps each original path to its fingerprinted
+copy. Stylesheets are fingerprinted after their url() references have
+been rewritten, so a changed font or image also renames the CSS that
+uses it.
+
+References in index.html, the lecture pages and the complete notes (src,
+href, srcset and url()) are then rewritten to the fingerprinted names; convert_lectures.py
+applies the same rewrite to every page it builds once the manifest
+exists. A fingerprinted file never changes, so it can be served with
+Cache-Control: immutable (preview_server.py does) and a repeat visit
+makes no requests for unchanged assets. Copies whose source has changed
+since are removed.
+
+Usage:
+    python scripts/fingerprint_assets.py
+"""
+
+import hashlib
+import os
+import posixpath
+import re
+import shutil
+from pathlib import Path
+from urllib.parse import unquote
+
+import build_cache
+import build_trace
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MANIFEST_FILE = ROOT_DIR / 'assets' / 'fingerprints.json'
+
+ASSET_GLOBS = ['assets/css/*.css', 'assets/js/*.js', 'assets/*.svg', 'assets/vendor/**/*', 'Lectures/img/**/*']
+ASSET_SUFFIXES = {'.css', '.js', '.svg', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif',
+                  '.woff', '.woff2', '.ttf'}
+# Pages whose references are rewritten in place
+PAGE_GLOBS = ['index.html', 'Lectures/html/*.html']
+# Fragments inserted into a page, whose URLs are relative to that page
+FRAGMENT_GLOBS = {'Lectures/html/notes/*.html': 'Lectures/html/complete-notes.html'}
+
+HASH_LENGTH = 8
+HASHED_NAME_RE = re.compile(rf'\.([0-9a-f]{{{HASH_LENGTH}}})(\.[A-Za-z0-9]+)$')
+
+ATTR_RE = re.compile(r'''\b(src|href|poster|data-src)=(["'])(.*?)\2''', re.IGNORECASE | re.DOTALL)
+SRCSET_RE = re.compile(r'''\bsrcset=(["'])(.*?)\1''', re.IGNORECASE | re.DOTALL)
+CSS_URL_RE = re.compile(r'''url\(\s*(["']?)([^"')]+)\1\s*\)''')
+
+
+def load_manifest(manifest_file=MANIFEST_FILE):
+    """Original site path -> fingerprinted site path, or {} before the first run."""
+    return build_cache.load_manifest(manifest_file).get('files', {})
+
+
+def manifest_hash(manifest_file=MANIFEST_FILE):
+    """Hash of the manifest, so page builds notice renamed assets."""
+    try:
+        return hashlib.sha256(Path(manifest_file).read_bytes()).hexdigest()
+    except OSError:
+        return ''
+
+
+def fingerprinted_name(path, digest):
+    """'assets/css/style.css' -> 'assets/css/style.<hash>.css'"""
+    stem, suffix = posixpath.splitext(path)
+    return f'{stem}.{digest[:HASH_LENGTH]}{suffix}'
+
+
+def split_url(url):
+    """Split off the ?query and #fragment, which a rewrite keeps."""
+    cut = min((i for i in (url.find('?'), url.find('#')) if i != -1), default=len(url))
+    return url[:cut], url[cut:]
+
+
+def rewrite_url(url, base_dir, manifest):
+    """
+    The fingerprinted form of a relative URL, or the URL unchanged.
+
+    base_dir is the site path of the directory the URL is relative to.
+    URLs that already carry an older fingerprint are updated too.
+    """
+    if not url or url.startswith(('#', '/', 'data:', 'mailto:')) or '://' in url or url.startswith('//'):
+        return url
+    path, rest = split_url(url)
+    target = posixpath.normpath(posixpath.join(base_dir, unquote(path)))
+    if target not in manifest:
+        previous = HASHED_NAME_RE.sub(r'\2', target)
+        if previous == target or previous not in manifest:
+            return url
+        target, path = previous, HASHED_NAME_RE.sub(r'\2', path)
+    digest = HASHED_NAME_RE.search(manifest[target]).group(1)
+    # Only the file name changes, so percent-encoding in the rest of the URL is kept
+    stem, suffix = posixpath.splitext(path)
+    return f'{stem}.{digest}{suffix}{rest}'
+
+
+def rewrite_css_urls(css, base_dir, manifest):
+    def replace(match):
+        quote, url = match.groups()
+        return f'url({quote}{rewrite_url(url.strip(), base_dir, manifest)}{quote})'
+    return CSS_URL_RE.sub(replace, css)
+
+
+def rewrite_references(html, page_path, manifest):
+    """Point every local asset reference of a page at its fingerprinted copy."""
+    if not manifest:
+        return html
+    base_dir = posixpath.dirname(page_path)
+
+    def replace_attr(match):
+        name, quote, url = match.groups()
+        return f'{name}={quote}{rewrite_url(url, base_dir, manifest)}{quote}'
+
+    def replace_srcset(match):
+        quote, value = match.groups()
+        candidates = []
+        for candidate in value.split(','):
+            parts = candidate.strip().split(' ', 1)
+            parts[0] = rewrite_url(parts[0], base_dir, manifest)
+            candidates.append(' '.join(parts))
+        return f'srcset={quote}{", ".join(candidates)}{quote}'
+
+    html = ATTR_RE.sub(replace_attr, html)
+    html = SRCSET_RE.sub(replace_srcset, html)
+    return rewrite_css_urls(html, base_dir, manifest)
+
+
+def collect_assets(root=ROOT_DIR):
+    """Site paths of the assets to fingerprint, stylesheets last."""
+    assets = set()
+    for pattern in ASSET_GLOBS:
+        for path in root.glob(pattern):
+            if path.is_file() and path.suffix.lower() in ASSET_SUFFIXES and not HASHED_NAME_RE.search(path.name):
+                assets.add(path.relative_to(root).as_posix())
+    return sorted(assets, key=lambda path: (path.endswith('.css'), path))
+
+
+def write_copy(source, target, data=None):
+    """Write a fingerprinted copy unless it already exists (its name pins its content)."""
+    if target.exists():
+        return False
+    tmp_file = target.with_name(f'{target.name}.{os.getpid()}.tmp')
+    if data is None:
+        shutil.copyfile(source, tmp_file)
+    else:
+        tmp_file.write_bytes(data)
+    os.replace(tmp_file, target)
+    return True
+
+
+def remove_stale_copies(rel_path, current):
+    """Delete fingerprinted copies of an asset other than the current one."""
+    source = ROOT_DIR / rel_path
+    stem, suffix = os.path.splitext(source.name)
+    removed = 0
+    for path in source.parent.glob(f'{glob_escape(stem)}.*{suffix}'):
+        match = HASHED_NAME_RE.search(path.name)
+        if match and path.name[:match.start()] == stem and path.relative_to(ROOT_DIR).as_posix() != current:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def glob_escape(name):
+    return re.sub(r'([*?[])', r'[\1]', name)
+
+
+def fingerprint_assets():
+    """Write the fingerprinted copies and the manifest; returns (manifest, written, removed)."""
+    previous = load_manifest()
+    manifest = {}
+    written = removed = 0
+    for rel_path in collect_assets():
+        source = ROOT_DIR / rel_path
+        data = None
+        if rel_path.endswith('.css'):
+            css = source.read_text(encoding='utf-8')
+            data = rewrite_css_urls(css, posixpath.dirname(rel_path), manifest).encode('utf-8')
+        digest = hashlib.sha256(data if data is not None else source.read_bytes()).hexdigest()
+        manifest[rel_path] = fingerprinted_name(rel_path, digest)
+        written += write_copy(source, ROOT_DIR / manifest[rel_path], data)
+        removed += remove_stale_copies(rel_path, manifest[rel_path])
+
+    # Copies of assets that were deleted
+    for rel_path in previous.keys() - manifest.keys():
+        (ROOT_DIR / previous[rel_path]).unlink(missing_ok=True)
+        removed += 1
+
+    if manifest != previous:
+        build_cache.save_manifest(MANIFEST_FILE, {'files': manifest})
+    return manifest, written, removed
+
+
+def rewrite_page(page, manifest, page_path=None):
+    """
+    Rewrite the asset references of a page file in place; returns whether it changed.
+
+    page_path is the site path the URLs are relative to, if not the file's own.
+    """
+    html = page.read_text(encoding='utf-8')
+    updated = rewrite_references(html, page_path or page.relative_to(ROOT_DIR).as_posix(), manifest)
+    if updated == html:
+        return False
+    page.write_text(updated, encoding='utf-8')
+    return True
+
+
+def rewrite_pages(manifest):
+    """Rewrite asset references in index.html, the lecture pages and the book fragments; returns how many changed."""
+    changed = sum(rewrite_page(page, manifest) for pattern in PAGE_GLOBS for page in sorted(ROOT_DIR.glob(pattern)))
+    for pattern, page_path in FRAGMENT_GLOBS.items():
+        changed += sum(rewrite_page(page, manifest, page_path) for page in sorted(ROOT_DIR.glob(pattern)))
+    return changed
+
+
+def main():
+    with build_trace.span('fingerprint assets', 'deploy'):
+        manifest, written, removed = fingerprint_assets()
+    print(f"🔖 Fingerprinted {len(manifest)} assets ({written} new copies, {removed} stale removed)")
+    with build_trace.span('rewrite asset references', 'deploy'):
+        changed = rewrite_pages(manifest)
+    print(f"✅ Rewrote asset references in {changed} pages")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Run the lecture clean-up fixers as one pipeline.
+
+Each file is read once, passed through every fixer registered for its
+kind (markdown, LaTeX or HTML) in order, in memory, and written back only
+if the final content differs, so N fixers cost one read and at most one
+write per file. The regex fixers use precompiled, combined patterns, so
+each is a single scan of the file.
+
+With --check nothing is written: the unified diff of every file that
+would change is printed, and the exit status is 1 if there is any.
+
+Fixers are functions registered with @fixer:
+
+    @fixer('my-fix', 'latex', 'What the fixer repairs')
+    def my_fix(content):
+        return content.replace('...', '\\ldots{}')
+
+The HTML fixers repair hand-edited pages and only run when selected with
+--select, since convert_lectures.py regenerates the pages from markdown.
+The old fix_*.py scripts run their fixer through this pipeline.
+
+Usage:
+    python scripts/fix_lectures.py [PATH ...] [--select FIXER,...] [--check] [--jobs N]
+"""
+
+import argparse
+import difflib
+import re
+import sys
+from pathlib import Path
+
+import build_trace
+from build_pool import map_ordered
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+LECTURE_FILES = {
+    'markdown': (ROOT_DIR / 'Lectures' / 'markdown', 'Lecture *.md'),
+    'latex': (ROOT_DIR / 'Lectures' / 'latex', 'lecture-*.tex'),
+    'html': (ROOT_DIR / 'Lectures' / 'html', 'lecture-*.html'),
+}
+SUFFIX_KINDS = {'.md': 'markdown', '.tex': 'latex', '.html': 'html', '.htm': 'html'}
+
+# Registered fixers, in the order they run
+FIXERS = {}
+
+
+def fixer(name, kind, description, default=True):
+    """Register a content transform for one kind of lecture file."""
+    def register(fix):
+        FIXERS[name] = {'name': name, 'kind': kind, 'description': description,
+                        'default': default, 'fix': fix}
+        return fix
+    return register
+
+
+# ---------------------------------------------------------------- markdown
+
+# A language name on its own line followed by indented code; existing
+# fenced blocks are matched too, so their contents are left alone
+LANGUAGE_LINE_CODE_RE = re.compile(
+    r'^(?P<fence>`{3,}|~{3,})[^\n]*\n[\s\S]*?^[ \t]*(?P=fence)[ \t]*$'
+    r'|^(?P<lang>assembly|Assembly(?: \(\.s\))?|c|bash|python|verilog)[ \t]*\n(?P<code>(?:(?: {4}|\t).*\n)+)',
+    re.MULTILINE)
+
+
+@fixer('code-fences', 'markdown', 'Fence indented code that follows a bare language line')
+def fence_code_blocks(content):
+    def fence(match):
+        if match.group('fence'):
+            return match.group()
+        lang = match.group('lang').split()[0].lower()
+        return f'```{lang}\n{match.group("code")}```\n'
+    return LANGUAGE_LINE_CODE_RE.sub(fence, content)
+
+
+# ---------------------------------------------------------------- LaTeX
+
+SECTION_NUMBER_RE = re.compile(r'(\\(?:section|subsection|subsubsection)\{)\d+(?:\.\d+)*\s+')
+ARROWS = str.maketrans({'↓': r'$\downarrow$', '→': r'$\rightarrow$', '↔': r'$\leftrightarrow$'})
+LIST_BLANK_LINES_RE = re.compile(
+    r'(\\begin\{(?:itemize|enumerate)\})\n\n+'          # after \begin
+    r'|\n\n+(?=\\end\{(?:itemize|enumerate)\})'         # before \end
+    r'|(\\item [^\n]+)\n\n+(?=\\item )')                # between items
+EXTRA_BLANK_LINES_RE = re.compile(r'\n\n\n+')
+FLOW_STOP_PREFIXES = ('\\subsection', '\\subsubsection', '\\paragraph',
+                      '\\begin{itemize}', '\\begin{enumerate}')
+
+
+@fixer('section-numbers', 'latex', 'Drop manual numbers from \\section titles (LaTeX numbers them)')
+def remove_manual_numbering(content):
+    return SECTION_NUMBER_RE.sub(r'\1', content)
+
+
+@fixer('flow-diagrams', 'latex', 'Typeset Unicode arrows and center multi-line flow diagrams')
+def fix_flow_diagrams(content):
+    content = content.translate(ARROWS)
+    if '$\\downarrow$' not in content:
+        return content
+
+    lines = content.split('\n')
+    result_lines = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+
+        # A non-empty line followed by an arrow line may start a flow diagram
+        if (i + 2 < len(lines)
+                and not line.strip().startswith(('\\item', '\\begin', '\\end'))
+                and '$\\downarrow$' in lines[i + 1]
+                and line.strip()):
+            flow_lines = []
+            j = i
+            consecutive_arrows = 0
+            while j < len(lines):
+                current = lines[j].strip()
+                if current.startswith(FLOW_STOP_PREFIXES):
+                    break
+                if '$\\downarrow$' in current:
+                    consecutive_arrows += 1
+                elif current and consecutive_arrows > 0:
+                    consecutive_arrows = 0
+
+                if consecutive_arrows >= 2 or (flow_lines and current):
+                    flow_lines.append(lines[j])
+                    j += 1
+                    if not current:
+                        j += 1
+                        break
+                elif flow_lines:
+                    flow_lines.append(lines[j])
+                    j += 1
+                else:
+                    break
+
+            if (len(flow_lines) >= 5 and flow_lines.count('$\\downarrow$') >= 2
+                    and i > 0 and '\\begin{center}' not in result_lines[-5:]):
+                result_lines += ['\\begin{center}'] + flow_lines + ['\\end{center}', '']
+                i = j
+                continue
+
+        result_lines.append(line)
+        i += 1
+    return '\n'.join(result_lines)
+
+
+@fixer('list-spacing', 'latex', 'Remove blank lines inside itemize/enumerate environments')
+def fix_itemize_formatting(content):
+    def tighten(match):
+        if match.group(1):
+            return match.group(1) + '\n'
+        if match.group(2):
+            return match.group(2) + '\n'
+        return '\n'
+    return LIST_BLANK_LINES_RE.sub(tighten, content)
+
+
+@fixer('blank-lines', 'latex', 'Collapse runs of blank lines to one')
+def fix_spacing(content):
+    return EXTRA_BLANK_LINES_RE.sub('\n\n', content)
+
+
+# ---------------------------------------------------------------- HTML (hand-edited pages)
+
+CODE_MARKUP_RE = re.compile(r'``<code>|</code>`<code>|</code>``|</code>(?=\s*\n\s*<(?!pre|/code))')
+CODE_MARKUP = {'``<code>': '<pre><code>', '</code>`<code>': '', '</code>``': '</code></pre>',
+               '</code>': '</code></pre>'}
+STRONG_LINE_RE = re.compile(r'^([ \t]*)(<strong>.*?</strong>.*?)[ \t]*$', re.MULTILINE)
+SNIPPET_STOP_PREFIXES = ('<h', '<p><strong>', '<ul>', '<ol>', '<div', '<strong>')
+
+
+@fixer('strong-paragraphs', 'html', 'Wrap lines that start with a bare <strong> in <p>', default=False)
+def fix_strong_tags(content):
+    return STRONG_LINE_RE.sub(r'\1<p>\2</p>', content)
+
+
+@fixer('code-markup', 'html', 'Repair code blocks left as ``<code> ... </code>`` markup', default=False)
+def fix_code_markup(content):
+    return CODE_MARKUP_RE.sub(lambda match: CODE_MARKUP[match.group()], content)
+
+
+@fixer('code-snippets', 'html', 'Turn runs of code-like <p> lines into <pre><code> blocks', default=False)
+def fix_code_snippets(content):
+    lines = content.split('\n')
+    result = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        next_line = lines[i + 1].strip() if i + 1 < len(lines) else ''
+        if stripped.startswith('<p>-') or (
+                stripped.startswith('<p>') and not stripped.startswith('<p><strong>')
+                and i + 1 < len(lines)
+                and (next_line.startswith('<p>-')
+                     or (next_line.startswith('<p>') and not next_line.startswith('<p><strong>')
+                         and ':' in stripped or '=' in stripped or '->' in stripped or 'If' in stripped))):
+            code_lines = []
+            indent = line[:len(line) - len(line.lstrip())]
+            while i < len(lines):
+                current = lines[i].strip()
+                if not current or current.startswith(SNIPPET_STOP_PREFIXES):
+                    break
+                if not (current.startswith('<p>') and current.endswith('</p>')):
+                    break
+                text = re.match(r'<p>(.*?)</p>', current).group(1)
+                code_lines.append(text[2:] if text.startswith('- ') else text)
+                i += 1
+            if code_lines:
+                result += [f'{indent}<pre><code>'] + code_lines + [f'{indent}</code></pre>']
+                continue
+
+        result.append(line)
+        i += 1
+    return '\n'.join(result)
+
+
+# ---------------------------------------------------------------- pipeline
+
+def file_kind(path):
+    return SUFFIX_KINDS.get(Path(path).suffix.lower())
+
+
+def fix_content(content, kind, names):
+    """Run the selected fixers for a kind of file; returns (content, fixers that changed it)."""
+    applied = []
+    for name in names:
+        entry = FIXERS[name]
+        if entry['kind'] != kind:
+            continue
+        with build_trace.span(name, 'fix'):
+            fixed = entry['fix'](content)
+        if fixed != content:
+            applied.append(name)
+            content = fixed
+    return content, applied
+
+
+def fix_file(job):
+    """Fix one file in memory; runs in a worker process when --jobs > 1."""
+    path, names, check = job
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        original = f.read()
+    with build_trace.span('fix file', 'fix', file=path.name):
+        content, applied = fix_content(original, file_kind(path), names)
+    result = {'path': str(path), 'applied': applied, 'diff': ''}
+    if not applied:
+        return result
+    if check:
+        name = display_path(path).lstrip('/')
+        result['diff'] = ''.join(difflib.unified_diff(original.splitlines(True), content.splitlines(True),
+                                                      f'a/{name}', f'b/{name}'))
+    else:
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+    return result
+
+
+def collect_files(paths, names):
+    """The files to fix: the given paths, or every lecture file a selected fixer applies to."""
+    if paths:
+        files = []
+        for path in map(Path, paths):
+            if path.is_dir():
+                for _, pattern in LECTURE_FILES.values():
+                    files += sorted(path.glob(pattern))
+            else:
+                files.append(path)
+        return files
+    kinds = {FIXERS[name]['kind'] for name in names}
+    files = []
+    for kind, (directory, pattern) in LECTURE_FILES.items():
+        if kind in kinds:
+            files += sorted(directory.glob(pattern))
+    return files
+
+
+def display_path(path):
+    try:
+        return Path(path).resolve().relative_to(ROOT_DIR).as_posix()
+    except ValueError:
+        return Path(path).as_posix()
+
+
+def run_fixers(names=None, paths=None, check=False, jobs=1):
+    """Fix lecture files with the named fixers (default: all enabled ones); returns the per-file results."""
+    names = [name for name, entry in FIXERS.items() if entry['default']] if names is None else list(names)
+    unknown = [name for name in names if name not in FIXERS]
+    if unknown:
+        raise ValueError(f"Unknown fixer(s): {', '.join(unknown)}")
+    # Run in registration order whatever order they were selected in
+    names = [name for name in FIXERS if name in names]
+    files = collect_files(paths, names)
+    return map_ordered(fix_file, [(str(path), names, check) for path in files], jobs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the lecture clean-up fixers in one pass per file.')
+    parser.add_argument('paths', nargs='*', help='files or directories to fix (default: every lecture file)')
+    parser.add_argument('--select', metavar='FIXER,...', help='only run these fixers')
+    parser.add_argument('--check', action='store_true', help='print a diff instead of writing; exit 1 on changes')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='fix files in N worker processes (0 = one per CPU)')
+    parser.add_argument('--list', action='store_true', help='list the available fixers and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for entry in FIXERS.values():
+            default = '' if entry['default'] else ' (only with --select)'
+            print(f"{entry['name']:18} {entry['kind']:9} {entry['description']}{default}")
+        return 0
+
+    try:
+        results = run_fixers(args.select.split(',') if args.select else None, args.paths, args.check, args.jobs)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+    changed = [result for result in results if result['applied']]
+    for result in changed:
+        if args.check:
+            sys.stdout.write(result['diff'])
+        else:
+            print(f"✓ {display_path(result['path'])}: {', '.join(result['applied'])}")
+
+    if not changed:
+        print(f"✅ All {len(results)} files are clean")
+        return 0
+    if args.check:
+        print(f"\n⚠️  {len(changed)} of {len(results)} files would be changed")
+        return 1
+    print(f"\n✅ Fixed {len(changed)} of {len(results)} files")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
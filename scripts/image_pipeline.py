@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Generate responsive variants of the lecture images.
+
+For every image in Lectures/img this writes width-stepped WebP files (and
+AVIF files with --avif, when Pillow supports it) to Lectures/img/variants/,
+and records each source's size and variants in
+Lectures/img/variants/manifest.json. Sources whose hash matches the
+manifest are skipped, so rebuilds never re-encode unchanged images.
+
+The variants and the manifest are committed, since the site is deployed
+straight from the repository. convert_lectures.py reads the manifest and
+turns each lecture <img> into a <picture> with srcset, explicit
+width/height and loading="lazy".
+
+Requires Pillow (pip install Pillow) to generate variants; the HTML build
+works without it and simply leaves images untouched.
+
+Usage:
+    python scripts/image_pipeline.py [--avif] [--force]
+"""
+
+import argparse
+import hashlib
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is only needed to generate variants
+    Image = None
+
+import build_cache
+import build_trace
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+IMG_DIR = ROOT_DIR / 'Lectures' / 'img'
+VARIANTS_DIR = IMG_DIR / 'variants'
+MANIFEST_FILE = VARIANTS_DIR / 'manifest.json'
+
+SOURCE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+VARIANT_WIDTHS = [480, 800, 1200]
+FORMATS = {
+    'webp': {'mime': 'image/webp', 'options': {'quality': 80, 'method': 6}},
+    'avif': {'mime': 'image/avif', 'options': {'quality': 55}},
+}
+# Images never render wider than the content column
+MAX_DISPLAY_WIDTH = 800
+
+# Lecture pages refer to images relative to Lectures/html
+IMG_URL_PREFIX = '../img/'
+
+
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_manifest(manifest_file=MANIFEST_FILE):
+    """Load the variant manifest, treating a missing or corrupt file as empty."""
+    return build_cache.load_manifest(manifest_file)
+
+
+def manifest_hash(manifest_file=MANIFEST_FILE):
+    """Hash of the manifest, so page builds notice new variants."""
+    try:
+        return file_hash(manifest_file)
+    except OSError:
+        return ''
+
+
+def variant_name(source_name, width, fmt):
+    """Variant file name; it keeps the source extension so a.png and a.jpg do not collide."""
+    source = Path(source_name)
+    return f'{source.stem}-{source.suffix.lstrip(".").lower()}-{width}.{fmt}'
+
+
+def is_fresh(entry, source_name, source_hash, formats):
+    """Check that a manifest entry matches the source and its files exist."""
+    if not entry or entry.get('hash') != source_hash:
+        return False
+    variants = entry.get('variants', {})
+    if any(fmt not in variants for fmt in formats):
+        return False
+    return all(v['file'] == variant_name(source_name, v['width'], fmt) and (VARIANTS_DIR / v['file']).exists()
+               for fmt, vs in variants.items() for v in vs)
+
+
+def build_variants(source, formats):
+    """Encode the width-stepped variants of one image."""
+    with Image.open(source) as img:
+        img.load()
+        width, height = img.size
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if 'A' in img.getbands() else 'RGB')
+
+        # Never upscale; the largest variant is capped at the source width
+        widths = [w for w in VARIANT_WIDTHS if w < width] + [min(width, VARIANT_WIDTHS[-1])]
+        variants = {}
+        for fmt in formats:
+            variants[fmt] = []
+            for w in sorted(set(widths)):
+                h = round(height * w / width)
+                resized = img if w == width else img.resize((w, h), Image.LANCZOS)
+                name = variant_name(source.name, w, fmt)
+                resized.save(VARIANTS_DIR / name, fmt.upper(), **FORMATS[fmt]['options'])
+                variants[fmt].append({'width': w, 'height': h, 'file': name})
+    return {'width': width, 'height': height, 'variants': variants}
+
+
+def avif_supported():
+    from PIL import features
+    return bool(features.check('avif'))
+
+
+def make_picture_rewriter(manifest, url_prefix=IMG_URL_PREFIX, variants_dir=VARIANTS_DIR):
+    """
+    Return a hook for the HTML renderer that makes every <img> lazy, gives
+    the images in the manifest their width and height, and wraps them in a
+    <picture> with a srcset of the variant files that exist.
+    """
+    def rewrite(attrs):
+        attrs = dict(attrs)
+        attrs.setdefault('loading', 'lazy')
+        attrs.setdefault('decoding', 'async')
+        src = attrs.get('src', '')
+        entry = manifest.get(unquote(src[len(url_prefix):])) if src.startswith(url_prefix) else None
+        if not entry:
+            return format_img_tag(attrs)
+
+        # Keep the author's display width, and derive the height from it
+        width, height = entry['width'], entry['height']
+        try:
+            display_width = int(attrs.get('width', width))
+        except ValueError:
+            display_width = width
+        attrs.update(width=str(display_width), height=str(round(height * display_width / width)))
+        slot = min(display_width, MAX_DISPLAY_WIDTH)
+        sizes = f'(max-width: {slot}px) 100vw, {slot}px'
+
+        sources = []
+        for fmt in ('avif', 'webp'):
+            # A checkout without the variant files still gets the dimensions, but no srcset
+            variants = [v for v in entry['variants'].get(fmt, []) if (variants_dir / v['file']).is_file()]
+            if not variants:
+                continue
+            srcset = ', '.join(f'{url_prefix}variants/{quote(v["file"])} {v["width"]}w' for v in variants)
+            sources.append(f'<source type="{FORMATS[fmt]["mime"]}" srcset="{escape(srcset)}" sizes="{sizes}">')
+        if not sources:
+            return format_img_tag(attrs)
+        return '\n'.join(['<picture>', *sources, format_img_tag(attrs), '</picture>'])
+
+    return rewrite
+
+
+@lru_cache(maxsize=None)
+def load_picture_rewriter(manifest_file=MANIFEST_FILE):
+    """Picture rewriter for the current manifest."""
+    return make_picture_rewriter(load_manifest(manifest_file))
+
+
+def format_img_tag(attrs):
+    """Serialize an attribute dict back into an <img> tag."""
+    parts = ['<img']
+    for name, value in attrs.items():
+        parts.append(f'{name}="{escape(value)}"')
+    return ' '.join(parts) + '>'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate responsive variants of the lecture images.')
+    parser.add_argument('--avif', action='store_true', help='also generate AVIF variants')
+    parser.add_argument('--force', action='store_true', help='re-encode every image')
+    args = parser.parse_args()
+
+    if Image is None:
+        print("❌ Pillow is required to generate image variants: pip install Pillow")
+        return
+
+    formats = ['webp']
+    if args.avif:
+        if avif_supported():
+            formats.append('avif')
+        else:
+            print("⚠️  This Pillow build has no AVIF support; generating WebP only")
+
+    VARIANTS_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {} if args.force else load_manifest()
+    new_manifest = {}
+    encoded = 0
+
+    sources = sorted(p for p in IMG_DIR.iterdir() if p.suffix.lower() in SOURCE_EXTENSIONS)
+    print(f"🖼️  Found {len(sources)} lecture images")
+
+    for source in sources:
+        source_hash = file_hash(source)
+        entry = manifest.get(source.name)
+        if is_fresh(entry, source.name, source_hash, formats):
+            new_manifest[source.name] = entry
+            continue
+        print(f"Encoding: {source.name}")
+        with build_trace.span('encode image', 'image', file=source.name):
+            entry = build_variants(source, formats)
+        entry['hash'] = source_hash
+        new_manifest[source.name] = entry
+        encoded += 1
+
+    # Remove variants of images that no longer exist or changed size
+    keep = {v['file'] for e in new_manifest.values() for vs in e['variants'].values() for v in vs}
+    for path in VARIANTS_DIR.iterdir():
+        if path.name != MANIFEST_FILE.name and path.name not in keep:
+            path.unlink()
+
+    if new_manifest != manifest:
+        build_cache.save_manifest(MANIFEST_FILE, new_manifest)
+
+    print(f"\n✅ Encoded {encoded} images ({len(sources) - encoded} up to date)")
+
+
+if __name__ == '__main__':
+    main()
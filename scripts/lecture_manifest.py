@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Lecture metadata manifest.
+
+Lectures/lectures.json is the single source for everything the site says
+about a lecture: its number, title, page slug, markdown source, category,
+instructor, card description and YouTube video ID. convert_lectures.py
+takes the page titles, video thumbnails and previous/next links from it,
+and the lecture cards on index.html are rendered from it in one pass.
+
+To change a video or a card description, edit Lectures/lectures.json and
+run:
+    python scripts/lecture_manifest.py    # re-render the index.html cards
+    python scripts/convert_lectures.py    # rebuild the affected lecture pages
+"""
+
+import json
+import textwrap
+from html import escape
+from pathlib import Path
+
+import fingerprint_assets
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+LECTURES_FILE = ROOT_DIR / 'Lectures' / 'lectures.json'
+MARKDOWN_DIR = ROOT_DIR / 'Lectures' / 'markdown'
+INDEX_FILE = ROOT_DIR / 'index.html'
+
+# The lecture cards on index.html sit between these markers
+CARDS_START = '<!-- lecture cards: generated from Lectures/lectures.json by scripts/lecture_manifest.py -->'
+CARDS_END = '<!-- end of lecture cards -->'
+
+# index.html is formatted for an 80-column width
+LINE_WIDTH = 80
+
+REQUIRED_FIELDS = ('number', 'title', 'slug', 'source', 'category', 'instructor', 'description', 'video_id')
+
+
+class ManifestError(ValueError):
+    """Raised when Lectures/lectures.json is missing fields or out of order."""
+
+
+def load_lectures(path=LECTURES_FILE):
+    """Load the lecture entries, in lecture order."""
+    with open(path, 'r', encoding='utf-8') as f:
+        lectures = json.load(f)['lectures']
+    for i, lecture in enumerate(lectures, 1):
+        missing = [field for field in REQUIRED_FIELDS if not lecture.get(field)]
+        if missing:
+            raise ManifestError(f"lecture {i} is missing {', '.join(missing)}")
+        if lecture['number'] != i:
+            raise ManifestError(f"lecture {i} is numbered {lecture['number']}")
+    return lectures
+
+
+def page_title(lecture):
+    """Title used on the lecture page, e.g. 'Lecture 1: Computer Abstractions'."""
+    return f"Lecture {lecture['number']}: {lecture['title']}"
+
+
+def card_title(lecture):
+    return lecture.get('short_title', lecture['title'])
+
+
+def source_path(lecture):
+    return MARKDOWN_DIR / lecture['source']
+
+
+def video_url(video_id):
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+def thumbnail_url(video_id, size='maxresdefault'):
+    return f"https://img.youtube.com/vi/{video_id}/{size}.jpg"
+
+
+def neighbours(lectures, i):
+    """The previous and next lectures of lectures[i] (None at either end)."""
+    previous = lectures[i - 1] if i > 0 else None
+    following = lectures[i + 1] if i < len(lectures) - 1 else None
+    return previous, following
+
+
+def escape_text(text):
+    return escape(text, quote=False)
+
+
+def wrap_element(indent, open_tag, text, close_tag):
+    """Format an element the way index.html does: on one line if it fits, else wrapped."""
+    line = f'{indent}{open_tag}{text}{close_tag}'
+    if len(line) <= LINE_WIDTH:
+        return [line]
+    body = textwrap.wrap(text, LINE_WIDTH - len(indent) - 2, break_on_hyphens=False)
+    return [f'{indent}{open_tag}'] + [f'{indent}  {part}' for part in body] + [f'{indent}{close_tag}']
+
+
+def render_card(lecture):
+    """Render the index.html card for one lecture."""
+    page = f"Lectures/html/{lecture['slug']}.html"
+    link = f'<a href="{page}">{escape_text(card_title(lecture))}</a>'
+    if len(f'{" " * 18}{link}') <= LINE_WIDTH:
+        heading = [f'                  {link}']
+    else:
+        heading = [f'                  <a href="{page}"',
+                   f'                    >{escape_text(card_title(lecture))}</a',
+                   '                  >']
+    lines = [
+        '            <div class="lecture-card">',
+        f'              <div class="lecture-number">{lecture["number"]:02d}</div>',
+        '              <div class="lecture-content">',
+        '                <h4>',
+        *heading,
+        '                </h4>',
+        *wrap_element(' ' * 16, '<p class="lecture-instructor">',
+                      escape_text(f"By {lecture['instructor']}"), '</p>'),
+        '                <p>',
+        *textwrap.wrap(escape_text(lecture['description']), LINE_WIDTH, break_on_hyphens=False,
+                       initial_indent=' ' * 18, subsequent_indent=' ' * 18),
+        '                </p>',
+        '                <div class="lecture-links">',
+        '                  <a',
+        f'                    href="{escape(video_url(lecture["video_id"]))}"',
+        '                    class="lecture-link-btn video-link"',
+        '                    target="_blank"',
+        '                  >',
+        '                    <svg aria-hidden="true"><use href="assets/icons.svg#icon-play"></use></svg>',
+        '                    Watch Video',
+        '                  </a>',
+        '                  <a',
+        f'                    href="{page}"',
+        '                    class="lecture-link-btn notes-link"',
+        '                  >',
+        '                    <svg aria-hidden="true"><use href="assets/icons.svg#icon-notes"></use></svg>',
+        '                    Read Notes',
+        '                  </a>',
+        '                </div>',
+        '              </div>',
+        '            </div>',
+    ]
+    return '\n'.join(lines)
+
+
+def render_cards(lectures):
+    """Render every card, grouped by category in lecture order."""
+    categories = []
+    for lecture in lectures:
+        if not categories or categories[-1][0] != lecture['category']:
+            categories.append((lecture['category'], []))
+        categories[-1][1].append(lecture)
+
+    blocks = []
+    for name, members in categories:
+        first, last = members[0]['number'], members[-1]['number']
+        blocks.append('\n'.join([
+            f'          <!-- Lectures {first}-{last}: {escape_text(name)} -->',
+            '          <div class="lecture-category">',
+            f'            <h3 class="category-title">{escape_text(name)}</h3>',
+            *(render_card(lecture) for lecture in members),
+            '          </div>',
+        ]))
+    return '\n\n'.join(blocks)
+
+
+def render_index(content, lectures):
+    """Replace the lecture cards in index.html's content with freshly rendered ones."""
+    start = content.find(CARDS_START)
+    end = content.find(CARDS_END, start)
+    if start == -1 or end == -1:
+        raise ManifestError(f'{INDEX_FILE.name} has no lecture card markers')
+    start += len(CARDS_START)
+    return f'{content[:start]}\n{render_cards(lectures)}\n          {content[end:]}'
+
+
+def update_index_page(lectures=None):
+    """Re-render the index.html cards (with fingerprinted asset URLs); returns True if the file changed."""
+    if lectures is None:
+        lectures = load_lectures()
+    with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+        content = f.read()
+    updated = fingerprint_assets.rewrite_references(render_index(content, lectures), INDEX_FILE.name,
+                                                    fingerprint_assets.load_manifest())
+    if updated == content:
+        return False
+    with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+        f.write(updated)
+    return True
+
+
+def main():
+    lectures = load_lectures()
+    if update_index_page(lectures):
+        print(f"✅ Rendered {len(lectures)} lecture cards into {INDEX_FILE.name}")
+    else:
+        print(f"✅ {INDEX_FILE.name} lecture cards are up to date")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Lint the lecture headings in one pass per file.
+
+Every file is read once and turned into a stream of headings (markdown
+ATX headings outside code fences, or <h1>-<h6> in generated pages). Each
+registered rule is then called for every heading, with a per-file state
+dict of its own, so adding a rule never adds another read or scan of the
+corpus. Files are linted in parallel with --jobs.
+
+Rules are functions registered with @rule; they receive the file info,
+one heading and their state, and yield messages:
+
+    @rule('my-check', 'What the rule looks for')
+    def my_check(source, heading, state):
+        if 'TODO' in heading['text']:
+            yield f"Unfinished heading '{heading['text']}'"
+
+scan_errors.py, audit_numbering.py and check_duplicate_numbering.py run
+subsets of these rules.
+
+Usage:
+    python scripts/lint_lectures.py [PATH ...] [--select RULE,...] [--format text|json|sarif] [--jobs N]
+"""
+
+import argparse
+import json
+import re
+import sys
+from html import unescape
+from pathlib import Path
+
+from build_pool import map_ordered
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MARKDOWN_DIR = ROOT_DIR / 'Lectures' / 'markdown'
+HTML_DIR = ROOT_DIR / 'Lectures' / 'html'
+
+LEVELS = ('error', 'warning', 'info')
+# SARIF names for our levels
+SARIF_LEVELS = {'error': 'error', 'warning': 'warning', 'info': 'note'}
+
+MD_HEADING_RE = re.compile(r'(#{1,6})[ \t]+(.*?)[ \t]*#*[ \t]*$')
+MD_FENCE_RE = re.compile(r'[ \t]{0,3}(`{3,}|~{3,})')
+HTML_HEADING_RE = re.compile(r'<h([1-6])\b[^>]*>(.*?)</h\1\s*>', re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+HEADING_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)*)\s+(.*)', re.DOTALL)
+LECTURE_NUMBER_RE = re.compile(r'lecture[- ](\d+)', re.IGNORECASE)
+
+# Registered rules, in registration order
+RULES = {}
+
+
+def rule(rule_id, description, level='warning'):
+    """Register a heading rule (see the module docstring)."""
+    def register(check):
+        RULES[rule_id] = {'id': rule_id, 'description': description, 'level': level, 'check': check}
+        return check
+    return register
+
+
+def make_heading(level, text, line):
+    """A heading token; number/parts are the leading section number, if any."""
+    text = ' '.join(text.split())
+    match = HEADING_NUMBER_RE.fullmatch(text)
+    return {
+        'level': level,
+        'text': text,
+        'line': line,
+        'number': match.group(1) if match else None,
+        'parts': [int(part) for part in match.group(1).split('.')] if match else [],
+        'title': match.group(2) if match else text,
+    }
+
+
+def markdown_headings(content):
+    """Headings of a markdown file, skipping fenced code blocks."""
+    fence = None
+    for line_num, line in enumerate(content.splitlines(), 1):
+        fence_match = MD_FENCE_RE.match(line)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence):
+                fence = None
+            continue
+        if fence is None and line.startswith('#'):
+            match = MD_HEADING_RE.fullmatch(line)
+            if match:
+                yield make_heading(len(match.group(1)), match.group(2), line_num)
+
+
+def html_headings(content):
+    """Headings of a generated HTML page."""
+    line_num, pos = 1, 0
+    for match in HTML_HEADING_RE.finditer(content):
+        line_num += content.count('\n', pos, match.start())
+        pos = match.start()
+        yield make_heading(int(match.group(1)), unescape(TAG_RE.sub('', match.group(2))), line_num)
+
+
+def lint_file(job):
+    """Read one file and run the selected rules over its headings; runs in a worker with --jobs."""
+    path, rule_ids = job
+    path = Path(path)
+    content = path.read_text(encoding='utf-8')
+    match = LECTURE_NUMBER_RE.search(path.name)
+    source = {'path': str(path), 'lecture': int(match.group(1)) if match else None}
+    tokens = html_headings(content) if path.suffix.lower() in ('.html', '.htm') else markdown_headings(content)
+
+    rules = [RULES[rule_id] for rule_id in rule_ids]
+    states = [{} for _ in rules]
+    findings = []
+    for heading in tokens:
+        for selected, state in zip(rules, states):
+            for message in selected['check'](source, heading, state):
+                findings.append({
+                    'rule': selected['id'],
+                    'level': selected['level'],
+                    'path': source['path'],
+                    'line': heading['line'],
+                    'message': message,
+                })
+    return findings
+
+
+def collect_files(paths):
+    """Expand directories to their lecture files (markdown or HTML)."""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files += sorted(path.glob('Lecture *.md')) + sorted(path.glob('lecture-*.html'))
+        else:
+            files.append(path)
+    return files
+
+
+def lint_paths(paths, rule_ids=None, jobs=1):
+    """Lint files (or directories of lectures) and return every finding, in file order."""
+    rule_ids = list(RULES) if rule_ids is None else list(rule_ids)
+    unknown = [rule_id for rule_id in rule_ids if rule_id not in RULES]
+    if unknown:
+        raise ValueError(f"Unknown rule(s): {', '.join(unknown)}")
+    files = collect_files(paths)
+    results = map_ordered(lint_file, [(str(path), rule_ids) for path in files], jobs)
+    return [finding for findings in results for finding in findings], len(files)
+
+
+def display_path(path):
+    try:
+        return Path(path).resolve().relative_to(ROOT_DIR).as_posix()
+    except ValueError:
+        return Path(path).as_posix()
+
+
+def format_text(findings, file_count):
+    lines = [f"{display_path(f['path'])}:{f['line']}: {f['level']} [{f['rule']}] {f['message']}"
+             for f in findings]
+    if findings:
+        counts = ', '.join(f"{sum(f['level'] == level for f in findings)} {level}"
+                           for level in LEVELS if any(f['level'] == level for f in findings))
+        lines.append(f"\n⚠️  {len(findings)} findings ({counts}) in {file_count} files")
+    else:
+        lines.append(f"✅ No issues found in {file_count} files")
+    return '\n'.join(lines)
+
+
+def format_json(findings, file_count):
+    findings = [dict(f, path=display_path(f['path'])) for f in findings]
+    return json.dumps({'files': file_count, 'findings': findings}, indent=2)
+
+
+def format_sarif(findings, file_count, rule_ids=None):
+    """SARIF 2.1.0 log, for code-scanning dashboards."""
+    rule_ids = list(RULES) if rule_ids is None else list(rule_ids)
+    rules = [{
+        'id': rule_id,
+        'shortDescription': {'text': RULES[rule_id]['description']},
+        'defaultConfiguration': {'level': SARIF_LEVELS[RULES[rule_id]['level']]},
+    } for rule_id in rule_ids]
+    results = [{
+        'ruleId': f['rule'],
+        'ruleIndex': rule_ids.index(f['rule']),
+        'level': SARIF_LEVELS[f['level']],
+        'message': {'text': f['message']},
+        'locations': [{'physicalLocation': {
+            'artifactLocation': {'uri': display_path(f['path'])},
+            'region': {'startLine': f['line']},
+        }}],
+    } for f in findings]
+    return json.dumps({
+        '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+        'version': '2.1.0',
+        'runs': [{'tool': {'driver': {'name': 'lint_lectures', 'rules': rules}}, 'results': results}],
+    }, indent=2)
+
+
+# ---------------------------------------------------------------- rules
+# Typos seen in headings: "Sizerd Size", "Addressesdresses", "Improvementsvements",
+# "PagesKB Pages", "Operationperation", "Must Do Must Do"
+
+@rule('repeated-ending', 'Heading ends with a repeated run of letters (e.g. "Improvementsvements")')
+def repeated_ending(source, heading, state):
+    if re.search(r'(\w{3,})\1$', heading['text']):
+        yield f"Suspicious ending repetition in '{heading['text']}'"
+
+
+@rule('repeated-word', 'Heading ends with the same word twice')
+def repeated_word(source, heading, state):
+    words = heading['text'].split()
+    if len(words) > 1 and words[-1] == words[-2]:
+        yield f"Repeated last word in '{heading['text']}'"
+
+
+@rule('stutter-word', 'Last word of a heading is repeated at the end of the word before it (e.g. "Sizerd Size")')
+def stutter_word(source, heading, state):
+    words = heading['text'].split()
+    if len(words) < 2:
+        return
+    last_word, second_last = words[-1], words[-2]
+    if len(last_word) > 3 and second_last != last_word and second_last.endswith(last_word):
+        if len(second_last) - len(last_word) < 4:
+            yield f"Last word contained in previous in '{heading['text']}'"
+
+
+@rule('stutter-suffix', 'Known stuttered words such as "Addressesdresses" or "Operationperation"')
+def stutter_suffix(source, heading, state):
+    match = re.search(r'Improvements?vements|Addresses?dresses|Operation?peration', heading['text'])
+    if match:
+        yield f"Found '{match.group()}' type error in '{heading['text']}'"
+
+
+@rule('double-numbering', 'Heading carries two section numbers (e.g. "19.18.1 1. Title")')
+def double_numbering(source, heading, state):
+    if re.search(r'\d+(\.\d+)*\s+\d+\.', heading['text']):
+        yield f"Potential double numbering in '{heading['text']}'"
+
+
+@rule('numbering-prefix', 'Section number does not start with the lecture number')
+def numbering_prefix(source, heading, state):
+    if heading['parts'] and 2 <= heading['level'] <= 4 and source['lecture'] is not None:
+        if heading['parts'][0] != source['lecture']:
+            yield f"Wrong prefix '{heading['number']}' (expected starting with {source['lecture']})"
+
+
+@rule('numbering-depth', 'Section number depth does not match the heading level (h2 is X.Y)', level='info')
+def numbering_depth(source, heading, state):
+    if heading['parts'] and 2 <= heading['level'] <= 4 and len(heading['parts']) != heading['level']:
+        expected = '.'.join('XYZW'[:heading['level']])
+        yield f"H{heading['level']} numbered '{heading['number']}' (usually {expected})"
+
+
+@rule('numbering-sequence', 'Section numbers skip or go backwards')
+def numbering_sequence(source, heading, state):
+    level, parts = heading['level'], heading['parts']
+    if not parts or not 2 <= level <= 4 or parts[0] != source['lecture'] or len(parts) < level:
+        return
+    last = state.get(level, 0)
+    if parts[level - 1] != last + 1:
+        yield f"Gap/order: found {heading['number']} after {'.'.join(map(str, parts[:level - 1]))}.{last}"
+    state[level] = parts[level - 1]
+    # A new section restarts the numbering of the levels below it
+    for lower in range(level + 1, 5):
+        state[lower] = 0
+
+
+@rule('numbering-hierarchy', 'Subsection number does not belong to the section it is under')
+def numbering_hierarchy(source, heading, state):
+    level, parts = heading['level'], heading['parts']
+    if not parts or parts[0] != source['lecture']:
+        return
+    if level == 2 and len(parts) > 1:
+        state['section'] = parts[1]
+    elif level == 3 and len(parts) > 1 and parts[1] != state.get('section'):
+        yield f"{heading['number']} appears under section {source['lecture']}.{state.get('section')}"
+
+
+@rule('duplicate-number', 'The same section number is used twice in one lecture')
+def duplicate_number(source, heading, state):
+    if len(heading['parts']) < 2:
+        return
+    previous = state.get(heading['number'])
+    if previous:
+        yield (f"Duplicate {heading['number']} (first used on line {previous['line']}: "
+               f"'{previous['text']}')")
+    else:
+        state[heading['number']] = heading
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Lint lecture headings (typos and section numbering).')
+    parser.add_argument('paths', nargs='*', default=[str(MARKDOWN_DIR)],
+                        help='lecture files or directories (default: Lectures/markdown)')
+    parser.add_argument('--select', metavar='RULE,...', help='only run these rules')
+    parser.add_argument('--format', choices=('text', 'json', 'sarif'), default='text')
+    parser.add_argument('--output', '-o', metavar='FILE', help='write the report to FILE instead of stdout')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='lint files in N worker processes (0 = one per CPU)')
+    parser.add_argument('--list-rules', action='store_true', help='list the available rules and exit')
+    args = parser.parse_args(argv)
+
+    if args.list_rules:
+        for entry in RULES.values():
+            print(f"{entry['id']:20} {entry['level']:8} {entry['description']}")
+        return 0
+
+    rule_ids = args.select.split(',') if args.select else None
+    try:
+        findings, file_count = lint_paths(args.paths, rule_ids, args.jobs)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+    if args.format == 'json':
+        report = format_json(findings, file_count)
+    elif args.format == 'sarif':
+        report = format_sarif(findings, file_count, rule_ids)
+    else:
+        report = format_text(findings, file_count)
+
+    if args.output:
+        Path(args.output).write_text(report + '\n', encoding='utf-8')
+    else:
+        print(report)
+    # Informational findings alone do not fail the run
+    return 1 if any(f['level'] != 'info' for f in findings) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
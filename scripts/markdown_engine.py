@@ -0,0 +1,850 @@
+"""
+Single-pass Markdown engine for the lecture notes.
+
+The block parser walks the document once, line by line, and builds a small
+tree of plain dicts and lists (so it can be serialized as JSON). Inline text
+is tokenized in a single left-to-right scan per paragraph; * and _ runs are
+matched with a delimiter stack, as in CommonMark, so emphasis stays linear.
+render_html() turns the tree back into HTML.
+
+Supported syntax: ATX headings, paragraphs, fenced code (``` and ~~~),
+nested ordered/unordered lists, pipe tables, block quotes, horizontal rules,
+raw HTML blocks, display math ($$ ... $$), and inline bold/italic, code,
+links, images, raw HTML and \\( ... \\) math.
+"""
+
+import gc
+import re
+import unicodedata
+from html import escape, unescape
+
+# ---------- BLOCK SYNTAX ----------
+FENCE_RE = re.compile(r'^( {0,3})(`{3,}|~{3,})[ \t]*([^`\s]*)[^`]*$')
+# Opening #s of an ATX heading; heading_text() takes the rest of the line
+HEADING_RE = re.compile(r'^ {0,3}(#{1,6})(?=[ \t]|$)')
+HR_RE = re.compile(r'^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$')
+LIST_RE = re.compile(r'^( *)([-*+]|\d{1,9}[.)])([ \t]+|$)')
+BLOCKQUOTE_RE = re.compile(r'^ {0,3}> ?(.*)$')
+TABLE_DELIM_RE = re.compile(r'^ {0,3}\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$')
+HTML_BLOCK_RE = re.compile(r'^ {0,3}(?:<!--|</?([A-Za-z][A-Za-z0-9]*)(?=[\s/>]|$))')
+HTML_BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'center', 'details',
+    'div', 'dl', 'figcaption', 'figure', 'footer', 'h1', 'h2', 'h3', 'h4',
+    'h5', 'h6', 'header', 'hr', 'iframe', 'img', 'li', 'nav', 'ol', 'p',
+    'picture', 'pre', 'section', 'summary', 'table', 'ul', 'video',
+}
+
+# ---------- INLINE SYNTAX ----------
+INLINE_SPECIAL_RE = re.compile(r'[\\`*_!\[<&$]')
+CODE_SPAN_RE = re.compile(r'(`+)(.+?)(?<!`)\1(?!`)', re.DOTALL)
+EMPHASIS_TYPES = {1: 'em', 2: 'strong', 3: 'strong_em'}
+LINK_RE = re.compile(r'\[((?:[^\[\]]|\[[^\[\]]*\])*)\]\(\s*<?([^)"<>]*?)>?(?:\s+"([^"]*)")?\s*\)')
+AUTOLINK_RE = re.compile(r'<((?:https?|mailto):[^\s<>]+)>')
+INLINE_HTML_RE = re.compile(r'<(?:!--.*?--|/?[A-Za-z][A-Za-z0-9-]*(?:\s+[^<>]*?)?\s*/?)>', re.DOTALL)
+IMG_TAG_RE = re.compile(r'<img\b([^<>]*?)/?>', re.IGNORECASE)
+TAG_ATTR_RE = re.compile(r'([A-Za-z_:][-A-Za-z0-9_:.]*)(?:\s*=\s*("[^"]*"|\'[^\']*\'|[^\s"\'=<>`]+))?')
+ENTITY_RE = re.compile(r'&(?:#[0-9]{1,7}|#[xX][0-9a-fA-F]{1,6}|[A-Za-z][A-Za-z0-9]{1,31});')
+INLINE_MATH_RES = [
+    re.compile(r'\\\((.+?)\\\)', re.DOTALL),
+    re.compile(r'\$\$(.+?)\$\$', re.DOTALL),
+]
+BLOCK_START_CHARS = set('#`~>$\\<-*_+0123456789')
+ESCAPABLE = set('!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~')
+
+# Fenced code languages that Prism knows under another name
+CODE_LANGUAGE_ALIASES = {
+    'assembly': 'asm6502',
+    'asm': 'asm6502',
+    'arm': 'asm6502',
+    'armasm': 'asm6502',
+    'sh': 'bash',
+    'shell': 'bash',
+    'py': 'python',
+}
+
+
+def is_blank(line):
+    return not line.strip()
+
+
+def leading_spaces(line):
+    return len(line) - len(line.lstrip(' '))
+
+
+def is_table_start(line, next_line):
+    """A pipe table starts with a header row followed by a delimiter row."""
+    return (next_line is not None and '|' in line and '|' in next_line
+            and TABLE_DELIM_RE.match(next_line) is not None)
+
+
+def heading_text(line, start):
+    """The text of an ATX heading after its opening #s, without a closing # sequence."""
+    text = line[start:].strip(' \t')
+    if text.endswith('#'):
+        head = text.rstrip('#')
+        # Closing #s only count when whitespace separates them from the text
+        if head != head.rstrip(' \t'):
+            return head.rstrip(' \t')
+    return text
+
+
+def starts_block(line):
+    """Check whether a line opens a block that interrupts a paragraph."""
+    stripped = line.lstrip(' ')
+    first = stripped[:1]
+    # Dispatch on the first character so plain text lines skip every regex
+    if first not in BLOCK_START_CHARS or len(line) - len(stripped) > 3:
+        return False
+    if first == '#':
+        return HEADING_RE.match(line) is not None
+    if first in '`~':
+        return FENCE_RE.match(line) is not None
+    if first == '>':
+        return True
+    if first in '$\\':
+        return stripped.rstrip() in ('$$', '\\[')
+    if first == '<':
+        match = HTML_BLOCK_RE.match(line)
+        return bool(match and (match.group(1) is None or match.group(1).lower() in HTML_BLOCK_TAGS))
+    if HR_RE.match(line):
+        return True
+    # Only a non-empty bullet item or an ordered list starting at 1 interrupts a paragraph
+    match = LIST_RE.match(line)
+    return bool(match and line[match.end():].strip()
+                and (match.group(2) in '-*+' or int(match.group(2)[:-1]) == 1))
+
+
+# ---------- BLOCK PARSER ----------
+# Each parse_* function takes the list of lines and the index of the block's
+# first line, and returns the node and the index of the first line after it.
+def parse_blocks(lines):
+    """Parse a list of lines (without line endings) into block nodes."""
+    blocks = []
+    i = 0
+    n = len(lines)
+    while i < n:
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped:
+            i += 1
+            continue
+
+        # Dispatch on the first character so plain text lines skip every regex
+        first = stripped[0]
+        node = None
+        if first not in BLOCK_START_CHARS or len(line) - len(line.lstrip(' ')) > 3:
+            pass
+        elif first == '#':
+            match = HEADING_RE.match(line)
+            if match:
+                node = {
+                    'type': 'heading',
+                    'level': len(match.group(1)),
+                    'children': parse_inline(heading_text(line, match.end())),
+                }
+                i += 1
+        elif first in '`~':
+            match = FENCE_RE.match(line)
+            if match:
+                node, i = parse_fenced_code(lines, i, match)
+        elif first == '>':
+            if BLOCKQUOTE_RE.match(line):
+                node, i = parse_blockquote(lines, i)
+        elif first == '<':
+            match = HTML_BLOCK_RE.match(line)
+            if match and (match.group(1) is None or match.group(1).lower() in HTML_BLOCK_TAGS):
+                node, i = parse_html_block(lines, i)
+        elif first in '$\\':
+            if stripped in ('$$', '\\['):
+                node, i = parse_math_block(lines, i, '$$' if stripped == '$$' else '\\]')
+            elif len(stripped) > 4 and stripped.startswith('$$') and stripped.endswith('$$'):
+                node = {'type': 'math', 'display': True, 'text': stripped[2:-2].strip()}
+                i += 1
+        elif first in '-*_' and HR_RE.match(line):
+            node = {'type': 'hr'}
+            i += 1
+        elif first != '_' and LIST_RE.match(line):
+            node, i = parse_list(lines, i)
+
+        # Anything else is a table or a paragraph
+        if node is None:
+            if '|' in line and i + 1 < n and is_table_start(line, lines[i + 1]):
+                node, i = parse_table(lines, i)
+            else:
+                node, i = parse_paragraph(lines, i)
+        blocks.append(node)
+    return blocks
+
+
+def parse_fenced_code(lines, i, match):
+    """Collect lines up to the closing fence (or end of input)."""
+    indent, fence, lang = len(match.group(1)), match.group(2), match.group(3)
+    closing = fence[0] * len(fence)
+    code = []
+    i += 1
+    n = len(lines)
+    while i < n:
+        line = lines[i]
+        i += 1
+        stripped = line.strip()
+        if stripped.startswith(closing) and not stripped.strip(fence[0]):
+            break
+        # Remove the fence's own indentation from the code lines
+        code.append(line[min(indent, leading_spaces(line)):])
+    return {'type': 'code', 'lang': lang, 'text': '\n'.join(code)}, i
+
+
+def parse_math_block(lines, i, closer):
+    """Collect a display math block delimited by $$ or \\[ \\]."""
+    math = []
+    i += 1
+    n = len(lines)
+    while i < n:
+        line = lines[i]
+        i += 1
+        if line.strip() == closer:
+            break
+        math.append(line)
+    return {'type': 'math', 'display': True, 'text': '\n'.join(math)}, i
+
+
+def parse_blockquote(lines, i):
+    """Collect consecutive quoted lines and parse their content as blocks."""
+    quoted = []
+    n = len(lines)
+    while i < n:
+        line = lines[i]
+        match = BLOCKQUOTE_RE.match(line)
+        if match:
+            quoted.append(match.group(1))
+        elif quoted and quoted[-1].strip() and not is_blank(line) and not starts_block(line):
+            # Lazy continuation of a quoted paragraph
+            quoted.append(line)
+        else:
+            break
+        i += 1
+    return {'type': 'blockquote', 'children': parse_blocks(quoted)}, i
+
+
+def parse_list(lines, i):
+    """Parse a run of list items, recursing into each item's content."""
+    match = LIST_RE.match(lines[i])
+    ordered = match.group(2)[-1] in '.)'
+    node = {'type': 'list', 'ordered': ordered, 'tight': True, 'items': []}
+    if ordered:
+        node['start'] = int(match.group(2)[:-1])
+
+    items = node['items']
+    n = len(lines)
+    while True:
+        line = lines[i]
+        i += 1
+        marker_end = match.end(2)
+        spacing = match.end() - marker_end
+        # A marker followed by 5+ spaces starts indented content; keep one space
+        content_indent = marker_end + (spacing if 0 < spacing <= 4 else 1)
+        indent = ' ' * content_indent
+        first = line[content_indent:] if spacing <= 4 else line[marker_end + 1:]
+        item_lines = [first if first.strip() else '']
+        saw_blank = False
+        # The next item's marker, once a line has been matched against LIST_RE
+        match = None
+
+        while i < n:
+            nxt = lines[i]
+            stripped = nxt.strip()
+            if not stripped:
+                i += 1
+                item_lines.append('')
+                saw_blank = True
+                continue
+            if nxt.startswith(indent):
+                i += 1
+                item_lines.append(nxt[content_indent:])
+                continue
+            if saw_blank:
+                break
+            match = LIST_RE.match(nxt)
+            if match or starts_block(nxt):
+                break
+            # Lazy continuation line of the item's paragraph
+            i += 1
+            item_lines.append(stripped)
+
+        while item_lines and not item_lines[-1]:
+            item_lines.pop()
+        if '' in item_lines:
+            node['tight'] = False
+        if len(item_lines) == 1 and item_lines[0].lstrip()[0] not in BLOCK_START_CHARS:
+            # A one-line item is a paragraph unless the line opens a block
+            items.append([{'type': 'paragraph', 'children': parse_inline(item_lines[0].strip())}])
+        else:
+            items.append(parse_blocks(item_lines))
+
+        if i >= n:
+            break
+        nxt = lines[i]
+        if match is None:
+            match = LIST_RE.match(nxt)
+        if match is None or nxt.startswith(indent) or (match.group(2)[-1] in '.)') != ordered:
+            break
+        if saw_blank:
+            node['tight'] = False
+    return node, i
+
+
+def parse_html_block(lines, i):
+    """Raw HTML runs until the next blank line; comments run until -->."""
+    html = [lines[i]]
+    i += 1
+    n = len(lines)
+    if html[0].lstrip().startswith('<!--'):
+        while '-->' not in html[-1] and i < n:
+            html.append(lines[i])
+            i += 1
+        return {'type': 'html', 'text': '\n'.join(html)}, i
+    while i < n and not is_blank(lines[i]):
+        html.append(lines[i])
+        i += 1
+    return {'type': 'html', 'text': '\n'.join(l.strip() for l in html)}, i
+
+
+def split_table_row(line):
+    """Split a table row on pipes that are not escaped or inside code spans."""
+    row = line.strip()
+    if row.startswith('|'):
+        row = row[1:]
+    if row.endswith('|') and not row.endswith('\\|'):
+        row = row[:-1]
+    if '\\' not in row:
+        if '`' not in row:
+            return [cell.strip() for cell in row.split('|')]
+        # Rejoin pieces split inside a code span (an odd number of backticks so far)
+        cells, current = [], None
+        for piece in row.split('|'):
+            current = piece if current is None else current + '|' + piece
+            if not current.count('`') % 2:
+                cells.append(current.strip())
+                current = None
+        if current is not None:
+            cells.append(current.strip())
+        return cells
+    cells, current, in_code, i = [], [], False, 0
+    while i < len(row):
+        ch = row[i]
+        if ch == '\\' and i + 1 < len(row) and row[i + 1] == '|':
+            current.append('|')
+            i += 2
+            continue
+        if ch == '`':
+            in_code = not in_code
+        if ch == '|' and not in_code:
+            cells.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    cells.append(''.join(current).strip())
+    return cells
+
+
+def parse_table(lines, i):
+    """Parse a pipe table: header, delimiter row, then body rows."""
+    header = split_table_row(lines[i])
+    align = []
+    for cell in split_table_row(lines[i + 1]):
+        if cell.startswith(':') and cell.endswith(':'):
+            align.append('center')
+        elif cell.endswith(':'):
+            align.append('right')
+        elif cell.startswith(':'):
+            align.append('left')
+        else:
+            align.append(None)
+    width = len(header)
+    rows = []
+    i += 2
+    n = len(lines)
+    while i < n:
+        line = lines[i]
+        if '|' not in line or is_blank(line):
+            break
+        cells = split_table_row(line)
+        if len(cells) != width:
+            cells = (cells + [''] * width)[:width]
+        if INLINE_SPECIAL_RE.search(line) is None:
+            rows.append([[{'type': 'text', 'text': c}] if c else [] for c in cells])
+        else:
+            rows.append([parse_inline(c) for c in cells])
+        i += 1
+    return {
+        'type': 'table',
+        'align': (align + [None] * width)[:width],
+        'header': [parse_inline(c) for c in header],
+        'rows': rows,
+    }, i
+
+
+def parse_paragraph(lines, i):
+    """Collect paragraph lines until a blank line or another block starts."""
+    text = [lines[i].strip()]
+    i += 1
+    n = len(lines)
+    while i < n:
+        line = lines[i]
+        stripped = line.strip()
+        # Only lines starting with a block character can interrupt the paragraph
+        if not stripped or (stripped[0] in BLOCK_START_CHARS and starts_block(line)):
+            break
+        if '|' in line and i + 1 < n and is_table_start(line, lines[i + 1]):
+            break
+        text.append(stripped)
+        i += 1
+    return {'type': 'paragraph', 'children': parse_inline('\n'.join(text))}, i
+
+
+# ---------- INLINE PARSER ----------
+# parse_inline() collects tokens: strings for text, dicts for finished nodes
+# and [char, count, length, can_open, can_close] lists for */_ delimiter
+# runs that may still open emphasis. close_emphasis() pairs them up and
+# finish_inline() turns the unmatched ones back into text.
+SPACE, PUNCTUATION, OTHER = 1, 2, 3
+
+
+def char_class(ch, classes={' ': SPACE, '\n': SPACE}):
+    """SPACE, PUNCTUATION or OTHER, for the flanking rules of delimiter runs."""
+    kind = classes.get(ch)
+    if kind is None:
+        if ch.isspace():
+            kind = SPACE
+        elif ch in ESCAPABLE or (ch > '\x7f' and unicodedata.category(ch)[0] in 'PS'):
+            kind = PUNCTUATION
+        else:
+            kind = OTHER
+        classes[ch] = kind
+    return kind
+
+
+def finish_inline(tokens):
+    """Merge text and leftover delimiters into text nodes."""
+    if len(tokens) == 1 and tokens[0].__class__ is str:
+        return [{'type': 'text', 'text': tokens[0]}]
+    nodes = []
+    text = []
+    for token in tokens:
+        if token.__class__ is str:
+            text.append(token)
+        elif token.__class__ is list:
+            text.append(token[0] * token[1])
+        else:
+            if text:
+                nodes.append({'type': 'text', 'text': ''.join(text)})
+                text = []
+            nodes.append(token)
+    if text:
+        nodes.append({'type': 'text', 'text': ''.join(text)})
+    return nodes
+
+
+def close_emphasis(tokens, openers, closer, bottoms):
+    """
+    Match a closing delimiter run against the stack of open ones.
+
+    Every match wraps the tokens since the opener in an em, strong or
+    strong_em node (*** on both sides). openers holds (delimiter, index in
+    tokens) pairs; bottoms records, per kind of closer, the stack depth
+    below which an earlier search found nothing, so closers of one kind
+    never examine an opener twice and the scan stays linear.
+    """
+    char, _, length, can_open, _ = closer
+    key = (char, can_open, length % 3)
+    while closer[1]:
+        bottom = bottoms.get(key, 0)
+        depth = len(openers) - 1
+        while depth >= bottom:
+            opener = openers[depth][0]
+            if opener[0] == char and not ((opener[4] or can_open) and (opener[2] + length) % 3 == 0
+                                          and (opener[2] % 3 or length % 3)):
+                break
+            depth -= 1
+        if depth < bottom:
+            bottoms[key] = len(openers)
+            return
+
+        opener, index = openers[depth]
+        use = min(opener[1], closer[1], 3)
+        if use == 3 and (opener[1] > 3 or closer[1] > 3):
+            use = 2
+        children = finish_inline(tokens[index + 1:])
+        del tokens[index + 1:]
+        opener[1] -= use
+        closer[1] -= use
+        if opener[1]:
+            del openers[depth + 1:]
+        else:
+            del openers[depth:]
+            del tokens[index]
+        tokens.append({'type': EMPHASIS_TYPES[use], 'children': children})
+        for kind, depth in bottoms.items():
+            if depth > len(openers):
+                bottoms[kind] = len(openers)
+
+
+def parse_inline(text):
+    """Tokenize inline markup in one left-to-right scan."""
+    search = INLINE_SPECIAL_RE.search
+    match = search(text)
+    if match is None:
+        return [{'type': 'text', 'text': text}] if text else []
+    tokens = []
+    openers = []
+    bottoms = {}
+    pos = 0
+    length = len(text)
+    while match is not None:
+        start = match.start()
+        if start > pos:
+            tokens.append(text[pos:start])
+        ch = text[start]
+        if ch == '*' or ch == '_':
+            pos = start + 1
+            while pos < length and text[pos] == ch:
+                pos += 1
+            # CommonMark's flanking rules; the ends of the text count as whitespace
+            before = char_class(text[start - 1]) if start else SPACE
+            after = char_class(text[pos]) if pos < length else SPACE
+            left = after != SPACE and (after != PUNCTUATION or before != OTHER)
+            right = before != SPACE and (before != PUNCTUATION or after != OTHER)
+            if ch == '_':
+                # No intraword emphasis with underscores (snake_case identifiers)
+                left, right = left and (not right or before == PUNCTUATION), right and (not left or after == PUNCTUATION)
+            delim = [ch, pos - start, pos - start, left, right]
+            if right and openers:
+                close_emphasis(tokens, openers, delim, bottoms)
+            if delim[1]:
+                if left:
+                    tokens.append(delim)
+                    openers.append((delim, len(tokens) - 1))
+                else:
+                    tokens.append(ch * delim[1])
+        else:
+            pos = parse_inline_at(text, start, ch, tokens)
+            if not pos:
+                tokens.append(ch)
+                pos = start + 1
+        match = search(text, pos)
+    if pos < length:
+        tokens.append(text[pos:])
+    return finish_inline(tokens)
+
+
+def parse_inline_at(text, pos, ch, nodes):
+    """Try to parse an inline construct at pos into nodes; return the end offset or 0."""
+    if ch == '\\':
+        for regex in INLINE_MATH_RES[:1]:
+            match = regex.match(text, pos)
+            if match:
+                nodes.append({'type': 'math', 'display': False, 'text': match.group(1)})
+                return match.end()
+        nxt = text[pos + 1:pos + 2]
+        if nxt in ESCAPABLE and nxt:
+            nodes.append(nxt)
+            return pos + 2
+        return 0
+
+    if ch == '`':
+        match = CODE_SPAN_RE.match(text, pos)
+        if match:
+            code = match.group(2).replace('\n', ' ')
+            if code.startswith(' ') and code.endswith(' ') and code.strip():
+                code = code[1:-1]
+            nodes.append({'type': 'code', 'text': code})
+            return match.end()
+        # Skip the whole backtick run so it is not re-tried one by one
+        run = len(text) - len(text[pos:].lstrip('`'))
+        nodes.append(text[pos:run])
+        return run
+
+    if ch == '$':
+        match = INLINE_MATH_RES[1].match(text, pos)
+        if match:
+            nodes.append({'type': 'math', 'display': True, 'text': match.group(1).strip()})
+            return match.end()
+        return 0
+
+    if ch == '!':
+        if text.startswith('![', pos):
+            match = LINK_RE.match(text, pos + 1)
+            if match:
+                node = {'type': 'image', 'alt': match.group(1), 'src': match.group(2).strip()}
+                if match.group(3):
+                    node['title'] = match.group(3)
+                nodes.append(node)
+                return match.end()
+        return 0
+
+    if ch == '[':
+        match = LINK_RE.match(text, pos)
+        if match:
+            node = {'type': 'link', 'href': match.group(2).strip(),
+                    'children': parse_inline(match.group(1))}
+            if match.group(3):
+                node['title'] = match.group(3)
+            nodes.append(node)
+            return match.end()
+        return 0
+
+    if ch == '<':
+        match = AUTOLINK_RE.match(text, pos)
+        if match:
+            url = match.group(1)
+            nodes.append({'type': 'link', 'href': url, 'children': [{'type': 'text', 'text': url}]})
+            return match.end()
+        match = INLINE_HTML_RE.match(text, pos)
+        if match:
+            nodes.append({'type': 'html', 'text': match.group(0)})
+            return match.end()
+        return 0
+
+    if ch == '&':
+        match = ENTITY_RE.match(text, pos)
+        if match:
+            nodes.append({'type': 'html', 'text': match.group(0)})
+            return match.end()
+        return 0
+
+    return 0
+
+
+def parse_markdown(md_content):
+    """Parse a markdown string into a document tree."""
+    lines = md_content.split('\n')
+    if '\r' in md_content:
+        lines = [line.rstrip('\r') for line in lines]
+    # The tree is many small dicts and lists but no cycles; with the cycle
+    # collector running, its full passes over the growing tree would make
+    # parsing slower per MB as documents grow
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return {'type': 'document', 'children': parse_blocks(lines)}
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def inline_text(nodes):
+    """Flatten inline nodes to plain text (for titles, alt text and indexing)."""
+    parts = []
+    for node in nodes:
+        if 'children' in node:
+            parts.append(inline_text(node['children']))
+        elif node['type'] == 'image':
+            parts.append(node['alt'])
+        elif node['type'] != 'html':
+            parts.append(node.get('text', ''))
+    return ''.join(parts)
+
+
+def walk_blocks(nodes):
+    """Yield every block node, descending into block quotes and list items."""
+    for node in nodes:
+        yield node
+        if node['type'] == 'blockquote':
+            yield from walk_blocks(node['children'])
+        elif node['type'] == 'list':
+            for item in node['items']:
+                yield from walk_blocks(item)
+
+
+def walk_inline(nodes):
+    """Yield every inline node in a list of blocks, including nested ones."""
+    for block in walk_blocks(nodes):
+        if block['type'] in ('heading', 'paragraph'):
+            yield from _walk_inline_nodes(block['children'])
+        elif block['type'] == 'table':
+            for row in [block['header']] + block['rows']:
+                for cell in row:
+                    yield from _walk_inline_nodes(cell)
+
+
+def _walk_inline_nodes(nodes):
+    for node in nodes:
+        yield node
+        if 'children' in node:
+            yield from _walk_inline_nodes(node['children'])
+
+
+# ---------- HTML RENDERER ----------
+class HtmlRenderer:
+    """
+    Render a document tree to HTML, one method per node type.
+
+    image_hook, if given, is called with the attributes of every <img> (from
+    markdown images and raw HTML alike) and may return replacement markup,
+    or None to keep the plain tag. math_hook works the same way for math
+    nodes, returning pre-rendered markup or None to leave the TeX source for
+    client-side rendering. code_hook is called with a code block's language
+    and text and may return highlighted (already escaped) HTML.
+    """
+
+    def __init__(self, image_hook=None, math_hook=None, code_hook=None):
+        self.image_hook = image_hook
+        self.math_hook = math_hook
+        self.code_hook = code_hook
+
+    def render(self, doc):
+        """Render a whole document to a string."""
+        return ''.join(self.iter_render(doc))
+
+    def iter_render(self, doc):
+        """Render a document one top-level block at a time, for writing pages as a stream."""
+        for i, node in enumerate(doc['children']):
+            if i:
+                yield '\n\n'
+            yield self.render_block(node)
+        yield '\n'
+
+    def render_block(self, node):
+        return getattr(self, 'render_' + node['type'])(node)
+
+    def render_blocks(self, nodes, tight=False):
+        if tight and len(nodes) == 1 and nodes[0]['type'] == 'paragraph':
+            return self.render_inline(nodes[0]['children'])
+        parts = []
+        for node in nodes:
+            if tight and node['type'] == 'paragraph':
+                parts.append(self.render_inline(node['children']))
+            else:
+                parts.append(self.render_block(node))
+        return '\n'.join(parts)
+
+    def render_heading(self, node):
+        level = node['level']
+        return f'<h{level}>{self.render_inline(node["children"])}</h{level}>'
+
+    def render_paragraph(self, node):
+        return f'<p>{self.render_inline(node["children"])}</p>'
+
+    def render_hr(self, node):
+        return '<hr>'
+
+    def render_code(self, node):
+        lang = CODE_LANGUAGE_ALIASES.get(node['lang'].lower(), node['lang'].lower())
+        class_attr = f' class="language-{escape(lang)}"' if lang else ''
+        highlighted = self.code_hook(lang, node['text']) if self.code_hook is not None and lang else None
+        if highlighted is not None:
+            return f'<pre{class_attr}><code{class_attr}>{highlighted}\n</code></pre>'
+        return f'<pre><code{class_attr}>{escape(node["text"], quote=False)}\n</code></pre>'
+
+    def render_math(self, node):
+        rendered = self.math_hook(node) if self.math_hook is not None else None
+        if rendered:
+            return f'<div class="math-block">\n{rendered}\n</div>' if node['display'] else rendered
+        text = escape(node['text'], quote=False)
+        if node['display']:
+            return f'<div class="math-block">\n$$\n{text}\n$$\n</div>'
+        return f'\\({text}\\)'
+
+    def render_blockquote(self, node):
+        return f'<blockquote>\n{self.render_blocks(node["children"])}\n</blockquote>'
+
+    def render_list(self, node):
+        tag = 'ol' if node['ordered'] else 'ul'
+        start = node.get('start', 1)
+        open_tag = f'<ol start="{start}">' if node['ordered'] and start != 1 else f'<{tag}>'
+        items = [f'<li>{self.render_blocks(item, tight=node["tight"])}</li>' for item in node['items']]
+        return '\n'.join([open_tag] + items + [f'</{tag}>'])
+
+    def render_html(self, node):
+        # Lecture images live in Lectures/img, one level up from the HTML output
+        text = node['text'].replace('<img src="img/', '<img src="../img/')
+        if self.image_hook is None or '<img' not in text:
+            return text
+        return IMG_TAG_RE.sub(self.replace_img_tag, text)
+
+    def replace_img_tag(self, match):
+        return self.image_hook(parse_tag_attrs(match.group(1))) or match.group(0)
+
+    def render_table(self, node):
+        render_inline = self.render_inline
+        styles = [f' style="text-align: {align}"' if align else '' for align in node['align']]
+        lines = ['<table>', '<thead>', '<tr>']
+        lines += [f'<th{s}>{render_inline(c)}</th>' for c, s in zip(node['header'], styles)]
+        lines += ['</tr>', '</thead>', '<tbody>']
+        for row in node['rows']:
+            lines.append('<tr>')
+            lines += [f'<td{s}>{render_inline(c)}</td>' for c, s in zip(row, styles)]
+            lines.append('</tr>')
+        lines += ['</tbody>', '</table>']
+        return '\n'.join(lines)
+
+    def render_inline(self, nodes):
+        parts = []
+        for node in nodes:
+            kind = node['type']
+            if kind == 'text':
+                parts.append(escape_text(node['text']))
+            elif kind == 'strong':
+                parts.append(f'<strong>{self.render_inline(node["children"])}</strong>')
+            elif kind == 'em':
+                parts.append(f'<em>{self.render_inline(node["children"])}</em>')
+            elif kind == 'strong_em':
+                parts.append(f'<strong><em>{self.render_inline(node["children"])}</em></strong>')
+            elif kind == 'code':
+                parts.append(f'<code>{escape_text(node["text"])}</code>')
+            elif kind == 'link':
+                title = f' title="{escape(node["title"])}"' if node.get('title') else ''
+                parts.append(f'<a href="{escape(node["href"])}"{title}>'
+                             f'{self.render_inline(node["children"])}</a>')
+            elif kind == 'image':
+                parts.append(self.render_image(node))
+            elif kind == 'math':
+                if not node['display']:
+                    parts.append(self.render_math(node))
+                else:
+                    rendered = self.math_hook(node) if self.math_hook is not None else None
+                    parts.append(rendered or f'$${escape(node["text"], quote=False)}$$')
+            elif kind == 'html':
+                parts.append(self.render_html(node))
+        return ''.join(parts)
+
+    def render_image(self, node):
+        src = node['src']
+        if src.startswith('img/'):
+            src = '../' + src
+        if self.image_hook is not None:
+            replacement = self.image_hook({'src': src, 'alt': node['alt'], 'style': 'max-width: 100%;'})
+            if replacement:
+                return replacement
+        return f'<img src="{escape(src)}" alt="{escape(node["alt"])}" style="max-width: 100%;">'
+
+
+def escape_text(text):
+    """HTML-escape text content; most text has nothing to escape."""
+    if '&' in text or '<' in text or '>' in text:
+        return escape(text, quote=False)
+    return text
+
+
+def parse_tag_attrs(text):
+    """Parse the attribute list of an HTML start tag into a dict."""
+    attrs = {}
+    for match in TAG_ATTR_RE.finditer(text):
+        value = match.group(2)
+        if value is None:
+            value = ''
+        elif value[0] in '"\'':
+            value = value[1:-1]
+        attrs[match.group(1).lower()] = unescape(value)
+    return attrs
+
+
+def render_html(doc, image_hook=None, math_hook=None, code_hook=None):
+    """Render a document tree to HTML with the default renderer."""
+    return HtmlRenderer(image_hook, math_hook, code_hook).render(doc)
+
+
+def iter_html(doc, image_hook=None, math_hook=None, code_hook=None):
+    """Like render_html(), but yield the HTML block by block."""
+    return HtmlRenderer(image_hook, math_hook, code_hook).iter_render(doc)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Render lecture math to static KaTeX HTML at build time.
+
+Lecture pages used to ship katex.min.js and auto-render.min.js, which walk
+the whole DOM looking for delimiters on every page view. Instead, the build
+collects the math nodes of each document and renders them with KaTeX under
+node, using the vendored assets/vendor/katex/katex.min.js (see
+vendor_assets.py). Pages then only need the KaTeX stylesheet, and pages
+without math need nothing at all.
+
+Each expression is cached under .cache/math/, keyed on the KaTeX build,
+the display mode and the TeX source, so unchanged math is never re-rendered.
+All uncached expressions of a page are rendered by a single node process.
+
+Without node or the vendored KaTeX, or if an expression fails to render,
+the page falls back to client-side rendering.
+
+Usage:
+    python scripts/math_prerender.py    # warm the cache for every lecture
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+
+import build_trace
+import markdown_engine
+from build_pool import register_stats
+from document_cache import load_document
+from vendor_assets import VENDOR_DIR
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = ROOT_DIR / '.cache' / 'math'
+MARKDOWN_DIR = ROOT_DIR / 'Lectures' / 'markdown'
+KATEX_JS = VENDOR_DIR / 'katex' / 'katex.min.js'
+
+# Reads [[tex, displayMode], ...] as JSON on stdin, writes HTML (or null) per item
+RENDER_SCRIPT = r"""
+const katex = require(process.argv[1]);
+let input = '';
+process.stdin.setEncoding('utf8');
+process.stdin.on('data', (chunk) => { input += chunk; });
+process.stdin.on('end', () => {
+  const results = JSON.parse(input).map(([tex, displayMode]) => {
+    try {
+      return katex.renderToString(tex, {displayMode, throwOnError: true});
+    } catch (e) {
+      process.stderr.write(`KaTeX: ${e.message}\n`);
+      return null;
+    }
+  });
+  process.stdout.write(JSON.stringify(results));
+});
+"""
+
+# Counters for the end-of-build summary
+STATS = {'rendered': 0, 'cached': 0, 'failed': 0}
+register_stats(STATS)
+
+
+@lru_cache(maxsize=None)
+def unavailable_reason():
+    """Why math cannot be pre-rendered, or '' when it can."""
+    if shutil.which('node') is None:
+        return 'node is not installed'
+    if not KATEX_JS.is_file():
+        return 'KaTeX is not vendored; run scripts/vendor_assets.py'
+    return ''
+
+
+@lru_cache(maxsize=None)
+def runtime_hash():
+    """Identify the KaTeX runtime, or '' when math cannot be pre-rendered."""
+    if unavailable_reason():
+        return ''
+    try:
+        return hashlib.sha256(KATEX_JS.read_bytes()).hexdigest()
+    except OSError:
+        return ''
+
+
+def document_math(doc):
+    """The distinct (tex, display) math expressions of a document, in order."""
+    expressions = {}
+    for node in markdown_engine.walk_blocks(doc['children']):
+        if node['type'] == 'math':
+            expressions[(node['text'], node['display'])] = None
+    for node in markdown_engine.walk_inline(doc['children']):
+        if node['type'] == 'math':
+            expressions[(node['text'], node['display'])] = None
+    return list(expressions)
+
+
+def cache_file(tex, display):
+    h = hashlib.sha256(runtime_hash().encode('ascii'))
+    h.update(b'\0display\0' if display else b'\0inline\0')
+    h.update(tex.encode('utf-8'))
+    return CACHE_DIR / f'{h.hexdigest()}.html'
+
+
+def prerender(expressions):
+    """
+    Render math expressions to HTML.
+
+    Returns a dict mapping (tex, display) to HTML for every expression that
+    rendered; the dict is empty when no KaTeX runtime is available, and
+    every expression is then counted as left for the browser.
+    """
+    if not expressions:
+        return {}
+    if not runtime_hash():
+        STATS['failed'] += len(expressions)
+        return {}
+
+    rendered = {}
+    missing = []
+    for expression in expressions:
+        try:
+            rendered[expression] = cache_file(*expression).read_text(encoding='utf-8')
+            STATS['cached'] += 1
+        except OSError:
+            missing.append(expression)
+    if not missing:
+        return rendered
+
+    with build_trace.span('render math', 'math', expressions=len(missing)):
+        result = subprocess.run(['node', '-e', RENDER_SCRIPT, str(KATEX_JS)],
+                                input=json.dumps(missing), capture_output=True, text=True, encoding='utf-8')
+    if result.returncode != 0:
+        print(f"⚠️  KaTeX pre-rendering failed: {result.stderr.strip()}")
+        STATS['failed'] += len(missing)
+        return rendered
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for expression, html in zip(missing, json.loads(result.stdout)):
+        if html is None:
+            STATS['failed'] += 1
+            continue
+        rendered[expression] = html
+        STATS['rendered'] += 1
+        path = cache_file(*expression)
+        tmp_file = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        tmp_file.write_text(html, encoding='utf-8')
+        os.replace(tmp_file, path)
+    if result.stderr:
+        print(result.stderr.strip())
+    return rendered
+
+
+def make_math_hook(rendered):
+    """Renderer hook that swaps math nodes for their pre-rendered HTML."""
+    def math_hook(node):
+        return rendered.get((node['text'], node['display']))
+    return math_hook
+
+
+def math_mode(expressions, rendered):
+    """How a page loads KaTeX: None (no math), 'static' or 'runtime'."""
+    if not expressions:
+        return None
+    return 'static' if all(expression in rendered for expression in expressions) else 'runtime'
+
+
+def format_stats():
+    reason = unavailable_reason()
+    return (f"Math: {STATS['rendered']} rendered, {STATS['cached']} from cache, "
+            f"{STATS['failed']} left for the browser" + (f" ({reason})" if STATS['failed'] and reason else ''))
+
+
+def main():
+    if not runtime_hash():
+        print(f"❌ Cannot pre-render math: {unavailable_reason() or 'the vendored KaTeX is unreadable'}")
+        return
+
+    for md_file in sorted(MARKDOWN_DIR.glob('Lecture *.md')):
+        expressions = document_math(load_document(md_file))
+        if expressions:
+            rendered = prerender(expressions)
+            print(f"{md_file.name}: {len(rendered)}/{len(expressions)} expressions")
+
+    print(f"\n✅ {format_stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,29 @@
 """
 Advanced Markdown to LaTeX converter for lecture notes.
 Handles complex markdown syntax while preserving exact content.
+
+Renders from the same parsed document tree as the HTML build (see
+document_cache.py), so each lecture is parsed once for both formats.
 """
 
-import os
+import argparse
+import hashlib
+import inspect
 import re
 from pathlib import Path
+from urllib.parse import unquote
+
+import build_trace
+import markdown_engine
+from build_cache import load_manifest, save_manifest
+from build_pool import map_ordered
+from document_cache import format_stats, load_document
 
-MARKDOWN_DIR = Path(r"d:\Academics\Projects\isuru sir\CO224-Web\Lectures\markdown")
-LATEX_DIR = Path(r"d:\Academics\Projects\isuru sir\CO224-Web\Lectures\latex")
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MARKDOWN_DIR = ROOT_DIR / "Lectures" / "markdown"
+LATEX_DIR = ROOT_DIR / "Lectures" / "latex"
+# Source hash each lecture-NN.tex was last generated from, and the hash of what was written
+MANIFEST_FILE = LATEX_DIR / ".build-manifest.json"
 
 # Correct lecture order mapping
 LECTURE_ORDER = [
@@ -36,215 +51,312 @@ LECTURE_ORDER = [
 
 
 class MarkdownToLatexConverter:
-    def __init__(self):
-        self.in_code_block = False
-        self.in_list = False
-        self.in_table = False
-        self.list_stack = []
-        
+    """Render a parsed markdown document tree as LaTeX."""
+
+    # Special characters that need escaping
+    SPECIAL_CHARS = {
+        '\\': r'\textbackslash{}',
+        '&': r'\&',
+        '%': r'\%',
+        '$': r'\$',
+        '#': r'\#',
+        '_': r'\_',
+        '{': r'\{',
+        '}': r'\}',
+        '~': r'\textasciitilde{}',
+        '^': r'\textasciicircum{}',
+    }
+    SPECIAL_CHARS_RE = re.compile('|'.join(map(re.escape, SPECIAL_CHARS)))
+
+    # Unicode symbols that need math mode in LaTeX
+    SYMBOLS = {
+        '→': r'$\rightarrow$',
+        '←': r'$\leftarrow$',
+        '↔': r'$\leftrightarrow$',
+        '×': r'$\times$',
+        '÷': r'$\div$',
+        '≤': r'$\leq$',
+        '≥': r'$\geq$',
+        '≠': r'$\neq$',
+    }
+    SYMBOL_RE = re.compile('|'.join(map(re.escape, SYMBOLS)))
+
+    # Fenced code languages known to the listings package
+    LISTINGS_LANGUAGES = {
+        'c': 'C',
+        'python': 'Python',
+        'bash': 'bash',
+        'verilog': 'Verilog',
+    }
+
+    HEADING_COMMANDS = {1: 'section', 2: 'subsection', 3: 'subsubsection'}
+
+    IMG_TAG_RE = re.compile(r'<img\s[^>]*>', re.IGNORECASE)
+    IMG_ATTR_RE = re.compile(r'(src|alt)\s*=\s*"([^"]*)"', re.IGNORECASE)
+    # Lectures refer to images as ../img/...; main.tex includes them from Lectures/latex/img
+    IMG_SRC_PREFIX = '../img/'
+    # File name characters that are safe to pass to \includegraphics as they are
+    SAFE_PATH_RE = re.compile(r"[\w ./'()-]*")
+    # URL characters hyperref cannot take verbatim, percent-encoded first
+    URL_ENCODE = {'\\': '%5C', '{': '%7B', '}': '%7D'}
+
     def escape_text(self, text):
         """Escape special LaTeX characters."""
-        # Special characters that need escaping
-        text = text.replace('\\', r'\textbackslash{}')
-        text = text.replace('&', r'\&')
-        text = text.replace('%', r'\%')
-        text = text.replace('$', r'\$')
-        text = text.replace('#', r'\#')
-        text = text.replace('_', r'\_')
-        text = text.replace('{', r'\{')
-        text = text.replace('}', r'\}')
-        text = text.replace('~', r'\textasciitilde{}')
-        text = text.replace('^', r'\textasciicircum{}')
-        return text
-    
-    def process_inline_formatting(self, text):
-        """Process inline markdown formatting (bold, italic, code)."""
-        # Don't process if we're in a code block
-        if self.in_code_block:
-            return text
-        
-        # Handle inline code first (to avoid processing markdown inside code)
-        text = re.sub(r'`([^`]+)`', r'\\texttt{\1}', text)
-        
-        # Handle bold (**text**)
-        text = re.sub(r'\*\*([^\*]+)\*\*', lambda m: r'\textbf{' + self.escape_text(m.group(1)) + '}', text)
-        
-        # Handle italic (*text* but not ** and not in middle of word)
-        text = re.sub(r'(?<!\*)\*(?!\*)([^\*]+)\*(?!\*)', lambda m: r'\emph{' + self.escape_text(m.group(1)) + '}', text)
-        
-        # Handle arrows
-        text = text.replace('→', r'$\rightarrow$')
-        text = text.replace('←', r'$\leftarrow$')
-        text = text.replace('↔', r'$\leftrightarrow$')
-        
-        # Handle special symbols
-        text = text.replace('×', r'$\times$')
-        text = text.replace('÷', r'$\div$')
-        text = text.replace('≤', r'$\leq$')
-        text = text.replace('≥', r'$\geq$')
-        text = text.replace('≠', r'$\neq$')
-        
-        return text
-    
-    def convert_line(self, line):
-        """Convert a single line of markdown to LaTeX."""
-        result = []
-        
-        # Handle code block delimiters
-        if line.strip().startswith('```'):
-            if not self.in_code_block:
-                self.in_code_block = True
-                # Check if language is specified
-                lang = line.strip()[3:].strip()
-                if lang:
-                    result.append(f'\\begin{{lstlisting}}[language={lang}]')
-                else:
-                    result.append(r'\begin{verbatim}')
-            else:
-                if '\\begin{lstlisting}' in str(result):
-                    result.append(r'\end{lstlisting}')
-                else:
-                    result.append(r'\end{verbatim}')
-                self.in_code_block = False
-            return result
-        
-        # If in code block, return line as-is
-        if self.in_code_block:
-            return [line]
-        
-        # Handle headings
-        if line.startswith('# '):
-            title = line[2:].strip().replace('*', '')
-            return [f'\\section{{{self.escape_text(title)}}}', '']
-        elif line.startswith('## '):
-            title = line[3:].strip()
-            return [f'\\subsection{{{self.escape_text(title)}}}', '']
-        elif line.startswith('### '):
-            title = line[4:].strip()
-            return [f'\\subsubsection{{{self.escape_text(title)}}}', '']
-        elif line.startswith('#### '):
-            title = line[5:].strip()
-            return [f'\\paragraph{{{self.escape_text(title)}}}', '']
-        
-        # Handle author line (e.g., *By Dr. Isuru Nawinne*)
-        if re.match(r'^\*By [^\*]+\*$', line.strip()):
-            author = line.strip()[1:-1]
-            return [f'\\emph{{{self.escape_text(author)}}}', '']
-        
-        # Handle images
-        img_match = re.search(r'<img src="([^"]+)"[^>]*alt="([^"]+)"[^>]*>', line)
-        if img_match:
-            img_path = img_match.group(1)
-            caption = img_match.group(2)
-            return [
-                r'\begin{figure}[h]',
-                r'\centering',
-                f'\\includegraphics[width=0.7\\textwidth]{{{img_path}}}',
-                f'\\caption{{{self.escape_text(caption)}}}',
-                r'\end{figure}',
-                ''
-            ]
-        
-        # Handle lists
-        if line.strip().startswith('- '):
-            if not self.in_list:
-                result.append(r'\begin{itemize}')
-                self.in_list = True
-            item_text = line.strip()[2:]
-            processed_text = self.process_inline_formatting(item_text)
-            result.append(f'\\item {processed_text}')
-            return result
-        elif line.strip().startswith(('1. ', '2. ', '3. ', '4. ', '5. ', '6. ', '7. ', '8. ', '9. ')):
-            # Numbered list
-            if not self.in_list or 'enumerate' not in str(self.list_stack):
-                if self.in_list:
-                    result.append(r'\end{itemize}')
-                result.append(r'\begin{enumerate}')
-                self.in_list = True
-                self.list_stack.append('enumerate')
-            item_text = re.sub(r'^\d+\.\s+', '', line.strip())
-            processed_text = self.process_inline_formatting(item_text)
-            result.append(f'\\item {processed_text}')
-            return result
-        else:
-            # Not a list item, close list if open
-            if self.in_list:
-                if self.list_stack and self.list_stack[-1] == 'enumerate':
-                    result.append(r'\end{enumerate}')
-                    self.list_stack.pop()
-                else:
-                    result.append(r'\end{itemize}')
-                result.append('')
-                self.in_list = False
-        
-        # Handle horizontal rules
-        if line.strip() in ['---', '***', '___']:
-            return [r'\hrule', '']
-        
-        # Handle blank lines
-        if not line.strip():
-            return ['']
-        
-        # Handle regular text paragraphs
-        processed_line = self.process_inline_formatting(line)
-        result.append(processed_line)
-        
-        return result
-    
+        # One pass, so the braces of \textbackslash{} are not escaped again
+        return self.SPECIAL_CHARS_RE.sub(lambda m: self.SPECIAL_CHARS[m.group(0)], text)
+
+    def graphics_path(self, src):
+        """The \\includegraphics argument for an image src, relative to Lectures/latex."""
+        path = unquote(src)
+        if path.startswith(self.IMG_SRC_PREFIX):
+            path = 'img/' + path[len(self.IMG_SRC_PREFIX):]
+        if self.SAFE_PATH_RE.fullmatch(path):
+            return path
+        return f'\\detokenize{{{path}}}'
+
+    def escape_url(self, url):
+        """Escape a URL for \\href."""
+        for char, encoded in self.URL_ENCODE.items():
+            url = url.replace(char, encoded)
+        return url.replace('%', r'\%').replace('#', r'\#')
+
+    def process_text(self, text):
+        """Escape plain text and map Unicode symbols to math mode."""
+        return self.SYMBOL_RE.sub(lambda m: self.SYMBOLS[m.group(0)], self.escape_text(text))
+
     def convert(self, markdown_text):
         """Convert entire markdown document to LaTeX."""
-        lines = markdown_text.split('\n')
-        latex_lines = []
-        
-        for line in lines:
-            converted = self.convert_line(line)
-            latex_lines.extend(converted)
-        
-        # Close any open environments
-        if self.in_list:
-            if self.list_stack and self.list_stack[-1] == 'enumerate':
-                latex_lines.append(r'\end{enumerate}')
-            else:
-                latex_lines.append(r'\end{itemize}')
-        if self.in_code_block:
-            latex_lines.append(r'\end{verbatim}')
-        
-        return '\n'.join(latex_lines)
-
-
-def main():
-    """Convert all markdown lectures to LaTeX."""
-    # Ensure output directory exists
+        return self.render(markdown_engine.parse_markdown(markdown_text))
+
+    def render(self, doc):
+        """Render a parsed document tree to LaTeX."""
+        return '\n\n'.join(filter(None, (self.render_block(node) for node in doc['children']))) + '\n'
+
+    def render_block(self, node):
+        return getattr(self, 'render_' + node['type'])(node)
+
+    def render_blocks(self, nodes):
+        return '\n\n'.join(filter(None, (self.render_block(node) for node in nodes)))
+
+    def render_heading(self, node):
+        command = self.HEADING_COMMANDS.get(node['level'], 'paragraph')
+        children = node['children']
+        if node['level'] == 1:
+            # Lecture titles are set plain, without emphasis
+            children = [{'type': 'text', 'text': markdown_engine.inline_text(children)}]
+        return f'\\{command}{{{self.render_inline(children)}}}'
+
+    def render_paragraph(self, node):
+        return self.render_inline(node['children'])
+
+    def render_hr(self, node):
+        return r'\hrule'
+
+    def render_code(self, node):
+        lang = self.LISTINGS_LANGUAGES.get(node['lang'].lower())
+        if lang:
+            return f'\\begin{{lstlisting}}[language={lang}]\n{node["text"]}\n\\end{{lstlisting}}'
+        return f'\\begin{{verbatim}}\n{node["text"]}\n\\end{{verbatim}}'
+
+    def render_math(self, node):
+        text = node['text'].strip()
+        if not node['display']:
+            return f'${text}$'
+        # Environments such as align* provide their own display math
+        if text.startswith('\\begin{'):
+            return text
+        return f'\\[\n{text}\n\\]'
+
+    def render_blockquote(self, node):
+        return f'\\begin{{quote}}\n{self.render_blocks(node["children"])}\n\\end{{quote}}'
+
+    def render_list(self, node):
+        env = 'enumerate' if node['ordered'] else 'itemize'
+        lines = [f'\\begin{{{env}}}']
+        if node['ordered'] and node.get('start', 1) != 1:
+            lines.append(f'\\setcounter{{enumi}}{{{node["start"] - 1}}}')
+        for item in node['items']:
+            lines.append(f'\\item {self.render_blocks(item)}'.rstrip())
+        lines.append(f'\\end{{{env}}}')
+        return '\n'.join(lines)
+
+    def render_table(self, node):
+        spec = ''.join({'center': 'c', 'right': 'r'}.get(a, 'l') for a in node['align'])
+        lines = [r'\begin{center}', f'\\begin{{tabular}}{{{spec}}}', r'\hline']
+        lines.append(' & '.join(self.render_inline(c) for c in node['header']) + r' \\')
+        lines.append(r'\hline')
+        for row in node['rows']:
+            lines.append(' & '.join(self.render_inline(c) for c in row) + r' \\')
+        lines += [r'\hline', r'\end{tabular}', r'\end{center}']
+        return '\n'.join(lines)
+
+    def render_html(self, node):
+        # Only images carry content worth keeping from raw HTML
+        return '\n\n'.join(self.render_figure(dict(self.IMG_ATTR_RE.findall(tag)))
+                           for tag in self.IMG_TAG_RE.findall(node['text']))
+
+    def render_figure(self, attrs):
+        src = attrs.get('src', '')
+        if not src:
+            return ''
+        lines = [
+            r'\begin{figure}[h]',
+            r'\centering',
+            f'\\includegraphics[width=0.7\\textwidth]{{{self.graphics_path(src)}}}',
+        ]
+        if attrs.get('alt'):
+            lines.append(f'\\caption{{{self.process_text(attrs["alt"])}}}')
+        lines.append(r'\end{figure}')
+        return '\n'.join(lines)
+
+    def render_inline(self, nodes):
+        parts = []
+        for node in nodes:
+            kind = node['type']
+            if kind == 'text':
+                parts.append(self.process_text(node['text']))
+            elif kind == 'strong':
+                parts.append(f'\\textbf{{{self.render_inline(node["children"])}}}')
+            elif kind == 'em':
+                parts.append(f'\\emph{{{self.render_inline(node["children"])}}}')
+            elif kind == 'strong_em':
+                parts.append(f'\\textbf{{\\emph{{{self.render_inline(node["children"])}}}}}')
+            elif kind == 'code':
+                parts.append(f'\\texttt{{{self.escape_text(node["text"])}}}')
+            elif kind == 'link':
+                parts.append(f'\\href{{{self.escape_url(node["href"])}}}{{{self.render_inline(node["children"])}}}')
+            elif kind == 'image':
+                parts.append(self.render_figure({'src': node['src'], 'alt': node['alt']}))
+            elif kind == 'math':
+                parts.append(self.render_math(dict(node, display=False)))
+            elif kind == 'html':
+                parts.append(self.render_html(node))
+        return ''.join(parts)
+
+
+def convert_lecture_file(md_file):
+    """Render one lecture to LaTeX; runs in a worker process when --jobs > 1."""
+    with build_trace.span('convert to latex', 'latex', file=Path(md_file).name):
+        # Load the parsed markdown (shared with the HTML build)
+        doc = load_document(md_file)
+        return MarkdownToLatexConverter().render(doc)
+
+
+def get_converter_hash():
+    """Hash the code that shapes every .tex file, so converter edits regenerate all lectures."""
+    source = inspect.getsource(MarkdownToLatexConverter) + inspect.getsource(markdown_engine)
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+# Why a lecture-NN.tex file is not regenerated
+HAND_EDITED = 'does not match the last generated version (delete it or use --force to regenerate it)'
+
+
+def source_key(md_file, converter_hash):
+    return hashlib.sha256(md_file.read_bytes() + converter_hash.encode('ascii')).hexdigest()
+
+
+def output_hash(latex_file):
+    try:
+        return hashlib.sha256(latex_file.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def hand_edited(latex_file, entry):
+    """Whether latex_file exists and is not what the build last wrote there (entry is its manifest record)."""
+    return latex_file.exists() and (entry or {}).get('output') != output_hash(latex_file)
+
+
+def record_output(latex_file, md_file=None):
+    """Record latex_file's current content as generated (from md_file, when given)."""
+    manifest = load_manifest(MANIFEST_FILE)
+    entry = dict(manifest.get(latex_file.name, {}))
+    if md_file is not None:
+        entry.update(source=md_file.name, key=source_key(md_file, get_converter_hash()))
+    entry['output'] = output_hash(latex_file)
+    if manifest.get(latex_file.name) != entry:
+        manifest[latex_file.name] = entry
+        save_manifest(MANIFEST_FILE, manifest)
+
+
+def update_latex_files(force=False, jobs=1):
+    """
+    Regenerate the lecture-NN.tex files whose markdown changed.
+
+    A .tex file that differs from what this function (or build_site.py)
+    last wrote - a curated file that was never generated, or one edited by
+    hand since - is left alone, with a warning whenever its markdown
+    changes; delete it or use force to regenerate it. Returns the lecture numbers
+    whose .tex content actually changed, so callers (see build_pdf.py)
+    only recompile what is new.
+    """
     LATEX_DIR.mkdir(parents=True, exist_ok=True)
-    
-    print(f"Converting {len(LECTURE_ORDER)} lectures to LaTeX...")
-    print(f"Input: {MARKDOWN_DIR}")
-    print(f"Output: {LATEX_DIR}\n")
-    
+    manifest = {} if force else load_manifest(MANIFEST_FILE)
+    new_manifest = {}
+    converter_hash = get_converter_hash()
+
+    lectures = []
     for idx, filename in enumerate(LECTURE_ORDER, 1):
-        print(f"[{idx:2d}/20] Processing: {filename}")
-        
-        # Read markdown file
         md_file = MARKDOWN_DIR / filename
         if not md_file.exists():
             print(f"  ⚠️  File not found: {filename}")
             continue
-        
-        with open(md_file, 'r', encoding='utf-8') as f:
-            markdown_content = f.read()
-        
-        # Convert to LaTeX
-        converter = MarkdownToLatexConverter()
-        latex_content = converter.convert(markdown_content)
-        
-        # Write LaTeX file
+
+        # Skip lectures whose source is unchanged since the last run
         latex_file = LATEX_DIR / f"lecture-{idx:02d}.tex"
-        with open(latex_file, 'w', encoding='utf-8') as f:
-            f.write(latex_content)
-        
-        print(f"         → Created: lecture-{idx:02d}.tex")
-    
-    print(f"\n✅ Successfully created all 20 LaTeX files in {LATEX_DIR}")
+        key = source_key(md_file, converter_hash)
+        previous = manifest.get(latex_file.name)
+        if previous and previous.get('key') == key and latex_file.exists():
+            new_manifest[latex_file.name] = previous
+            continue
+        new_manifest[latex_file.name] = {'source': filename, 'key': key}
+        if not force and hand_edited(latex_file, previous):
+            # Warned once per markdown change; the new key keeps it quiet until the next one
+            print(f"  ⚠️  Keeping {latex_file.name}: it {HAND_EDITED}")
+            continue
+
+        print(f"[{idx:2d}/20] Processing: {filename}")
+        lectures.append((idx, md_file, latex_file))
+
+    # Convert to LaTeX (in parallel with --jobs); results come back in lecture order
+    results = map_ordered(convert_lecture_file, [md_file for _, md_file, _ in lectures], jobs)
+
+    changed = []
+    for (idx, _, latex_file), latex_content in zip(lectures, results):
+        # Leave identical files alone so their mtimes (and PDF parts) stay valid
+        if not (latex_file.exists() and latex_file.read_text(encoding='utf-8') == latex_content):
+            with open(latex_file, 'w', encoding='utf-8') as f:
+                f.write(latex_content)
+            changed.append(idx)
+            print(f"         → Created: {latex_file.name}")
+        new_manifest[latex_file.name]['output'] = output_hash(latex_file)
+
+    if new_manifest != manifest:
+        save_manifest(MANIFEST_FILE, new_manifest)
+    return changed
+
+
+def main(argv=None):
+    """Convert all markdown lectures to LaTeX."""
+    parser = argparse.ArgumentParser(description='Convert lecture markdown files to LaTeX.')
+    parser.add_argument('--force', action='store_true',
+                        help='reconvert every lecture even if its markdown is unchanged')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='convert lectures in N worker processes (0 = one per CPU)')
+    args = parser.parse_args(argv)
+
+    print(f"Converting {len(LECTURE_ORDER)} lectures to LaTeX...")
+    print(f"Input: {MARKDOWN_DIR}")
+    print(f"Output: {LATEX_DIR}\n")
+
+    changed = update_latex_files(args.force, args.jobs)
+
+    if changed:
+        print(f"\n✅ Updated {len(changed)} LaTeX files in {LATEX_DIR}")
+    else:
+        print(f"\n✅ All LaTeX files in {LATEX_DIR} are up to date")
+    print(format_stats())
 
 
 if __name__ == '__main__':
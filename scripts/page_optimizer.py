@@ -0,0 +1,300 @@
+"""
+Post-processing for the generated lecture pages: critical CSS and minification.
+
+optimize_page() takes a finished page from create_lecture_html() and
+
+- inlines the rules of assets/css/style.css that the first screen of the
+  page uses (the header, the video thumbnail and the start of the notes)
+  in a <style> block, and loads the full stylesheet without blocking
+  rendering (preload, switched to a stylesheet once loaded; a <noscript>
+  link covers browsers without JavaScript);
+- minifies the HTML: comments are dropped, whitespace runs collapse to a
+  single newline if they span lines and to a single space otherwise, and
+  spaces next to block-level tags are removed. Keeping the line breaks
+  costs a byte per line and keeps the pages readable, with line numbers
+  that mean something (lint_lectures.py reports findings by line).
+  <pre>, <textarea>, <script> and <style> contents are kept byte for byte.
+
+With the critical CSS inline, the first paint needs only the HTML document.
+
+iter_optimized_page() does the same to a page given as a stream of chunks
+and yields the result as it goes: only the first screen of the page is
+buffered (to pick the critical CSS), and the minifier flushes its output
+at every block-level tag, so pages of any size are optimized in a bounded
+amount of memory.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+STYLESHEET = ROOT_DIR / 'assets' / 'css' / 'style.css'
+
+# How much of the page body counts as above the fold, in characters of HTML
+# from the start of the content (the video thumbnail plus the first notes)
+FOLD_CHARS = 4500
+
+# Interaction states are not needed for the first paint
+INTERACTIVE_PSEUDO_RE = re.compile(r':(?:hover|focus|focus-within|focus-visible|active|visited)\b')
+PSEUDO_RE = re.compile(r'::?[a-zA-Z-]+(?:\([^)]*\))?')
+ATTRIBUTE_RE = re.compile(r'\[[^\]]*\]')
+COMPOUND_RE = re.compile(r'[^\s>+~]+')
+SIMPLE_RE = re.compile(r'([.#]?)([a-zA-Z_][\w-]*)')
+
+TAG_RE = re.compile(r'<([a-zA-Z][\w-]*)([^>]*)>')
+CLASS_ATTR_RE = re.compile(r'\bclass\s*=\s*"([^"]*)"')
+ID_ATTR_RE = re.compile(r'\bid\s*=\s*"([^"]*)"')
+
+BLOCK_TAGS = ('html|head|body|meta|link|title|style|script|noscript|header|main|footer|nav|section|'
+              'article|aside|div|p|h[1-6]|ul|ol|li|dl|dt|dd|table|thead|tbody|tfoot|tr|th|td|'
+              'caption|colgroup|col|blockquote|figure|figcaption|hr|br|pre|form|source')
+WHITESPACE_RE = re.compile(r'\s+')
+# Whitespace is already collapsed when these run, so only a single space is dropped
+BLOCK_TAG_BEFORE_RE = re.compile(rf' (</?(?:{BLOCK_TAGS})\b)', re.IGNORECASE)
+BLOCK_TAG_AFTER_RE = re.compile(rf'(</?(?:{BLOCK_TAGS})\b[^>]*>) ', re.IGNORECASE)
+BLOCK_TAG_RE = re.compile(rf'</?(?:{BLOCK_TAGS})\b', re.IGNORECASE)
+PRESERVE_OPEN_RE = re.compile(r'<(?:pre|textarea|script|style)\b', re.IGNORECASE)
+PRESERVE_RE = re.compile(r'(<(pre|textarea|script|style)\b[^>]*>.*?</\2>)', re.IGNORECASE | re.DOTALL)
+COMMENT_RE = re.compile(r'<!--(?!\[if).*?-->', re.DOTALL)
+
+
+def strip_css_comments(css):
+    return re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+
+
+def parse_css(css):
+    """
+    Split a stylesheet into (prelude, body) pairs.
+
+    For ordinary rules the body is the declaration block; for @media and
+    @supports it is the list of nested rules; for other at-rules (such as
+    @keyframes and @font-face) it is the raw block text.
+    """
+    rules = []
+    pos = 0
+    css = strip_css_comments(css)
+    while True:
+        start = css.find('{', pos)
+        if start == -1:
+            break
+        prelude = css[pos:start].strip()
+        depth, end = 1, start + 1
+        while depth and end < len(css):
+            depth += {'{': 1, '}': -1}.get(css[end], 0)
+            end += 1
+        block = css[start + 1:end - 1]
+        if prelude.startswith(('@media', '@supports')):
+            rules.append((prelude, parse_css(block)))
+        else:
+            rules.append((prelude, block.strip()))
+        pos = end
+    return rules
+
+
+def used_names(html):
+    """The tags, classes and ids an HTML fragment uses."""
+    tags, classes, ids = {'html', 'body'}, set(), set()
+    for match in TAG_RE.finditer(html):
+        tags.add(match.group(1).lower())
+        attrs = match.group(2)
+        class_attr = CLASS_ATTR_RE.search(attrs)
+        if class_attr:
+            classes.update(class_attr.group(1).split())
+        id_attr = ID_ATTR_RE.search(attrs)
+        if id_attr:
+            ids.add(id_attr.group(1))
+    return tags, classes, ids
+
+
+def selector_matches(selector, names):
+    """Whether every compound of a selector only uses tags, classes and ids the page has."""
+    tags, classes, ids = names
+    if INTERACTIVE_PSEUDO_RE.search(selector):
+        return False
+    selector = ATTRIBUTE_RE.sub('', PSEUDO_RE.sub('', selector))
+    for compound in COMPOUND_RE.findall(selector):
+        for kind, name in SIMPLE_RE.findall(compound):
+            if kind == '.' and name not in classes:
+                return False
+            if kind == '#' and name not in ids:
+                return False
+            if not kind and name.lower() not in tags:
+                return False
+    return True
+
+
+def select_rules(rules, names):
+    """Serialize the rules that apply to a page with the given names."""
+    out = []
+    for prelude, body in rules:
+        if isinstance(body, list):
+            inner = select_rules(body, names)
+            if inner:
+                out.append(f'{prelude}{{{inner}}}')
+        elif prelude.startswith('@'):
+            if prelude.startswith(('@font-face', '@charset', '@import')):
+                out.append(f'{prelude}{{{body}}}')
+        else:
+            selectors = [s.strip() for s in prelude.split(',')]
+            kept = [s for s in selectors if selector_matches(s, names)]
+            if kept:
+                out.append(f'{",".join(kept)}{{{body}}}')
+    return ''.join(out)
+
+
+def keyframes_for(css, rules):
+    """The @keyframes blocks that the selected CSS refers to by name."""
+    out = []
+    for prelude, body in rules:
+        if isinstance(body, list):
+            out.append(keyframes_for(css, body))
+        elif prelude.startswith('@keyframes') and re.search(rf'\b{re.escape(prelude.split()[1])}\b', css):
+            out.append(f'{prelude}{{{body}}}')
+    return ''.join(out)
+
+
+def minify_css(css):
+    css = strip_css_comments(css)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r'(:)\s+', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+@lru_cache(maxsize=4)
+def _parsed_stylesheet(css):
+    return parse_css(css)
+
+
+def critical_css(html, css):
+    """The minified rules of css used by the first screen of a page."""
+    rules = _parsed_stylesheet(css)
+    selected = select_rules(rules, used_names(above_the_fold(html)))
+    return minify_css(selected + keyframes_for(selected, rules))
+
+
+def above_the_fold(html):
+    """The page up to FOLD_CHARS characters into its content."""
+    start = html.find('<div class="content-body">')
+    return html if start == -1 else html[:start + FOLD_CHARS]
+
+
+def collapse_whitespace(match):
+    return '\n' if '\n' in match.group() else ' '
+
+
+def minify_html(html):
+    """Collapse whitespace and drop comments, leaving preformatted and script content alone."""
+    return minify_fragment(html)
+
+
+def minify_fragment(html, first=True, last=True):
+    """
+    Minify one piece of a page.
+
+    Pieces other than the last must end just before a block-level tag (see
+    safe_cut()), where the space a whole-page minify would drop is dropped
+    too, so the pieces join up to exactly minify_html() of the page.
+    """
+    parts = PRESERVE_RE.split(html)
+    out = []
+    # split() with two groups yields: text, whole preserved element, tag name, text, ...
+    for i in range(0, len(parts), 3):
+        text = COMMENT_RE.sub('', parts[i])
+        text = WHITESPACE_RE.sub(collapse_whitespace, text)
+        text = BLOCK_TAG_BEFORE_RE.sub(r'\1', text)
+        text = BLOCK_TAG_AFTER_RE.sub(r'\1', text)
+        out.append(text)
+        if i + 1 < len(parts):
+            out.append(parts[i + 1])
+    html = ''.join(out)
+    if first:
+        html = html.lstrip()
+    return html.rstrip() + '\n' if last else html.rstrip(' ')
+
+
+def safe_cut(html):
+    """
+    Offset of the last block-level tag that html can be split before for
+    minifying, or 0 if there is none.
+
+    Tags inside a comment or a preserved element (even one whose end tag
+    has not arrived yet) are not split points.
+    """
+    start = 0
+    for match in PRESERVE_RE.finditer(html):
+        start = match.end()
+    tail = html[start:]
+    unclosed = PRESERVE_OPEN_RE.search(tail)
+    if unclosed:
+        tail = tail[:unclosed.start()]
+    comment = tail.rfind('<!--')
+    if comment > tail.rfind('-->'):
+        tail = tail[:comment]
+    cut = 0
+    for match in BLOCK_TAG_RE.finditer(tail):
+        cut = start + match.start()
+    return cut
+
+
+def iter_minified_html(chunks):
+    """Minify a page given as chunks, yielding output whenever a block-level tag comes by."""
+    pending = ''
+    first = True
+    for chunk in chunks:
+        pending += chunk
+        cut = safe_cut(pending)
+        if cut:
+            yield minify_fragment(pending[:cut], first, last=False)
+            pending, first = pending[cut:], False
+    yield minify_fragment(pending, first, last=True)
+
+
+def inline_critical_css(html, href, css):
+    """Replace the blocking stylesheet link with inline critical CSS and an async load."""
+    link = f'<link rel="stylesheet" href="{href}">'
+    if link not in html:
+        return html
+    replacement = (
+        f'<style>{critical_css(html, css)}</style>\n'
+        f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+        f'<noscript><link rel="stylesheet" href="{href}"></noscript>'
+    )
+    return html.replace(link, replacement, 1)
+
+
+def read_stylesheet():
+    return STYLESHEET.read_text(encoding='utf-8')
+
+
+def stylesheet_hash():
+    """Pages inline part of the stylesheet, so they depend on its content."""
+    return hashlib.sha256(STYLESHEET.read_bytes()).hexdigest()
+
+
+def iter_with_critical_css(chunks, href, css):
+    """Buffer a page's chunks up to the fold, inline its critical CSS there and pass the rest through."""
+    chunks = iter(chunks)
+    head = ''
+    for chunk in chunks:
+        head += chunk
+        start = head.find('<div class="content-body">')
+        if start != -1 and len(head) >= start + FOLD_CHARS:
+            break
+    yield inline_critical_css(head, href, css)
+    yield from chunks
+
+
+def iter_optimized_page(chunks, href='../../assets/css/style.css', css=None):
+    """Inline the critical CSS of a page given as chunks and minify it, yielding the result in pieces."""
+    if css is None:
+        css = read_stylesheet()
+    return iter_minified_html(iter_with_critical_css(chunks, href, css))
+
+
+def optimize_page(html, href='../../assets/css/style.css', css=None):
+    """Inline the critical CSS of a generated page and minify it."""
+    return ''.join(iter_optimized_page([html], href, css))
+
@@ -2,41 +2,453 @@
 """
 Simple local web server to preview the Lectures on Computer Architecture website before deployment.
 Run this script and open http://localhost:8000 in your browser.
+
+Requests are handled on separate threads over HTTP/1.1 keep-alive
+connections. Every file gets a strong ETag built from its modification time
+and size; browsers revalidate on each load and get a 304 Not Modified (with
+no body) until the file actually changes.
+
+Text files are sent compressed the way production serves them: the server
+negotiates Accept-Encoding and sends the .br or .gz sibling written by
+compress_assets.py (with Content-Encoding and Vary: Accept-Encoding) as
+long as it is newer than the file itself. Fingerprinted assets written by
+fingerprint_assets.py are sent with Cache-Control: immutable and a one-year
+max-age, so a reload makes no requests for them at all.
+
+With --watch, the server polls the lecture markdown, the stylesheets and
+the page templates. An edited lecture is re-rendered in memory (nothing is
+written to disk) and served in place of the file under Lectures/html, and
+open browsers are told to reload over Server-Sent Events. Stylesheet edits
+are swapped in without a full page reload. The service worker (see
+service_worker.py) is not served and is unregistered while watching, since
+it would answer reloads from its cache.
 """
 
+import argparse
+import hashlib
 import http.server
-import socketserver
-import webbrowser
+import importlib
 import os
+import sys
+import threading
+import time
+import webbrowser
+from functools import partial
+from http import HTTPStatus
+from pathlib import Path
+
+import compress_assets
+import fingerprint_assets
 
 PORT = 8000
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Watch mode: what to poll and how often
+WATCH_INTERVAL = 0.05
+MARKDOWN_DIR = ROOT_DIR / 'Lectures' / 'markdown'
+CSS_DIR = ROOT_DIR / 'assets' / 'css'
+TEMPLATE_FILES = [SCRIPTS_DIR / 'convert_lectures.py', SCRIPTS_DIR / 'markdown_engine.py',
+                  SCRIPTS_DIR / 'image_pipeline.py', ROOT_DIR / 'Lectures' / 'img' / 'variants' / 'manifest.json',
+                  SCRIPTS_DIR / 'vendor_assets.py', ROOT_DIR / 'assets' / 'vendor' / 'manifest.json',
+                  SCRIPTS_DIR / 'math_prerender.py', SCRIPTS_DIR / 'syntax_highlight.py',
+                  SCRIPTS_DIR / 'lecture_manifest.py', ROOT_DIR / 'Lectures' / 'lectures.json',
+                  SCRIPTS_DIR / 'page_optimizer.py', SCRIPTS_DIR / 'fingerprint_assets.py',
+                  ROOT_DIR / 'assets' / 'fingerprints.json', SCRIPTS_DIR / 'service_worker.py']
+# Re-imported in dependency order when a template file changes
+BUILD_MODULES = ['markdown_engine', 'document_cache', 'image_pipeline', 'syntax_highlight',
+                 'vendor_assets', 'fingerprint_assets', 'math_prerender', 'lecture_manifest', 'page_optimizer', 'search_index',
+                 'service_worker', 'convert_lectures']
+LIVERELOAD_PATH = '/__livereload'
+# Not served in watch mode: its cached pages would hide the rebuilt ones
+SERVICE_WORKER_PATH = '/sw.js'
+# For fingerprinted assets (name.<hash>.ext)
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+LIVERELOAD_SCRIPT = b"""<script>
+(function () {
+  if (navigator.serviceWorker) {
+    navigator.serviceWorker.getRegistrations().then(function (registrations) {
+      registrations.forEach(function (registration) { registration.unregister(); });
+    });
+  }
+  var source = new EventSource('/__livereload');
+  source.addEventListener('css', function () {
+    document.querySelectorAll('link[rel="stylesheet"]').forEach(function (link) {
+      var url = new URL(link.href);
+      url.searchParams.set('livereload', Date.now());
+      link.href = url.toString();
+    });
+  });
+  source.addEventListener('reload', function (event) {
+    if (event.data === '*' || event.data === location.pathname) {
+      location.reload();
+    }
+  });
+})();
+</script>
+"""
+
+
+def make_etag(stat_result):
+    """Strong validator from a file's mtime (ns) and size."""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def encoding_etag(etag, encoding):
+    """Distinct validator for a compressed representation of the same file."""
+    return etag if encoding is None else f'{etag[:-1]}-{encoding}"'
+
+
+def negotiate_encoding(accept_encoding, available):
+    """
+    Pick the content coding to send, or None for the uncompressed file.
+
+    Follows the q-values of an Accept-Encoding header; among equally
+    acceptable codings the earlier one in available wins.
+    """
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding] = q
+    best, best_q = None, 0.0
+    for coding in available:
+        q = weights.get(coding, weights.get('*', 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def etag_matches(if_none_match, etag):
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+# Pages compressed on the fly in watch mode, keyed by (ETag, encoding)
+_compressed_pages = {}
+_compressed_pages_lock = threading.Lock()
+MAX_COMPRESSED_PAGES = 64
+
+
+def compressed_page(etag, encoding, body):
+    key = (etag, encoding)
+    with _compressed_pages_lock:
+        cached = _compressed_pages.get(key)
+    if cached is None:
+        cached = compress_assets.compress(body, encoding)
+        with _compressed_pages_lock:
+            if len(_compressed_pages) >= MAX_COMPRESSED_PAGES:
+                _compressed_pages.clear()
+            _compressed_pages[key] = cached
+    return cached
+
+
+class LiveReloadState:
+    """Pages rebuilt in memory plus the event feed for connected browsers."""
+
+    def __init__(self):
+        self.pages = {}
+        self.events = []
+        self.condition = threading.Condition()
+
+    def get_page(self, url_path):
+        with self.condition:
+            return self.pages.get(url_path)
+
+    def publish(self, pages, event, data):
+        """Swap in rebuilt pages and notify browsers in one step."""
+        with self.condition:
+            self.pages.update(pages)
+            self.events.append((event, data))
+            self.condition.notify_all()
+
+    def wait_for_events(self, seen, timeout):
+        """Block until there are events past index seen; return them."""
+        with self.condition:
+            self.condition.wait_for(lambda: len(self.events) > seen, timeout=timeout)
+            return self.events[seen:]
+
+
+class LectureWatcher(threading.Thread):
+    """Poll source files and rebuild the affected lecture pages in memory."""
+
+    def __init__(self, state):
+        super().__init__(daemon=True)
+        self.state = state
+        self.snapshot = self.scan()
+
+    def scan(self):
+        snapshot = {}
+        for directory, pattern in ((MARKDOWN_DIR, '*.md'), (CSS_DIR, '*.css')):
+            for path in directory.glob(pattern):
+                snapshot[path] = path.stat().st_mtime_ns
+        for path in TEMPLATE_FILES:
+            if path.exists():
+                snapshot[path] = path.stat().st_mtime_ns
+        return snapshot
+
+    def run(self):
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            try:
+                self.check()
+            except Exception as e:
+                print(f"⚠️  Live rebuild failed: {e}")
+
+    def check(self):
+        snapshot = self.scan()
+        if snapshot == self.snapshot:
+            return
+        changed = {path for path in snapshot.keys() | self.snapshot.keys()
+                   if snapshot.get(path) != self.snapshot.get(path)}
+        added_or_removed = snapshot.keys() != self.snapshot.keys()
+        self.snapshot = snapshot
+        start = time.perf_counter()
+
+        if any(path in TEMPLATE_FILES for path in changed):
+            reload_build_modules()
+            self.rebuild(None)
+        elif added_or_removed and any(path.suffix == '.md' for path in changed):
+            # Lecture numbering and prev/next links may have shifted
+            self.rebuild(None)
+        elif any(path.suffix == '.md' for path in changed):
+            self.rebuild({path for path in changed if path.suffix == '.md'})
+
+        if any(path.suffix == '.css' for path in changed):
+            self.state.publish({}, 'css', '*')
+            print(f"🎨 Stylesheet changed ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    def rebuild(self, sources):
+        """Re-render the given lecture sources (or all of them) into memory."""
+        convert_lectures = sys.modules['convert_lectures']
+        lecture_manifest = sys.modules['lecture_manifest']
+        lectures = lecture_manifest.load_lectures()
+        start = time.perf_counter()
+        pages = {}
+        for i, lecture in enumerate(lectures):
+            lecture_file = lecture_manifest.source_path(lecture)
+            if sources is not None and lecture_file not in sources:
+                continue
+            job = convert_lectures.make_lecture_job(lectures, i, lecture_file.read_bytes())
+            url_path = f'/Lectures/html/{job["slug"]}.html'
+            pages[url_path] = convert_lectures.build_lecture_page(job)[0].encode('utf-8')
+        if not pages:
+            return
+        target = next(iter(pages)) if len(pages) == 1 else '*'
+        self.state.publish(pages, 'reload', target)
+        print(f"🔄 Rebuilt {len(pages)} page(s) in memory "
+              f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+
+def reload_build_modules():
+    """Re-import the converter so template edits take effect."""
+    for name in BUILD_MODULES:
+        if name in sys.modules:
+            importlib.reload(sys.modules[name])
+
 
 class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep connections open so a page's CSS, fonts and images share one socket
+    protocol_version = 'HTTP/1.1'
+
+    # Set in watch mode
+    livereload = None
+
+    def do_GET(self):
+        if self.livereload is not None:
+            url_path = self.path.split('?', 1)[0]
+            if url_path == LIVERELOAD_PATH:
+                self.send_event_stream()
+                return
+            if url_path == SERVICE_WORKER_PATH:
+                self.send_error(HTTPStatus.NOT_FOUND, 'No service worker while watching')
+                return
+            page = self.livereload.get_page(url_path)
+            if page is None and url_path.endswith(('.html', '/')):
+                page = self.read_html(url_path)
+            if page is not None:
+                self.send_html(page)
+                return
+        super().do_GET()
+
+    def read_html(self, url_path):
+        path = self.translate_path(url_path)
+        if os.path.isdir(path):
+            path = os.path.join(path, 'index.html')
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def send_html(self, page):
+        """Serve an HTML page with the live-reload client injected, compressed on the fly."""
+        body = page.replace(b'</body>', LIVERELOAD_SCRIPT + b'</body>', 1)
+        etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding'),
+                                      compress_assets.available_encodings())
+        self.etag = encoding_etag(etag, encoding)
+        self.vary = True
+        if etag_matches(self.headers.get('If-None-Match'), self.etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.end_headers()
+            return
+        if encoding is not None:
+            body = compressed_page(etag, encoding, body)
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        if encoding is not None:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_event_stream(self):
+        """Hold the connection open and forward reload events to the browser."""
+        self.etag = None
+        self.close_connection = True
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        seen = len(self.livereload.events)
+        try:
+            self.wfile.write(b'retry: 500\n\n')
+            self.wfile.flush()
+            while True:
+                events = self.livereload.wait_for_events(seen, timeout=15)
+                seen += len(events)
+                # A comment line doubles as a keep-alive ping
+                chunks = [f'event: {event}\ndata: {data}\n\n' for event, data in events] or [': ping\n\n']
+                self.wfile.write(''.join(chunks).encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def send_head(self):
+        self.etag = None
+        self.vary = False
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) and self.path.split('?', 1)[0].endswith('/'):
+            path = os.path.join(path, 'index.html')
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            stat_result = None
+
+        if stat_result is not None and os.path.isfile(path):
+            variant = None
+            if compress_assets.is_compressible(path):
+                self.vary = True
+                variant = self.find_variant(path, stat_result)
+            encoding = variant[0] if variant else None
+            self.etag = encoding_etag(make_etag(variant[2] if variant else stat_result), encoding)
+            if etag_matches(self.headers.get('If-None-Match'), self.etag):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.end_headers()
+                return None
+            if variant:
+                return self.send_variant(path, *variant)
+        return super().send_head()
+
+    def find_variant(self, path, stat_result):
+        """The best precompressed sibling the client accepts, if it is up to date."""
+        present = {}
+        for encoding, suffix in compress_assets.ENCODINGS.items():
+            try:
+                sibling_stat = os.stat(path + suffix)
+            except OSError:
+                continue
+            # A sibling older than the file is stale (the file was edited since)
+            if sibling_stat.st_mtime_ns >= stat_result.st_mtime_ns:
+                present[encoding] = (path + suffix, sibling_stat)
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding'), list(present))
+        return (encoding, *present[encoding]) if encoding else None
+
+    def send_variant(self, path, encoding, variant_path, variant_stat):
+        try:
+            f = open(variant_path, 'rb')
+        except OSError:
+            return super().send_head()
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', self.guess_type(path))
+        self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(variant_stat.st_size))
+        self.send_header('Last-Modified', self.date_time_string(variant_stat.st_mtime))
+        self.end_headers()
+        return f
+
     def end_headers(self):
-        # Add headers to prevent caching during development
-        self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate')
-        self.send_header('Expires', '0')
+        # Fingerprinted files never change under their name; everything else is
+        # revalidated, with the ETag turning unchanged files into 304s
+        if getattr(self, 'etag', None):
+            self.send_header('ETag', self.etag)
+        if getattr(self, 'vary', False):
+            self.send_header('Vary', 'Accept-Encoding')
+        if fingerprint_assets.HASHED_NAME_RE.search(self.path.split('?', 1)[0]):
+            self.send_header('Cache-Control', IMMUTABLE_CACHE_CONTROL)
+        else:
+            self.send_header('Cache-Control', 'no-cache')
         super().end_headers()
 
+
+class PreviewServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
 def main():
-    # Change to the project directory
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    
+    parser = argparse.ArgumentParser(description='Serve the website locally for preview.')
+    parser.add_argument('--port', type=int, default=PORT, help=f'port to listen on (default {PORT})')
+    parser.add_argument('--no-browser', action='store_true', help='do not open a browser window')
+    parser.add_argument('--watch', action='store_true',
+                        help='rebuild edited lectures in memory and live-reload open pages')
+    args = parser.parse_args()
+    port = args.port
+
     print("=" * 60)
     print("Lectures on Computer Architecture — Local Preview Server")
     print("=" * 60)
-    print(f"\n🌐 Starting server at http://localhost:{PORT}")
+    print(f"\n🌐 Starting server at http://localhost:{port}")
     print("\n📱 Preview your website:")
-    print(f"   • Main page: http://localhost:{PORT}/")
-    print(f"   • Lecture 1: http://localhost:{PORT}/lectures/lecture-01.html")
+    print(f"   • Main page: http://localhost:{port}/")
+    print(f"   • Lecture 1: http://localhost:{port}/Lectures/html/lecture-01.html")
+    if args.watch:
+        print("\n👀 Watching Lectures/markdown, assets/css and the page templates")
     print("\n💡 Press Ctrl+C to stop the server\n")
     print("=" * 60)
-    
-    # Open browser automatically
-    webbrowser.open(f'http://localhost:{PORT}/')
-    
+
+    if args.watch:
+        # The converter lives next to this script
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        importlib.import_module('convert_lectures')
+        MyHTTPRequestHandler.livereload = LiveReloadState()
+        LectureWatcher(MyHTTPRequestHandler.livereload).start()
+
+    # Serve the project root regardless of the working directory
+    handler = partial(MyHTTPRequestHandler, directory=str(ROOT_DIR))
+
     # Start server
-    with socketserver.TCPServer(("", PORT), MyHTTPRequestHandler) as httpd:
+    with PreviewServer(("", port), handler) as httpd:
+        # Open browser automatically
+        if not args.no_browser:
+            webbrowser.open(f'http://localhost:{port}/')
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
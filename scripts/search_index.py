@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Build the client-side search index for the lecture pages.
+
+The index is an inverted index over every lecture section (a heading and
+the paragraphs, list items and table cells under it), written to
+assets/search/ for assets/js/search.js:
+
+- index.json lists the lectures, the sections ("docs": lecture, heading,
+  heading length and length in tokens) and the shard names.
+- shards/<prefix>.bin holds the postings of every term starting with
+  <prefix>, so a query only downloads the shards of its own terms.
+
+Terms are lowercase ASCII words. Inside a shard the terms are sorted and
+front-coded (bytes shared with the previous term, then the rest), and
+each term's postings list the sections it occurs in and its token
+positions there (heading tokens come first). Section numbers and
+positions are delta-encoded, and every integer is an unsigned LEB128
+varint:
+
+    shard    := count(terms) term*
+    term     := shared suffix_length suffix_bytes postings_length postings
+    postings := count(docs) (doc_delta count(positions) position_delta*)*
+
+convert_lectures.py extracts the sections of each page it renders and
+caches them in .cache/search/, so the index is merged from the cache and
+only the shards whose bytes changed are rewritten.
+
+Usage:
+    python scripts/search_index.py    # rebuild the index for every lecture
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+import lecture_manifest
+import markdown_engine
+from document_cache import load_document
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SEARCH_DIR = ROOT_DIR / 'assets' / 'search'
+SHARD_DIR = SEARCH_DIR / 'shards'
+INDEX_FILE = SEARCH_DIR / 'index.json'
+CACHE_DIR = ROOT_DIR / '.cache' / 'search'
+
+# Terms are sharded on their first two characters (search.js mirrors this)
+SHARD_PREFIX_LENGTH = 2
+INDEX_VERSION = 1
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+COMBINING_RE = re.compile('[\u0300-\u036f]')
+SHARD_CHARS = set('abcdefghijklmnopqrstuvwxyz0123456789')
+
+
+def tokenize(text):
+    """Lowercase ASCII words, with accents folded (search.js tokenizes queries the same way)."""
+    return TOKEN_RE.findall(COMBINING_RE.sub('', unicodedata.normalize('NFKD', text.lower())))
+
+
+def block_text(node):
+    """Searchable text of one block; headings are handled by the caller."""
+    if node['type'] == 'paragraph':
+        return markdown_engine.inline_text(node['children'])
+    if node['type'] == 'table':
+        return ' '.join(markdown_engine.inline_text(cell) for row in [node['header']] + node['rows'] for cell in row)
+    return ''
+
+
+def document_sections(doc, title):
+    """
+    Split a parsed lecture into sections, one per heading below the title.
+
+    Returns a list of {'heading', 'level', 'heading_len', 'tokens'}; text
+    before the first heading belongs to a section headed by the title.
+    """
+    sections = [{'heading': title, 'level': 1, 'tokens': tokenize(title)}]
+    sections[0]['heading_len'] = len(sections[0]['tokens'])
+    body = []
+    for node in markdown_engine.walk_blocks(doc['children']):
+        if node['type'] == 'heading':
+            if node['level'] == 1:
+                continue
+            sections[-1]['tokens'] += body
+            heading = ' '.join(markdown_engine.inline_text(node['children']).split())
+            tokens = tokenize(heading)
+            sections.append({'heading': heading, 'level': node['level'],
+                             'heading_len': len(tokens), 'tokens': tokens})
+            body = []
+        else:
+            body += tokenize(block_text(node))
+    sections[-1]['tokens'] += body
+    # Keep empty sections out of the index (e.g. a heading right before a subheading)
+    return [section for section in sections if len(section['tokens']) > section['heading_len']
+            or section is sections[0]]
+
+
+def sections_key(md_bytes, title):
+    """Cache key for the sections of one lecture."""
+    h = hashlib.sha256(inspect.getsource(sys.modules[__name__]).encode('utf-8'))
+    h.update(md_bytes)
+    h.update(f'\0{title}'.encode('utf-8'))
+    return h.hexdigest()
+
+
+def cache_file(lecture_num):
+    return CACHE_DIR / f'lecture-{lecture_num:02d}.json'
+
+
+def load_sections(lecture_num, key):
+    """Cached sections for a lecture, or None if they are missing or stale."""
+    try:
+        with open(cache_file(lecture_num), 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached['sections'] if cached.get('key') == key else None
+
+
+def save_sections(lecture_num, key, sections):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = cache_file(lecture_num)
+    tmp_file = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'key': key, 'sections': sections}, f, separators=(',', ':'))
+    os.replace(tmp_file, path)
+
+
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def encode_postings(postings):
+    """postings: [(doc, [positions...]), ...] sorted by doc."""
+    out = bytearray()
+    write_varint(out, len(postings))
+    previous_doc = 0
+    for doc, positions in postings:
+        write_varint(out, doc - previous_doc)
+        previous_doc = doc
+        write_varint(out, len(positions))
+        previous = 0
+        for position in positions:
+            write_varint(out, position - previous)
+            previous = position
+    return bytes(out)
+
+
+def encode_shard(terms):
+    """terms: {term: postings}; returns the shard bytes."""
+    out = bytearray()
+    write_varint(out, len(terms))
+    previous = b''
+    for term in sorted(terms):
+        encoded = term.encode('utf-8')
+        shared = 0
+        while shared < min(len(encoded), len(previous)) and encoded[shared] == previous[shared]:
+            shared += 1
+        write_varint(out, shared)
+        write_varint(out, len(encoded) - shared)
+        out += encoded[shared:]
+        postings = encode_postings(terms[term])
+        write_varint(out, len(postings))
+        out += postings
+        previous = encoded
+    return bytes(out)
+
+
+def shard_name(term):
+    """The shard a term lives in: its first characters, padded with '_'."""
+    prefix = term[:SHARD_PREFIX_LENGTH]
+    return ''.join(ch if ch in SHARD_CHARS else '_' for ch in prefix).ljust(SHARD_PREFIX_LENGTH, '_')
+
+
+def build_index(lectures):
+    """
+    Build the index files from [(lecture_num, title, url, sections), ...].
+
+    Returns {path relative to SEARCH_DIR: bytes}.
+    """
+    docs = []
+    postings = {}
+    for lecture_index, (_, _, _, sections) in enumerate(lectures):
+        for section in sections:
+            doc = len(docs)
+            docs.append([lecture_index, section['heading'], section['heading_len'], len(section['tokens'])])
+            positions = {}
+            for position, token in enumerate(section['tokens']):
+                positions.setdefault(token, []).append(position)
+            for token, token_positions in positions.items():
+                postings.setdefault(token, []).append((doc, token_positions))
+
+    shards = {}
+    for term, term_postings in postings.items():
+        shards.setdefault(shard_name(term), {})[term] = term_postings
+
+    files = {f'shards/{name}.bin': encode_shard(terms) for name, terms in shards.items()}
+    index = {
+        'version': INDEX_VERSION,
+        'prefix': SHARD_PREFIX_LENGTH,
+        'lectures': [[num, title, url] for num, title, url, _ in lectures],
+        'docs': docs,
+        'shards': sorted(shards),
+    }
+    files['index.json'] = json.dumps(index, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return files
+
+
+def write_index(lectures):
+    """Write the index, touching only changed files; returns how many files were written."""
+    files = build_index(lectures)
+    written = 0
+    for name, data in files.items():
+        path = SEARCH_DIR / name
+        try:
+            if path.read_bytes() == data:
+                continue
+        except OSError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        written += 1
+
+    # Drop shards whose terms are gone
+    for path in SHARD_DIR.glob('*.bin'):
+        if f'shards/{path.name}' not in files:
+            path.unlink()
+            written += 1
+    return written
+
+
+def update_index(entries):
+    """
+    Refresh the search index after a page build.
+
+    entries are (lecture_num, title, url, md_file, md_bytes, sections) for
+    every lecture, where sections is None for pages that were not rebuilt;
+    those come from the cache, or from the parsed document if not cached.
+    """
+    lectures = []
+    for lecture_num, title, url, md_file, md_bytes, sections in entries:
+        key = sections_key(md_bytes, title)
+        if sections is None:
+            sections = load_sections(lecture_num, key)
+            if sections is None:
+                sections = document_sections(load_document(md_file, md_bytes), title)
+                save_sections(lecture_num, key, sections)
+        else:
+            save_sections(lecture_num, key, sections)
+        lectures.append((lecture_num, title, url, sections))
+    return write_index(lectures)
+
+
+def lecture_entries():
+    """update_index() entries for every lecture of the manifest, with no sections rendered yet."""
+    entries = []
+    for lecture in lecture_manifest.load_lectures():
+        md_file = lecture_manifest.source_path(lecture)
+        entries.append((lecture['number'], lecture_manifest.page_title(lecture),
+                        f"Lectures/html/{lecture['slug']}.html", md_file, md_file.read_bytes(), None))
+    return entries
+
+
+def main():
+    written = update_index(lecture_entries())
+
+    shards = list(SHARD_DIR.glob('*.bin'))
+    total = sum(path.stat().st_size for path in shards)
+    print(f"✅ Search index: {len(shards)} shards, {total / 1024:.1f} KB "
+          f"(largest {max(path.stat().st_size for path in shards) / 1024:.1f} KB), "
+          f"index.json {INDEX_FILE.stat().st_size / 1024:.1f} KB; {written} files written")
+
+
+if __name__ == '__main__':
+    main()
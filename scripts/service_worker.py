@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Generate the service worker that makes the whole course readable offline.
+
+sw.js at the site root carries a precache manifest: every page (index.html,
+the lecture pages, the complete notes and their fragments), stylesheet,
+script, icon sprite, search index file, vendored library and lecture image,
+each with a hash of its content, plus the CDN stylesheets and scripts the
+pages link while the libraries are not vendored. The first visit installs
+the worker, which downloads everything in the background; after that the
+site works without a network.
+
+Fingerprinted assets (see fingerprint_assets.py) are listed under their
+hashed names and served cache-first: their content never changes. Pages
+and other files are served stale-while-revalidate: from the cache at once,
+refreshed from the network for the next visit. Cached entries are keyed by
+their content hash, so after a deploy the new sw.js only downloads the
+entries that changed, and drops the ones that are gone.
+
+Run it after convert_lectures.py and fingerprint_assets.py, since the
+manifest lists the pages' final asset URLs and content, and before
+compress_assets.py:
+
+    python scripts/convert_lectures.py
+    python scripts/fingerprint_assets.py
+    python scripts/service_worker.py
+    python scripts/compress_assets.py
+
+Usage:
+    python scripts/service_worker.py
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+import build_trace
+import fingerprint_assets
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SERVICE_WORKER_FILE = ROOT_DIR / 'sw.js'
+
+PAGE_GLOBS = ['index.html', 'Lectures/html/*.html', 'Lectures/html/notes/*.html']
+# Search files are rewritten in place rather than fingerprinted
+SEARCH_GLOBS = ['assets/search/index.json', 'assets/search/shards/*.bin']
+REVISION_LENGTH = 8
+
+# CDN stylesheets and scripts the pages load (fonts, KaTeX and Prism until vendored)
+CDN_TAG_RE = re.compile(r'<(?:link\b[^>]*\brel="stylesheet"[^>]*|script\b[^>]*)>', re.IGNORECASE)
+CDN_URL_RE = re.compile(r'\b(?:href|src)="(https://[^"]+)"', re.IGNORECASE)
+
+SERVICE_WORKER_JS = r'''/*
+ * Offline support for the lecture notes.
+ *
+ * Generated by scripts/service_worker.py; edit that script, not this file.
+ * The precache manifest lists every page and asset with a hash of its
+ * content, so a deploy only re-downloads the entries that changed.
+ * Fingerprinted assets are served cache-first, everything else
+ * stale-while-revalidate.
+ */
+var PRECACHE_MANIFEST = __PRECACHE_MANIFEST__;
+
+(function () {
+  'use strict';
+
+  var PRECACHE = 'precache';
+  var RUNTIME = 'runtime';
+  var HASHED_NAME_RE = /\.[0-9a-f]{8}\.[A-Za-z0-9]+$/;
+  var RUNTIME_DESTINATIONS = ['style', 'script', 'font', 'image'];
+  var scope = self.registration.scope;
+
+  // Lookup form of a URL: same-origin paths decoded, so 'Moore%27s' and "Moore's" agree
+  function normalize(url) {
+    url = new URL(url, scope);
+    if (url.origin !== location.origin) return url.href;
+    try {
+      return url.origin + decodeURI(url.pathname);
+    } catch (e) {
+      return url.origin + url.pathname;
+    }
+  }
+
+  // URL -> cache key; keys of unhashed files carry their revision
+  var keys = {};
+  var entries = PRECACHE_MANIFEST.entries.map(function (entry) {
+    var url = new URL(entry.url, scope).href;
+    var key = entry.revision ? url + '?__rev=' + entry.revision : url;
+    keys[normalize(url)] = key;
+    return { url: url, key: key };
+  });
+  keys[normalize(scope)] = keys[normalize('index.html')];
+
+  function precacheEntry(cache, entry) {
+    return cache.match(entry.key).then(function (cached) {
+      if (cached) return;
+      var crossOrigin = new URL(entry.url).origin !== location.origin;
+      var request = new Request(entry.url, crossOrigin ? { mode: 'no-cors' } : { cache: 'no-cache' });
+      return fetch(request).then(function (response) {
+        if (!crossOrigin && !response.ok) throw new Error(entry.url + ': HTTP ' + response.status);
+        return cache.put(entry.key, response);
+      });
+    });
+  }
+
+  // Download what is not cached yet; an interrupted install resumes where it stopped
+  self.addEventListener('install', function (event) {
+    event.waitUntil(caches.open(PRECACHE).then(function (cache) {
+      return Promise.all(entries.map(function (entry) { return precacheEntry(cache, entry); }));
+    }).then(function () {
+      return self.skipWaiting();
+    }));
+  });
+
+  function prune(name, keep) {
+    return caches.open(name).then(function (cache) {
+      return cache.keys().then(function (requests) {
+        return Promise.all(requests.filter(function (request) {
+          return !keep(request.url);
+        }).map(function (request) {
+          return cache.delete(request);
+        }));
+      });
+    });
+  }
+
+  // Drop entries of an older manifest, and same-origin runtime copies the precache now covers
+  self.addEventListener('activate', function (event) {
+    var wanted = {};
+    entries.forEach(function (entry) { wanted[entry.key] = true; });
+    event.waitUntil(caches.keys().then(function (names) {
+      return Promise.all(names.filter(function (name) {
+        return name !== PRECACHE && name !== RUNTIME;
+      }).map(function (name) {
+        return caches.delete(name);
+      }));
+    }).then(function () {
+      return Promise.all([
+        prune(PRECACHE, function (url) { return wanted[url]; }),
+        prune(RUNTIME, function (url) { return new URL(url).origin !== location.origin; })
+      ]);
+    }).then(function () {
+      return self.clients.claim();
+    }));
+  });
+
+  function store(name, key, response) {
+    if (response.ok || response.type === 'opaque') {
+      var copy = response.clone();
+      caches.open(name).then(function (cache) { return cache.put(key, copy); });
+    }
+    return response;
+  }
+
+  function cacheFirst(request, key) {
+    return caches.match(key || request).then(function (cached) {
+      return cached || fetch(request).then(function (response) {
+        return store(key ? PRECACHE : RUNTIME, key || request, response);
+      });
+    });
+  }
+
+  function staleWhileRevalidate(request, key) {
+    var network = fetch(request).then(function (response) {
+      return store(key ? PRECACHE : RUNTIME, key || request, response);
+    });
+    return caches.match(key || request).then(function (cached) {
+      if (!cached) return network;
+      network.catch(function () {});
+      return cached;
+    });
+  }
+
+  self.addEventListener('fetch', function (event) {
+    var request = event.request;
+    if (request.method !== 'GET') return;
+    var url = new URL(request.url);
+    var sameOrigin = url.origin === location.origin;
+    var key = keys[normalize(url)];
+
+    if (!sameOrigin) {
+      // Pinned CDN versions and images never change under the same URL
+      if (key || RUNTIME_DESTINATIONS.indexOf(request.destination) !== -1) {
+        event.respondWith(cacheFirst(request, key));
+      }
+    } else if (HASHED_NAME_RE.test(url.pathname)) {
+      event.respondWith(cacheFirst(request, key));
+    } else if (key || request.mode === 'navigate') {
+      event.respondWith(staleWhileRevalidate(request, key));
+    }
+  });
+})();
+'''
+
+
+def content_revision(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:REVISION_LENGTH]
+
+
+def registration_script(service_worker_url):
+    """Inline script for a page that registers the service worker once the page has loaded."""
+    return ("<script>if ('serviceWorker' in navigator) window.addEventListener('load', function () "
+            f"{{ navigator.serviceWorker.register('{service_worker_url}').catch(function () {{}}); }});</script>")
+
+
+def page_cdn_urls(html):
+    """The CDN stylesheets and scripts a page loads."""
+    urls = []
+    for tag in CDN_TAG_RE.findall(html):
+        urls += CDN_URL_RE.findall(tag)
+    return urls
+
+
+def source_files(root=ROOT_DIR):
+    """Every local file the precache manifest is built from."""
+    files = [path for pattern in PAGE_GLOBS + SEARCH_GLOBS for path in sorted(root.glob(pattern))]
+    return files + [root / rel_path for rel_path in fingerprint_assets.collect_assets(root)]
+
+
+def precache_entries(root=ROOT_DIR):
+    """
+    The precache manifest entries: {'url': site path, 'revision': content hash or None}.
+
+    Fingerprinted assets are listed under their hashed name, which is their
+    revision, so their entry has none.
+    """
+    fingerprints = fingerprint_assets.load_manifest()
+    entries = {}
+    cdn_urls = set()
+    for pattern in PAGE_GLOBS:
+        for page in sorted(root.glob(pattern)):
+            rel_path = page.relative_to(root).as_posix()
+            entries[rel_path] = content_revision(page)
+            cdn_urls.update(page_cdn_urls(page.read_text(encoding='utf-8')))
+
+    for rel_path in fingerprint_assets.collect_assets(root):
+        if rel_path in fingerprints and (root / fingerprints[rel_path]).exists():
+            entries[fingerprints[rel_path]] = None
+        else:
+            entries[rel_path] = content_revision(root / rel_path)
+    for pattern in SEARCH_GLOBS:
+        for path in sorted(root.glob(pattern)):
+            entries[path.relative_to(root).as_posix()] = content_revision(path)
+
+    result = [{'url': url, 'revision': revision} for url, revision in sorted(entries.items())]
+    return result + [{'url': url, 'revision': None} for url in sorted(cdn_urls)]
+
+
+def render_service_worker(entries):
+    # One entry per line, so a deploy's sw.js diff shows which files changed
+    lines = ',\n    '.join(json.dumps(entry, ensure_ascii=False) for entry in entries)
+    manifest = f'{{\n  "entries": [\n    {lines}\n  ]\n}}'
+    return SERVICE_WORKER_JS.replace('__PRECACHE_MANIFEST__', manifest)
+
+
+def write_service_worker(output_file=SERVICE_WORKER_FILE):
+    """Write sw.js if its manifest changed; returns (entries, changed)."""
+    entries = precache_entries()
+    content = render_service_worker(entries)
+    try:
+        if output_file.read_text(encoding='utf-8') == content:
+            return entries, False
+    except OSError:
+        pass
+    tmp_file = output_file.with_name(f'{output_file.name}.{os.getpid()}.tmp')
+    tmp_file.write_text(content, encoding='utf-8')
+    os.replace(tmp_file, output_file)
+    return entries, True
+
+
+def main():
+    with build_trace.span('write service worker', 'deploy'):
+        entries, changed = write_service_worker()
+    local = [entry['url'] for entry in entries if '://' not in entry['url']]
+    size = sum((ROOT_DIR / url).stat().st_size for url in local)
+    status = 'Wrote' if changed else 'Up to date:'
+    print(f"✅ {status} {SERVICE_WORKER_FILE.name} precaching {len(local)} files ({size / (1024 * 1024):.1f} MB) "
+          f"and {len(entries) - len(local)} CDN files")
+
+
+if __name__ == '__main__':
+    main()
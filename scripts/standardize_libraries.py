@@ -1,76 +1,106 @@
 #!/usr/bin/env python3
 """
-Standardize KaTeX and Prism.js libraries across all lecture HTML files.
-Uses consistent CDN (cdnjs.cloudflare.com) and all required components.
+Standardize the font, KaTeX and Prism.js includes across all lecture HTML files.
+Uses the same <head> block as convert_lectures.py (vendored assets once
+vendor_assets.py has run, pinned CDN URLs otherwise), loads KaTeX at most
+once (and only its stylesheet for math that is already rendered), and
+highlights code blocks in place, so no Prism files are needed at all.
 """
 
 import re
-import os
+from html import unescape
 from pathlib import Path
 
-# Standard library block to insert
-STANDARD_LIBRARIES = """    <!-- KaTeX for math rendering -->
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.css">
-    <script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.js"></script>
-    <script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/contrib/auto-render.min.js" onload="renderMathInElement(document.body);"></script>
-
-    <!-- Prism.js for code syntax highlighting -->
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/themes/prism.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/prism.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/components/prism-c.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/components/prism-asm6502.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/components/prism-bash.min.js"></script>
-"""
+from markdown_engine import CODE_LANGUAGE_ALIASES
+from syntax_highlight import highlight
+from vendor_assets import head_assets
+
+# Existing font, KaTeX and Prism includes (including multi-line <script> tags)
+LIBRARY_COMMENT_RE = re.compile(r'[ \t]*<!-- (?:KaTeX|Prism)[^\n]*?-->\n')
+LIBRARY_LINK_RE = re.compile(r'[ \t]*<link\b[^>]*(?:katex|prism|fonts\.googleapis|assets/vendor)[^>]*>\n',
+                             re.IGNORECASE)
+LIBRARY_SCRIPT_RE = re.compile(r'[ \t]*<script\b[^>]*(?:katex|prism|assets/vendor)[^>]*>\s*</script>\n',
+                               re.IGNORECASE | re.DOTALL)
+STYLESHEET_RE = re.compile(r'[ \t]*<link rel="stylesheet" href="\.\./\.\./assets/css/style\.css">\n')
+PRE_BLOCK_RE = re.compile(r'<pre\b.*?</pre>', re.DOTALL)
+CODE_BLOCK_RE = re.compile(r'<pre(?: class="[^"]*")?><code class="language-([A-Za-z0-9_+-]+)">(.*?)</code></pre>',
+                           re.DOTALL)
+MATH_DELIMITERS = ('$$', '\\(', '\\[')
+
+def page_math_mode(content):
+    """'runtime' if the page has TeX for auto-render, 'static' if it only has
+    pre-rendered KaTeX, or None without math."""
+    text = PRE_BLOCK_RE.sub('', content)
+    if any(delimiter in text for delimiter in MATH_DELIMITERS):
+        return 'runtime'
+    return 'static' if 'class="katex' in text else None
+
+def highlight_code_block(match):
+    """Replace a plain Prism-style code block with a pre-highlighted one."""
+    lang = match.group(1).lower()
+    lang = CODE_LANGUAGE_ALIASES.get(lang, lang)
+    code = match.group(2)
+    if '<span class="token' in code:
+        return match.group(0)
+    highlighted = highlight(lang, unescape(code))
+    if highlighted is None:
+        return match.group(0)
+    return f'<pre class="language-{lang}"><code class="language-{lang}">{highlighted}</code></pre>'
 
 def standardize_lecture(file_path):
     """Remove existing library includes and add standardized ones."""
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
-    
-    # Find the </head> tag
-    head_end_match = re.search(r'</head>', content)
-    if not head_end_match:
+
+    # Split off the <head> so nothing in the lecture body is touched
+    head_end = content.find('</head>')
+    if head_end == -1:
         print(f"  ⚠️  Warning: No </head> tag found in {file_path}")
         return False
-    
-    # Remove all existing KaTeX and Prism references
-    # Remove KaTeX lines
-    content = re.sub(r'    <!-- KaTeX.*?-->\n', '', content)
-    content = re.sub(r'    <link rel="stylesheet" href="https://cdn\.jsdelivr\.net/npm/katex@.*?>\n', '', content)
-    content = re.sub(r'    <script.*?katex.*?></script>\n', '', content)
-    
-    # Remove Prism lines
-    content = re.sub(r'    <!-- Prism.*?-->\n', '', content)
-    content = re.sub(r'    <link.*?prism.*?>\n', '', content, flags=re.IGNORECASE)
-    content = re.sub(r'    <script.*?prism.*?></script>\n', '', content, flags=re.IGNORECASE)
-    
-    # Insert standard libraries before </head>
-    content = content.replace('</head>', f'{STANDARD_LIBRARIES}</head>')
-    
+    head, body = content[:head_end], content[head_end:]
+    body = CODE_BLOCK_RE.sub(highlight_code_block, body)
+
+    # Remove all existing font, KaTeX and Prism references
+    for pattern in (LIBRARY_COMMENT_RE, LIBRARY_LINK_RE, LIBRARY_SCRIPT_RE):
+        head = pattern.sub('', head)
+    head = re.sub(r'\n\s*\n', '\n', head)
+
+    # Insert the standard block right after the site stylesheet
+    block = head_assets(page_math_mode(body)) + '\n'
+    match = STYLESHEET_RE.search(head)
+    if match:
+        head = head[:match.end()] + block + head[match.end():]
+    else:
+        head += block
+
+    new_content = head + body
+    if new_content == content:
+        return True
+
     # Write back
     with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
+        f.write(new_content)
+
     return True
 
 def main():
     lectures_dir = Path('Lectures/html')
-    
+
     if not lectures_dir.exists():
         print(f"❌ Directory not found: {lectures_dir}")
         return
-    
+
     lecture_files = sorted(lectures_dir.glob('lecture-*.html'))
-    
+
     print(f"🔧 Standardizing libraries in {len(lecture_files)} lecture files...\n")
-    
+
     for lecture_file in lecture_files:
         print(f"Processing {lecture_file.name}...", end=" ")
         if standardize_lecture(lecture_file):
             print("✅")
         else:
             print("❌")
-    
+
     print(f"\n✨ Standardization complete!")
 
 if __name__ == '__main__':
@@ -0,0 +1,139 @@
+"""
+Build-time syntax highlighting for lecture code blocks.
+
+Each supported language has one compiled regex of alternative token rules,
+so a code block is tokenized in a single left-to-right scan. Tokens are
+emitted as Prism-compatible <span class="token ..."> elements, so the
+Prism theme stylesheet still colours them but no Prism JavaScript has to
+run in the browser.
+
+Results are memoized on (language, code), so snippets that repeat across
+lectures are only tokenized once per build.
+"""
+
+import re
+from functools import lru_cache
+from html import escape
+
+C_KEYWORDS = (
+    'auto break case char const continue default do double else enum extern float for goto '
+    'if inline int long register restrict return short signed sizeof static struct switch '
+    'typedef union unsigned void volatile while bool true false NULL'
+).split()
+
+PYTHON_KEYWORDS = (
+    'and as assert async await break class continue def del elif else except finally for '
+    'from global if import in is lambda nonlocal not or pass raise return try while with yield'
+).split()
+
+BASH_KEYWORDS = (
+    'if then else elif fi case esac for select while until do done in function time '
+    'echo export local read return set shift source unset cd exit'
+).split()
+
+VERILOG_KEYWORDS = (
+    'always and assign automatic begin buf case casex casez default defparam else end '
+    'endcase endfunction endgenerate endmodule endtask for forever function generate '
+    'genvar if initial inout input integer localparam module nand negedge nor not or '
+    'output parameter posedge real reg repeat signed task time tri while wire xor'
+).split()
+
+
+def words(keywords):
+    return r'\b(?:' + '|'.join(sorted(keywords, key=len, reverse=True)) + r')\b'
+
+
+# Token rules per language, tried in order at each position. Group names are
+# Prism token types ("class_name" becomes "class-name").
+GRAMMARS = {
+    'c': [
+        ('comment', r'//.*|/\*[\s\S]*?\*/'),
+        ('macro', r'^[ \t]*#[ \t]*\w+.*'),
+        ('string', r'"(?:\\.|[^"\\\n])*"'),
+        ('char', r"'(?:\\.|[^'\\\n])+'"),
+        ('keyword', words(C_KEYWORDS)),
+        ('function', r'\b[A-Za-z_]\w*(?=\s*\()'),
+        ('number', r'\b(?:0x[\da-fA-F]+|\d+\.?\d*(?:[eE][-+]?\d+)?)[uUlLfF]*\b'),
+        ('operator', r'->|\+\+|--|&&|\|\||<<=?|>>=?|[-+*/%&|^!=<>]=?|[~?]'),
+        ('punctuation', r'[{}\[\];(),.:]'),
+    ],
+    # MIPS and ARM assembly (Prism's asm6502 token names)
+    'asm6502': [
+        ('comment', r'[;@].*|//.*|#(?=\s|$).*'),
+        ('string', r'"(?:\\.|[^"\\\n])*"'),
+        ('property', r'^[ \t]*\.\w+'),
+        ('function', r'^[ \t]*[A-Za-z_][\w.]*:'),
+        ('op_code', r'^[ \t]*[A-Za-z][A-Za-z0-9.]*\b|(?<=:)[ \t]*[A-Za-z][A-Za-z0-9.]*\b'),
+        ('register', r'\$\w+|\b(?:[Rr]\d{1,2}|[Rr][dnmst]|SP|LR|PC|sp|lr|pc)\b'),
+        ('number', r'#-?\w+|-?\b(?:0x[\da-fA-F]+|0b[01]+|\d+)\b'),
+        ('punctuation', r'[\[\](),!{}]'),
+    ],
+    'verilog': [
+        ('comment', r'//.*|/\*[\s\S]*?\*/'),
+        ('string', r'"(?:\\.|[^"\\\n])*"'),
+        ('property', r'`\w+'),
+        ('function', r'\$\w+'),
+        ('keyword', words(VERILOG_KEYWORDS)),
+        ('number', r"\b\d*'[sS]?[bBoOdDhH][\da-fA-F_xXzZ?]+|\b\d[\d_]*(?:\.\d+)?\b"),
+        ('operator', r'===|!==|<=|>=|==|!=|&&|\|\||<<|>>|[-+*/%&|^~!<>=?:]'),
+        ('punctuation', r'[{}\[\];(),.@#]'),
+    ],
+    'bash': [
+        ('comment', r'(?:^|(?<=\s))#.*'),
+        ('string', r'"(?:\\.|[^"\\])*"|\'[^\']*\''),
+        ('variable', r'\$(?:\{[^}]*\}|\w+|[@#?$!*-])'),
+        ('keyword', words(BASH_KEYWORDS)),
+        ('function', r'^[ \t]*[A-Za-z_][\w.-]*(?=[ \t]|$)'),
+        ('number', r'\b\d+\b'),
+        ('operator', r'&&|\|\||[|&;<>]'),
+        ('punctuation', r'[{}\[\]()]'),
+    ],
+    'python': [
+        ('comment', r'#.*'),
+        ('string', r'(?:[rRbBfFuU]{1,2})?(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\')'),
+        ('keyword', words(PYTHON_KEYWORDS)),
+        ('boolean', r'\b(?:True|False|None)\b'),
+        ('function', r'\b[A-Za-z_]\w*(?=\s*\()'),
+        ('number', r'\b(?:0[xX][\da-fA-F_]+|0[bB][01_]+|\d[\d_]*\.?\d*(?:[eE][-+]?\d+)?j?)\b'),
+        ('operator', r'\*\*=?|//=?|<<=?|>>=?|->|[-+*/%&|^~<>!=]=?'),
+        ('punctuation', r'[{}\[\];(),.:]'),
+    ],
+}
+
+# Token types the Prism theme does not style, with the alias Prism adds
+TOKEN_CLASSES = {
+    'macro': 'macro property',
+    'op_code': 'op-code keyword',
+    'register': 'register variable',
+}
+
+TOKEN_RES = {
+    lang: re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in rules), re.MULTILINE)
+    for lang, rules in GRAMMARS.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def highlight(lang, code):
+    """
+    Return code as escaped HTML with Prism-style token spans, or None if the
+    language is not supported.
+    """
+    token_re = TOKEN_RES.get(lang)
+    if token_re is None:
+        return None
+
+    parts = []
+    pos = 0
+    for match in token_re.finditer(code):
+        start, end = match.span()
+        text = match.group()
+        # Rules anchored at line starts may include the indentation
+        indent = len(text) - len(text.lstrip(' \t'))
+        if start + indent > pos:
+            parts.append(escape(code[pos:start + indent], quote=False))
+        token = TOKEN_CLASSES.get(match.lastgroup) or match.lastgroup.replace('_', '-')
+        parts.append(f'<span class="token {token}">{escape(text[indent:], quote=False)}</span>')
+        pos = end
+    parts.append(escape(code[pos:], quote=False))
+    return ''.join(parts)
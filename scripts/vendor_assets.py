@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Vendor the third-party front-end assets into assets/vendor/.
+
+Lecture pages used to pull KaTeX from jsdelivr, Prism from cdnjs and Inter
+from Google Fonts - three extra origins, each with its own DNS lookup and
+TLS handshake before first paint. This stage copies pinned versions of
+those assets into the site:
+
+- KaTeX: katex.min.css (WOFF2 fonts only), katex.min.js and auto-render
+- Inter: the variable font from the Google Fonts repository, cut down to
+  the weights style.css uses and to the characters that appear in the
+  lectures and the index page, as WOFF2 (needs fontTools and brotli;
+  without them the pages keep loading Inter from Google Fonts)
+
+Prism needs nothing: code is highlighted at build time by
+syntax_highlight.py and coloured by style.css.
+
+Every downloaded file is checked against its pinned sha256, when it is
+fetched and whenever a cached copy is reused, so a changed upstream file
+stops the run instead of being vendored. Both licences are vendored
+alongside the files. assets/vendor/ is committed,
+since the site is deployed straight from the repository;
+assets/vendor/manifest.json records what was vendored, and
+convert_lectures.py links the local copies (with a font preload and
+deferred scripts) once it exists, and the CDN URLs otherwise.
+
+Usage:
+    python scripts/vendor_assets.py [--mirror URL] [--force]
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import re
+import string
+import sys
+import urllib.request
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    from fontTools import subset as font_subset
+    from fontTools.varLib import instancer
+except ImportError:  # subsetting is optional
+    font_subset = None
+# fontTools needs brotli to read and write WOFF2
+if importlib.util.find_spec('brotli') is None:
+    font_subset = None
+
+import build_cache
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+VENDOR_DIR = ROOT_DIR / 'assets' / 'vendor'
+# Downloads that are only inputs to the vendored files (not deployed)
+DOWNLOAD_DIR = ROOT_DIR / '.cache' / 'vendor'
+MANIFEST_FILE = VENDOR_DIR / 'manifest.json'
+MARKDOWN_DIR = ROOT_DIR / 'Lectures' / 'markdown'
+
+# Pinned versions; KaTeX files are fetched from <mirror>/<package>@<version>/
+KATEX_VERSION = '0.16.40'
+DEFAULT_MIRROR = 'https://cdn.jsdelivr.net/npm/'
+KATEX_PACKAGE = f'katex@{KATEX_VERSION}'
+KATEX_SHA256 = {
+    'LICENSE': '766ccc1f306c885aa45542a9846bbd0a505b27a0374f146778171c2254ce18e3',
+    'dist/katex.min.css': 'c32153bde5fa6844805f3e525b79aba5809372381f354eb869c67b804c2b5755',
+    'dist/katex.min.js': '759450e87b7d6523ab99fc833330673f400a8cc1a87d0055e1ca261baf98d9e4',
+    'dist/contrib/auto-render.min.js': 'e5372d199bcdae8b4de71d0f7ceba72a4ba12774a27c60a6f1f77d03b3228ee4',
+    'dist/fonts/KaTeX_AMS-Regular.woff2': '0cdd387c9590a1a9f9794560022dbb59654a7d86f187aa0c81495ad42d3a7308',
+    'dist/fonts/KaTeX_Caligraphic-Bold.woff2': 'de7701e42cf1f4cf0b766c03fb27977207eee2f4fd5d76fa82188406da43ea4c',
+    'dist/fonts/KaTeX_Caligraphic-Regular.woff2': '5d53e70ad607c2352162dec9e0923fb54ecdafaccbf604cd8dcf7d00facb989b',
+    'dist/fonts/KaTeX_Fraktur-Bold.woff2': '74444efd593c005e3f4573b44524704c0af0a937fe911cca9e94068d0d140d3f',
+    'dist/fonts/KaTeX_Fraktur-Regular.woff2': '51814d270d06ff0255dba0799994fa4d8c84d11f09951d47595f4abb1f3602dc',
+    'dist/fonts/KaTeX_Main-Bold.woff2': '0f60d1b897938ec918c8ce073092411baf9438f6739465693ff18b0f9d20b021',
+    'dist/fonts/KaTeX_Main-BoldItalic.woff2': '99cd42a3c072d918f2f44984a807cf7aa16e13545fd0875fc07c6c65f99e715b',
+    'dist/fonts/KaTeX_Main-Italic.woff2': '97479ca6cce906abc961ecac96faa5f9ca2e61b8e7670d475826bcdee9a7c267',
+    'dist/fonts/KaTeX_Main-Regular.woff2': 'c2342cd8b869e01752a9321dc17213fc40d4d04c79688c1d43f2cf316abd7866',
+    'dist/fonts/KaTeX_Math-BoldItalic.woff2': 'dc47344dbb6cb5b655c8460d561f4df5f501b90c804ad3c6cec65fe322351ab1',
+    'dist/fonts/KaTeX_Math-Italic.woff2': '7af58c5ec8f132a2ddde9027c6d7814decce4d3b822a11192a42a20e2e973264',
+    'dist/fonts/KaTeX_SansSerif-Bold.woff2': 'e99ae51144bf1232efcc1bfe5add36262c6866b0faab24fa75740e1b98577a62',
+    'dist/fonts/KaTeX_SansSerif-Italic.woff2': '00b26ac825e2095056396e0553b8ac26d3f8ad158c3826e28b4c45b385c4714a',
+    'dist/fonts/KaTeX_SansSerif-Regular.woff2': '68e8c73ef42afd3ccec58bf0fba302cce448938e7fc020a5e31f8a952eee1342',
+    'dist/fonts/KaTeX_Script-Regular.woff2': '036d4e95149b69ff9bcc0cd55771efeb25ffa3947293e69acd78d5ac328c684b',
+    'dist/fonts/KaTeX_Size1-Regular.woff2': '6b47c40166b6dbe21a5dfca7718413f2147fd2399be1ba605d8ad39cedf25dfe',
+    'dist/fonts/KaTeX_Size2-Regular.woff2': 'd04c54219f9eaec6d4d4fd42dfb28785975a4794d6b2fc71e566b9cd6db842dd',
+    'dist/fonts/KaTeX_Size3-Regular.woff2': '73d591271b1604960cb10bb90fee021670af7297017e0e98480b332d11f51995',
+    'dist/fonts/KaTeX_Size4-Regular.woff2': 'a4af7d414440a1c1790825cfb700cf9cf43b0f2c4b04f0ebc523011ad9853ec0',
+    'dist/fonts/KaTeX_Typewriter-Regular.woff2': '71d517d67827787cfabdf186914cc3358eda539e37931941f2b2fd4a21f68c0b',
+}
+
+# Inter as Google Fonts serves it, from the google/fonts repository at a fixed commit
+INTER_VERSION = '4.001'
+INTER_DIR_URL = 'https://raw.githubusercontent.com/google/fonts/0b58fb370093f9a9f4ff785d94405710b79de67c/ofl/inter/'
+INTER_URL = f'{INTER_DIR_URL}Inter%5Bopsz,wght%5D.ttf'
+INTER_SHA256 = '29160a80ff49ddcab2c97711247e08b1fab27a484a329ce8b813d820dc559031'
+INTER_LICENSE_URL = f'{INTER_DIR_URL}OFL.txt'
+INTER_LICENSE_SHA256 = '5b9321a4298cfeb6b34354164a1c3afc3db114569984c502b9b35d988fd58c57'
+# style.css sets text in weights 300 to 700; opsz 14 is the text size Google Fonts serves by default
+INTER_AXES = {'opsz': 14, 'wght': (300, 700)}
+
+# Files whose text is set in Inter
+INTER_TEXT_SOURCES = [ROOT_DIR / 'index.html', ROOT_DIR / 'scripts' / 'convert_lectures.py']
+
+# CDN tags used until the assets are vendored
+CDN_KATEX = f'https://cdn.jsdelivr.net/npm/katex@{KATEX_VERSION}/dist'
+CDN_INTER = 'https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap'
+
+KATEX_FONT_SRC_RE = re.compile(r'src:url\((fonts/[^)]+\.woff2)\) format\("woff2"\)[^;}]*')
+
+
+def fetch(url):
+    """Download a URL (or read a file:// mirror) into memory."""
+    with urllib.request.urlopen(url, timeout=30) as response:
+        return response.read()
+
+
+def vendor_file(url, dest, sha256, force=False):
+    """Fetch one pinned file unless a copy with the pinned hash is already there."""
+    if dest.exists() and not force:
+        data = dest.read_bytes()
+        if hashlib.sha256(data).hexdigest() == sha256:
+            return data
+    print(f"Fetching: {url}")
+    data = fetch(url)
+    digest = hashlib.sha256(data).hexdigest()
+    if digest != sha256:
+        raise ValueError(f"{url} has sha256 {digest}, not the pinned {sha256}")
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_bytes(data)
+    return data
+
+
+def vendor_katex_file(mirror, path, dest, force):
+    if path not in KATEX_SHA256:
+        raise ValueError(f"{KATEX_PACKAGE}/{path} has no pinned sha256")
+    return vendor_file(f'{mirror}{KATEX_PACKAGE}/{path}', dest, KATEX_SHA256[path], force)
+
+
+def vendor_katex(mirror, force):
+    """Copy KaTeX, keeping only the WOFF2 font sources in its stylesheet."""
+    katex_dir = VENDOR_DIR / 'katex'
+    css = vendor_katex_file(mirror, 'dist/katex.min.css', DOWNLOAD_DIR / KATEX_PACKAGE / 'katex.min.css',
+                            force).decode('utf-8')
+    vendor_katex_file(mirror, 'dist/katex.min.js', katex_dir / 'katex.min.js', force)
+    vendor_katex_file(mirror, 'dist/contrib/auto-render.min.js', katex_dir / 'auto-render.min.js', force)
+    vendor_katex_file(mirror, 'LICENSE', katex_dir / 'LICENSE', force)
+
+    # Every browser we support reads WOFF2, so the WOFF/TTF fallbacks are dead weight
+    fonts = sorted(set(KATEX_FONT_SRC_RE.findall(css)))
+    css = KATEX_FONT_SRC_RE.sub(r'src:url(\1) format("woff2")', css)
+    (katex_dir / 'katex.min.css').write_text(css, encoding='utf-8')
+    for font in fonts:
+        vendor_katex_file(mirror, f'dist/{font}', katex_dir / font, force)
+
+    return {
+        'version': KATEX_VERSION,
+        'css': 'katex/katex.min.css',
+        'js': 'katex/katex.min.js',
+        'auto_render': 'katex/auto-render.min.js',
+    }
+
+
+def used_characters():
+    """Every character that can end up on a page set in Inter."""
+    chars = set(string.printable)
+    for path in sorted(MARKDOWN_DIR.glob('*.md')) + INTER_TEXT_SOURCES:
+        chars.update(path.read_text(encoding='utf-8'))
+    return {ch for ch in chars if ch.isprintable() or ch == ' '}
+
+
+def vendor_inter(force):
+    """Copy Inter, cut down to the weights and characters the site uses; None without fontTools."""
+    if font_subset is None:
+        print("⚠️  fontTools/brotli not installed; pages keep loading Inter from Google Fonts")
+        return None
+    inter_dir = VENDOR_DIR / 'inter'
+    source = DOWNLOAD_DIR / 'inter' / 'Inter[opsz,wght].ttf'
+    vendor_file(INTER_URL, source, INTER_SHA256, force)
+    # The OFL asks for the license to travel with the font
+    vendor_file(INTER_LICENSE_URL, inter_dir / 'OFL.txt', INTER_LICENSE_SHA256, force)
+
+    # A stable name, so index.html can link it; fingerprint_assets.py gives it a hashed one
+    font_name = 'inter.woff2'
+    font_file = inter_dir / font_name
+    chars = used_characters()
+    key = hashlib.sha256(f'{INTER_SHA256}{sorted(INTER_AXES.items())}{"".join(sorted(chars))}'.encode('utf-8'))
+    if force or not font_file.exists() or load_manifest().get('inter', {}).get('key') != key.hexdigest():
+        print(f"Subsetting Inter to {len(chars)} characters")
+        subset_font(source, font_file, chars)
+
+    # One variable font covers every weight the stylesheet uses
+    low, high = INTER_AXES['wght']
+    (inter_dir / 'inter.css').write_text(
+        "@font-face {\n"
+        "  font-family: 'Inter';\n"
+        "  font-style: normal;\n"
+        f"  font-weight: {low} {high};\n"
+        "  font-display: swap;\n"
+        f"  src: url('{font_name}') format('woff2');\n"
+        "}\n", encoding='utf-8')
+
+    return {'version': INTER_VERSION, 'css': 'inter/inter.css', 'font': f'inter/{font_name}', 'key': key.hexdigest()}
+
+
+def subset_font(source, dest, chars):
+    options = font_subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    font = font_subset.load_font(str(source), options)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(unicodes={ord(ch) for ch in chars})
+    subsetter.subset(font)
+    # Pin the optical size and narrow the weight axis to the range the site uses
+    font = instancer.instantiateVariableFont(font, INTER_AXES)
+    font_subset.save_font(font, str(dest), options)
+
+
+@lru_cache(maxsize=None)
+def load_manifest(manifest_file=MANIFEST_FILE):
+    """Load the vendor manifest; empty until vendor_assets.py has run."""
+    return build_cache.load_manifest(manifest_file)
+
+
+def manifest_hash(manifest_file=MANIFEST_FILE):
+    """Hash of the manifest, so page builds notice newly vendored assets."""
+    try:
+        return hashlib.sha256(Path(manifest_file).read_bytes()).hexdigest()
+    except OSError:
+        return ''
+
+
+def head_assets(math='runtime', prefix='../../'):
+    """
+    The <head> tags for fonts and KaTeX on a lecture page.
+
+    math is 'runtime' for client-side rendering, 'static' when the math was
+    pre-rendered at build time (stylesheet only), or None for a page
+    without math. prefix is the path from the page to the site root.
+    """
+    manifest = load_manifest()
+    if not manifest:
+        return cdn_head_assets(math)
+
+    vendor = f'{prefix}assets/vendor/'
+    katex, inter = manifest['katex'], manifest.get('inter')
+    if inter:
+        lines = [
+            f'<link rel="preload" href="{vendor}{inter["font"]}" as="font" type="font/woff2" crossorigin>',
+            f'<link rel="stylesheet" href="{vendor}{inter["css"]}">',
+        ]
+    else:
+        lines = [f'<link href="{CDN_INTER}" rel="stylesheet">']
+    lines += katex_tags(math, vendor + katex['css'], vendor + katex['js'], vendor + katex['auto_render'])
+    return '\n'.join('    ' + line if line else '' for line in lines)
+
+
+def cdn_head_assets(math):
+    lines = [f'<link href="{CDN_INTER}" rel="stylesheet">']
+    lines += katex_tags(math, f'{CDN_KATEX}/katex.min.css', f'{CDN_KATEX}/katex.min.js',
+                        f'{CDN_KATEX}/contrib/auto-render.min.js')
+    return '\n'.join('    ' + line if line else '' for line in lines)
+
+
+def katex_tags(math, css, js, auto_render):
+    """KaTeX tags for a page's math mode (see head_assets)."""
+    if math is None:
+        return []
+    lines = ['', '<!-- KaTeX for math rendering -->', f'<link rel="stylesheet" href="{css}">']
+    if math == 'runtime':
+        lines += [f'<script defer src="{js}"></script>',
+                  f'<script defer src="{auto_render}" onload="renderMathInElement(document.body);"></script>']
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vendor KaTeX and Inter into assets/vendor.')
+    parser.add_argument('--mirror', default=DEFAULT_MIRROR,
+                        help=f'npm CDN (or file:// mirror) to fetch KaTeX from (default {DEFAULT_MIRROR})')
+    parser.add_argument('--force', action='store_true', help='re-download and re-subset everything')
+    args = parser.parse_args()
+    mirror = args.mirror if args.mirror.endswith('/') else args.mirror + '/'
+
+    print(f"📦 Vendoring KaTeX {KATEX_VERSION} and Inter {INTER_VERSION}\n")
+    try:
+        manifest = {'katex': vendor_katex(mirror, args.force)}
+        inter = vendor_inter(args.force)
+    except OSError as e:
+        print(f"❌ Could not fetch assets: {e}")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if inter:
+        manifest['inter'] = inter
+
+    if manifest != load_manifest():
+        build_cache.save_manifest(MANIFEST_FILE, manifest)
+
+    print(f"\n✅ Vendored assets in {VENDOR_DIR.relative_to(ROOT_DIR)}")
+
+
+if __name__ == '__main__':
+    main()
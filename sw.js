@@ -0,0 +1,738 @@
+/*
+ * Offline support for the lecture notes.
+ *
+ * Generated by scripts/service_worker.py; edit that script, not this file.
+ * The precache manifest lists every page and asset with a hash of its
+ * content, so a deploy only re-downloads the entries that changed.
+ * Fingerprinted assets are served cache-first, everything else
+ * stale-while-revalidate.
+ */
+var PRECACHE_MANIFEST = {
+  "entries": [
+    {"url": "Lectures/html/complete-notes.html", "revision": "dc82c854"},
+    {"url": "Lectures/html/lecture-01.html", "revision": "99f094a8"},
+    {"url": "Lectures/html/lecture-02.html", "revision": "5fec8a1d"},
+    {"url": "Lectures/html/lecture-03.html", "revision": "033bc30d"},
+    {"url": "Lectures/html/lecture-04.html", "revision": "f7d8c701"},
+    {"url": "Lectures/html/lecture-05.html", "revision": "1ef65442"},
+    {"url": "Lectures/html/lecture-06.html", "revision": "c40d3814"},
+    {"url": "Lectures/html/lecture-07.html", "revision": "35a606e9"},
+    {"url": "Lectures/html/lecture-08.html", "revision": "ec806d34"},
+    {"url": "Lectures/html/lecture-09.html", "revision": "c18ec484"},
+    {"url": "Lectures/html/lecture-10.html", "revision": "18a4b0b6"},
+    {"url": "Lectures/html/lecture-11.html", "revision": "486b23e7"},
+    {"url": "Lectures/html/lecture-12.html", "revision": "c30477ac"},
+    {"url": "Lectures/html/lecture-13.html", "revision": "6973a118"},
+    {"url": "Lectures/html/lecture-14.html", "revision": "5d0d1f25"},
+    {"url": "Lectures/html/lecture-15.html", "revision": "92f3f66b"},
+    {"url": "Lectures/html/lecture-16.html", "revision": "98d64596"},
+    {"url": "Lectures/html/lecture-17.html", "revision": "d4c9f42d"},
+    {"url": "Lectures/html/lecture-18.html", "revision": "5f27a315"},
+    {"url": "Lectures/html/lecture-19.html", "revision": "a4ce1156"},
+    {"url": "Lectures/html/lecture-20.html", "revision": "df80bc37"},
+    {"url": "Lectures/html/notes/lecture-02.html", "revision": "d2666ad9"},
+    {"url": "Lectures/html/notes/lecture-03.html", "revision": "5b0c00a8"},
+    {"url": "Lectures/html/notes/lecture-04.html", "revision": "80cded55"},
+    {"url": "Lectures/html/notes/lecture-05.html", "revision": "077d1ef2"},
+    {"url": "Lectures/html/notes/lecture-06.html", "revision": "34273958"},
+    {"url": "Lectures/html/notes/lecture-07.html", "revision": "ac752c56"},
+    {"url": "Lectures/html/notes/lecture-08.html", "revision": "13dc95c3"},
+    {"url": "Lectures/html/notes/lecture-09.html", "revision": "540ca16e"},
+    {"url": "Lectures/html/notes/lecture-10.html", "revision": "746c5d89"},
+    {"url": "Lectures/html/notes/lecture-11.html", "revision": "ad448b90"},
+    {"url": "Lectures/html/notes/lecture-12.html", "revision": "c1aa7f30"},
+    {"url": "Lectures/html/notes/lecture-13.html", "revision": "27f97fc7"},
+    {"url": "Lectures/html/notes/lecture-14.html", "revision": "435b2449"},
+    {"url": "Lectures/html/notes/lecture-15.html", "revision": "37fc968c"},
+    {"url": "Lectures/html/notes/lecture-16.html", "revision": "cd9cdcf9"},
+    {"url": "Lectures/html/notes/lecture-17.html", "revision": "54c3903a"},
+    {"url": "Lectures/html/notes/lecture-18.html", "revision": "371dda02"},
+    {"url": "Lectures/html/notes/lecture-19.html", "revision": "ee132b6c"},
+    {"url": "Lectures/html/notes/lecture-20.html", "revision": "594ae8ee"},
+    {"url": "Lectures/img/Chapter 1 AMD Barcelona.1820091c.jpg", "revision": null},
+    {"url": "Lectures/img/Chapter 1 Computer Abstractions and Technology.a217baf8.jpg", "revision": null},
+    {"url": "Lectures/img/Chapter 1 Moore's Law.402f5647.jpg", "revision": null},
+    {"url": "Lectures/img/Chapter 1 Power Wall.c147f65c.jpg", "revision": null},
+    {"url": "Lectures/img/Chapter 10 Branch If Equal.ac880df5.jpeg", "revision": null},
+    {"url": "Lectures/img/Chapter 10 Jump.958446b3.jpeg", "revision": null},
+    {"url": "Lectures/img/Chapter 10 Load Word.fb044152.jpeg", "revision": null},
+    {"url": "Lectures/img/Chapter 10 R Type.3b32f368.jpeg", "revision": null},
+    {"url": "Lectures/img/Chapter 2 ARM Conventions.50172aac.jpg", "revision": null},
+    {"url": "Lectures/img/Chapter 9 CPU Control and Datapath.4ca78db6.jpeg", "revision": null},
+    {"url": "Lectures/img/Chapter 9 CPU Overview.ae4019f5.jpeg", "revision": null},
+    {"url": "Lectures/img/Chapter 9 Register.3a75413e.jpeg", "revision": null},
+    {"url": "Lectures/img/Chapter 9 Write EN Register.64aa8ab0.jpeg", "revision": null},
+    {"url": "Lectures/img/DIrect Mapped Write.a7098bb0.jpg", "revision": null},
+    {"url": "Lectures/img/Direct Mapped Read.76b5318f.jpg", "revision": null},
+    {"url": "Lectures/img/Memory Hierarchy.66739953.jpg", "revision": null},
+    {"url": "Lectures/img/Memory Systems.ef62bd96.jpg", "revision": null},
+    {"url": "Lectures/img/Multiprocessors_NVM.a33f910b.jpg", "revision": null},
+    {"url": "Lectures/img/Multiprocessors_SSM.3374aa8d.jpg", "revision": null},
+    {"url": "Lectures/img/Multiprocessors_bus.523a75f9.jpg", "revision": null},
+    {"url": "Lectures/img/Multiprocessors_cmmu.5c4d9f9d.jpg", "revision": null},
+    {"url": "Lectures/img/Multiprocessors_mesi.fbb8953f.jpg", "revision": null},
+    {"url": "Lectures/img/Multiprocessors_mmu.6fe79280.jpg", "revision": null},
+    {"url": "Lectures/img/Non-Pipelined.9c936561.jpg", "revision": null},
+    {"url": "Lectures/img/Pipeline Registers.19c3395d.jpg", "revision": null},
+    {"url": "Lectures/img/Pipeline Stages.d2b80c76.jpeg", "revision": null},
+    {"url": "Lectures/img/Pipelined.ee569695.jpg", "revision": null},
+    {"url": "Lectures/img/Virtual_Mem_Translation.83abbd87.jpg", "revision": null},
+    {"url": "Lectures/img/Virtual_mem_TLB.21c84ce8.jpg", "revision": null},
+    {"url": "Lectures/img/Virtual_mem_cycles.e70767f9.jpg", "revision": null},
+    {"url": "Lectures/img/isuru-nawinne.b106ada6.png", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 AMD Barcelona-jpg-1200.d76b3f93.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 AMD Barcelona-jpg-480.300f2342.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 AMD Barcelona-jpg-800.3223eaa2.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 Computer Abstractions and Technology-jpg-480.2f722a70.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 Computer Abstractions and Technology-jpg-800.01c72dc1.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 Computer Abstractions and Technology-jpg-903.c44da91e.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 Moore's Law-jpg-1200.b6a498a8.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 Moore's Law-jpg-480.86b50f63.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 Moore's Law-jpg-800.3aeb57e7.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 Power Wall-jpg-1200.030eb48f.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 Power Wall-jpg-480.20257b60.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 1 Power Wall-jpg-800.46b63981.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 Branch If Equal-jpeg-1200.80872c81.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 Branch If Equal-jpeg-480.b0dc499e.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 Branch If Equal-jpeg-800.792b8588.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 Jump-jpeg-1200.787a7e09.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 Jump-jpeg-480.726e9072.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 Jump-jpeg-800.f381eb9b.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 Load Word-jpeg-1200.97ee4771.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 Load Word-jpeg-480.fee305da.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 Load Word-jpeg-800.21d4948c.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 R Type-jpeg-1200.4fa2bc49.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 R Type-jpeg-480.e9348eb2.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 10 R Type-jpeg-800.bac08494.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 2 ARM Conventions-jpg-1200.f3c8fba1.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 2 ARM Conventions-jpg-480.d413c24a.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 2 ARM Conventions-jpg-800.4577ead1.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 9 CPU Control and Datapath-jpeg-1200.6054de55.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 9 CPU Control and Datapath-jpeg-480.7c3fa595.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 9 CPU Control and Datapath-jpeg-800.39371765.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 9 CPU Overview-jpeg-1200.542b40d2.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 9 CPU Overview-jpeg-480.42e324ac.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 9 CPU Overview-jpeg-800.d186ef48.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 9 Register-jpeg-480.a7a9285a.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 9 Register-jpeg-501.eb2e4568.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 9 Write EN Register-jpeg-480.09810e40.webp", "revision": null},
+    {"url": "Lectures/img/variants/Chapter 9 Write EN Register-jpeg-523.441359f5.webp", "revision": null},
+    {"url": "Lectures/img/variants/DIrect Mapped Write-jpg-480.8489d2e9.webp", "revision": null},
+    {"url": "Lectures/img/variants/DIrect Mapped Write-jpg-800.8a100a32.webp", "revision": null},
+    {"url": "Lectures/img/variants/DIrect Mapped Write-jpg-852.408f083a.webp", "revision": null},
+    {"url": "Lectures/img/variants/Direct Mapped Read-jpg-480.7a57ae85.webp", "revision": null},
+    {"url": "Lectures/img/variants/Direct Mapped Read-jpg-800.0e4e4fff.webp", "revision": null},
+    {"url": "Lectures/img/variants/Direct Mapped Read-jpg-846.8c4db493.webp", "revision": null},
+    {"url": "Lectures/img/variants/Memory Hierarchy-jpg-334.9719339f.webp", "revision": null},
+    {"url": "Lectures/img/variants/Memory Systems-jpg-480.b652b8f4.webp", "revision": null},
+    {"url": "Lectures/img/variants/Memory Systems-jpg-800.22a41b3d.webp", "revision": null},
+    {"url": "Lectures/img/variants/Memory Systems-jpg-896.e95cd4f1.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_NVM-jpg-478.89ca2f2f.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_SSM-jpg-480.b639d136.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_SSM-jpg-542.2c86a3b9.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_bus-jpg-480.81dedf38.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_bus-jpg-518.1cb25855.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_cmmu-jpg-480.4dbde173.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_cmmu-jpg-800.f1d6da97.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_cmmu-jpg-889.01ddca68.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_mesi-jpg-480.b9d80a25.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_mesi-jpg-800.30dc3936.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_mesi-jpg-920.55ae3f19.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_mmu-jpg-480.fa843885.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_mmu-jpg-800.54d6658a.webp", "revision": null},
+    {"url": "Lectures/img/variants/Multiprocessors_mmu-jpg-837.31c4c755.webp", "revision": null},
+    {"url": "Lectures/img/variants/Non-Pipelined-jpg-480.b4bffc40.webp", "revision": null},
+    {"url": "Lectures/img/variants/Non-Pipelined-jpg-746.4374b412.webp", "revision": null},
+    {"url": "Lectures/img/variants/Pipeline Registers-jpg-1200.09fac5ac.webp", "revision": null},
+    {"url": "Lectures/img/variants/Pipeline Registers-jpg-480.bd988725.webp", "revision": null},
+    {"url": "Lectures/img/variants/Pipeline Registers-jpg-800.c85a7cc6.webp", "revision": null},
+    {"url": "Lectures/img/variants/Pipeline Stages-jpeg-1200.fd5be465.webp", "revision": null},
+    {"url": "Lectures/img/variants/Pipeline Stages-jpeg-480.7753b779.webp", "revision": null},
+    {"url": "Lectures/img/variants/Pipeline Stages-jpeg-800.88fcbeba.webp", "revision": null},
+    {"url": "Lectures/img/variants/Pipelined-jpg-480.fe732233.webp", "revision": null},
+    {"url": "Lectures/img/variants/Pipelined-jpg-761.16754c5a.webp", "revision": null},
+    {"url": "Lectures/img/variants/Virtual_Mem_Translation-jpg-480.42ccfaa2.webp", "revision": null},
+    {"url": "Lectures/img/variants/Virtual_Mem_Translation-jpg-534.cf3f26af.webp", "revision": null},
+    {"url": "Lectures/img/variants/Virtual_mem_TLB-jpg-480.8108ef08.webp", "revision": null},
+    {"url": "Lectures/img/variants/Virtual_mem_TLB-jpg-800.c0751f88.webp", "revision": null},
+    {"url": "Lectures/img/variants/Virtual_mem_TLB-jpg-880.05fa8490.webp", "revision": null},
+    {"url": "Lectures/img/variants/Virtual_mem_cycles-jpg-412.9848a7b8.webp", "revision": null},
+    {"url": "Lectures/img/variants/isuru-nawinne-png-300.ac602c73.webp", "revision": null},
+    {"url": "assets/css/style.a70a0af6.css", "revision": null},
+    {"url": "assets/icons.d61c84f3.svg", "revision": null},
+    {"url": "assets/js/complete-notes.4056f22c.js", "revision": null},
+    {"url": "assets/js/search.5921e701.js", "revision": null},
+    {"url": "assets/search/index.json", "revision": "c5d4745e"},
+    {"url": "assets/search/shards/00.bin", "revision": "239ab0ba"},
+    {"url": "assets/search/shards/01.bin", "revision": "d8e65ed6"},
+    {"url": "assets/search/shards/02.bin", "revision": "75f3e010"},
+    {"url": "assets/search/shards/04.bin", "revision": "edcb4c08"},
+    {"url": "assets/search/shards/05.bin", "revision": "7d90628b"},
+    {"url": "assets/search/shards/06.bin", "revision": "ee2edf6a"},
+    {"url": "assets/search/shards/08.bin", "revision": "e3280135"},
+    {"url": "assets/search/shards/0_.bin", "revision": "a05b462d"},
+    {"url": "assets/search/shards/0b.bin", "revision": "4de5ab7a"},
+    {"url": "assets/search/shards/0s.bin", "revision": "24f989d5"},
+    {"url": "assets/search/shards/0x.bin", "revision": "f3483203"},
+    {"url": "assets/search/shards/10.bin", "revision": "5efd1a69"},
+    {"url": "assets/search/shards/11.bin", "revision": "1a5cd0d3"},
+    {"url": "assets/search/shards/12.bin", "revision": "594e714c"},
+    {"url": "assets/search/shards/13.bin", "revision": "513cadbb"},
+    {"url": "assets/search/shards/14.bin", "revision": "c804d7d8"},
+    {"url": "assets/search/shards/15.bin", "revision": "bd6c2bda"},
+    {"url": "assets/search/shards/16.bin", "revision": "00eb12e7"},
+    {"url": "assets/search/shards/17.bin", "revision": "3d4eb949"},
+    {"url": "assets/search/shards/18.bin", "revision": "83c3b185"},
+    {"url": "assets/search/shards/19.bin", "revision": "b41c455f"},
+    {"url": "assets/search/shards/1_.bin", "revision": "e340e45d"},
+    {"url": "assets/search/shards/1n.bin", "revision": "8eaeffd2"},
+    {"url": "assets/search/shards/1s.bin", "revision": "db716698"},
+    {"url": "assets/search/shards/1v.bin", "revision": "d38e0f07"},
+    {"url": "assets/search/shards/1x.bin", "revision": "497d1dc6"},
+    {"url": "assets/search/shards/20.bin", "revision": "ffe59efa"},
+    {"url": "assets/search/shards/21.bin", "revision": "d9e4fa32"},
+    {"url": "assets/search/shards/22.bin", "revision": "a19e6f96"},
+    {"url": "assets/search/shards/23.bin", "revision": "08e6bda4"},
+    {"url": "assets/search/shards/24.bin", "revision": "5c858317"},
+    {"url": "assets/search/shards/25.bin", "revision": "a28a8d7d"},
+    {"url": "assets/search/shards/26.bin", "revision": "f77a4048"},
+    {"url": "assets/search/shards/27.bin", "revision": "1c05ae47"},
+    {"url": "assets/search/shards/28.bin", "revision": "66ae284a"},
+    {"url": "assets/search/shards/29.bin", "revision": "a30644d4"},
+    {"url": "assets/search/shards/2_.bin", "revision": "773f9e75"},
+    {"url": "assets/search/shards/2a.bin", "revision": "b66971cf"},
+    {"url": "assets/search/shards/2d.bin", "revision": "56ffec05"},
+    {"url": "assets/search/shards/2i.bin", "revision": "864e750a"},
+    {"url": "assets/search/shards/2n.bin", "revision": "16c1b23b"},
+    {"url": "assets/search/shards/30.bin", "revision": "b82bab23"},
+    {"url": "assets/search/shards/31.bin", "revision": "0850f92f"},
+    {"url": "assets/search/shards/32.bin", "revision": "5a0a84ae"},
+    {"url": "assets/search/shards/33.bin", "revision": "478a6f8e"},
+    {"url": "assets/search/shards/35.bin", "revision": "5bc52cfb"},
+    {"url": "assets/search/shards/36.bin", "revision": "62a6e91c"},
+    {"url": "assets/search/shards/37.bin", "revision": "8656d9ba"},
+    {"url": "assets/search/shards/38.bin", "revision": "3d676834"},
+    {"url": "assets/search/shards/3_.bin", "revision": "5dfb0b27"},
+    {"url": "assets/search/shards/3d.bin", "revision": "66cb7b59"},
+    {"url": "assets/search/shards/3n.bin", "revision": "58f6cf72"},
+    {"url": "assets/search/shards/3r.bin", "revision": "13684021"},
+    {"url": "assets/search/shards/40.bin", "revision": "14a61c2b"},
+    {"url": "assets/search/shards/42.bin", "revision": "aff93907"},
+    {"url": "assets/search/shards/43.bin", "revision": "9cf11717"},
+    {"url": "assets/search/shards/44.bin", "revision": "d72268dd"},
+    {"url": "assets/search/shards/45.bin", "revision": "1a8a125d"},
+    {"url": "assets/search/shards/48.bin", "revision": "d6e3526b"},
+    {"url": "assets/search/shards/4_.bin", "revision": "591c09df"},
+    {"url": "assets/search/shards/50.bin", "revision": "51adce23"},
+    {"url": "assets/search/shards/51.bin", "revision": "5526cd0d"},
+    {"url": "assets/search/shards/54.bin", "revision": "676ac443"},
+    {"url": "assets/search/shards/55.bin", "revision": "d129f2e5"},
+    {"url": "assets/search/shards/56.bin", "revision": "61c3e3dc"},
+    {"url": "assets/search/shards/57.bin", "revision": "c9fd8d32"},
+    {"url": "assets/search/shards/5_.bin", "revision": "121f88c0"},
+    {"url": "assets/search/shards/5n.bin", "revision": "ff884a6b"},
+    {"url": "assets/search/shards/5v.bin", "revision": "52b3e298"},
+    {"url": "assets/search/shards/60.bin", "revision": "dfdab1db"},
+    {"url": "assets/search/shards/62.bin", "revision": "8555087d"},
+    {"url": "assets/search/shards/63.bin", "revision": "956873d4"},
+    {"url": "assets/search/shards/64.bin", "revision": "647194c0"},
+    {"url": "assets/search/shards/65.bin", "revision": "ad593fc5"},
+    {"url": "assets/search/shards/67.bin", "revision": "f110a55d"},
+    {"url": "assets/search/shards/69.bin", "revision": "98093577"},
+    {"url": "assets/search/shards/6_.bin", "revision": "d16d8186"},
+    {"url": "assets/search/shards/6p.bin", "revision": "0f095d08"},
+    {"url": "assets/search/shards/70.bin", "revision": "2c29bdfe"},
+    {"url": "assets/search/shards/71.bin", "revision": "aa856e37"},
+    {"url": "assets/search/shards/72.bin", "revision": "a86b3945"},
+    {"url": "assets/search/shards/75.bin", "revision": "b43004f6"},
+    {"url": "assets/search/shards/77.bin", "revision": "e8d91414"},
+    {"url": "assets/search/shards/7_.bin", "revision": "9d1fa4ea"},
+    {"url": "assets/search/shards/7n.bin", "revision": "0b33f483"},
+    {"url": "assets/search/shards/80.bin", "revision": "7bafc7c0"},
+    {"url": "assets/search/shards/82.bin", "revision": "195307b3"},
+    {"url": "assets/search/shards/84.bin", "revision": "035906ba"},
+    {"url": "assets/search/shards/86.bin", "revision": "9b9c5feb"},
+    {"url": "assets/search/shards/88.bin", "revision": "8f462d26"},
+    {"url": "assets/search/shards/8_.bin", "revision": "48207975"},
+    {"url": "assets/search/shards/90.bin", "revision": "b9d5179b"},
+    {"url": "assets/search/shards/91.bin", "revision": "852a6ad4"},
+    {"url": "assets/search/shards/93.bin", "revision": "6ef27b8a"},
+    {"url": "assets/search/shards/95.bin", "revision": "d00273a0"},
+    {"url": "assets/search/shards/96.bin", "revision": "59876f11"},
+    {"url": "assets/search/shards/98.bin", "revision": "0b83c2b5"},
+    {"url": "assets/search/shards/99.bin", "revision": "67f3e49d"},
+    {"url": "assets/search/shards/9_.bin", "revision": "888eb2b0"},
+    {"url": "assets/search/shards/a_.bin", "revision": "85491c8a"},
+    {"url": "assets/search/shards/ab.bin", "revision": "94109db7"},
+    {"url": "assets/search/shards/ac.bin", "revision": "320441da"},
+    {"url": "assets/search/shards/ad.bin", "revision": "b7621f2b"},
+    {"url": "assets/search/shards/af.bin", "revision": "88570696"},
+    {"url": "assets/search/shards/ag.bin", "revision": "b9684ebc"},
+    {"url": "assets/search/shards/ah.bin", "revision": "5d9ae313"},
+    {"url": "assets/search/shards/ai.bin", "revision": "0dfe2203"},
+    {"url": "assets/search/shards/al.bin", "revision": "2e6e610a"},
+    {"url": "assets/search/shards/am.bin", "revision": "fcd80ba6"},
+    {"url": "assets/search/shards/an.bin", "revision": "933c7e06"},
+    {"url": "assets/search/shards/ap.bin", "revision": "a10e8f87"},
+    {"url": "assets/search/shards/ar.bin", "revision": "4f79d33f"},
+    {"url": "assets/search/shards/as.bin", "revision": "d3a8989c"},
+    {"url": "assets/search/shards/at.bin", "revision": "0b061740"},
+    {"url": "assets/search/shards/au.bin", "revision": "dba32e13"},
+    {"url": "assets/search/shards/av.bin", "revision": "e916f20f"},
+    {"url": "assets/search/shards/aw.bin", "revision": "b72b3050"},
+    {"url": "assets/search/shards/ax.bin", "revision": "872f223d"},
+    {"url": "assets/search/shards/b0.bin", "revision": "5dc0bf69"},
+    {"url": "assets/search/shards/b_.bin", "revision": "ebc0a49a"},
+    {"url": "assets/search/shards/ba.bin", "revision": "94ec69b3"},
+    {"url": "assets/search/shards/bc.bin", "revision": "abd0df78"},
+    {"url": "assets/search/shards/be.bin", "revision": "672f3119"},
+    {"url": "assets/search/shards/bg.bin", "revision": "bad46c05"},
+    {"url": "assets/search/shards/bh.bin", "revision": "a1347cce"},
+    {"url": "assets/search/shards/bi.bin", "revision": "6d38c3fa"},
+    {"url": "assets/search/shards/bj.bin", "revision": "b6803afd"},
+    {"url": "assets/search/shards/bl.bin", "revision": "21bdf8c9"},
+    {"url": "assets/search/shards/bn.bin", "revision": "407f5739"},
+    {"url": "assets/search/shards/bo.bin", "revision": "df1ae6a0"},
+    {"url": "assets/search/shards/br.bin", "revision": "e9da9ce2"},
+    {"url": "assets/search/shards/bu.bin", "revision": "7377ce22"},
+    {"url": "assets/search/shards/by.bin", "revision": "f414ed7c"},
+    {"url": "assets/search/shards/c_.bin", "revision": "d437b91c"},
+    {"url": "assets/search/shards/ca.bin", "revision": "50a07e35"},
+    {"url": "assets/search/shards/cc.bin", "revision": "52ab46cc"},
+    {"url": "assets/search/shards/ce.bin", "revision": "45724c26"},
+    {"url": "assets/search/shards/ch.bin", "revision": "3d5625ab"},
+    {"url": "assets/search/shards/ci.bin", "revision": "6130c00c"},
+    {"url": "assets/search/shards/cl.bin", "revision": "677fdbc7"},
+    {"url": "assets/search/shards/cm.bin", "revision": "74fbb72d"},
+    {"url": "assets/search/shards/co.bin", "revision": "95b260ac"},
+    {"url": "assets/search/shards/cp.bin", "revision": "a662fa46"},
+    {"url": "assets/search/shards/cr.bin", "revision": "e3486f44"},
+    {"url": "assets/search/shards/cu.bin", "revision": "ad320b0f"},
+    {"url": "assets/search/shards/cv.bin", "revision": "447fa82b"},
+    {"url": "assets/search/shards/cy.bin", "revision": "4f8b27a0"},
+    {"url": "assets/search/shards/d_.bin", "revision": "a7197021"},
+    {"url": "assets/search/shards/da.bin", "revision": "b72f0f6d"},
+    {"url": "assets/search/shards/dd.bin", "revision": "90957df7"},
+    {"url": "assets/search/shards/de.bin", "revision": "a18532d0"},
+    {"url": "assets/search/shards/dh.bin", "revision": "f9d31280"},
+    {"url": "assets/search/shards/di.bin", "revision": "6e9e97ea"},
+    {"url": "assets/search/shards/dl.bin", "revision": "d02e7b05"},
+    {"url": "assets/search/shards/dm.bin", "revision": "6b227e06"},
+    {"url": "assets/search/shards/do.bin", "revision": "c868f0d3"},
+    {"url": "assets/search/shards/dr.bin", "revision": "14c396f8"},
+    {"url": "assets/search/shards/du.bin", "revision": "d45603ab"},
+    {"url": "assets/search/shards/dy.bin", "revision": "d383b197"},
+    {"url": "assets/search/shards/e_.bin", "revision": "c23b08cd"},
+    {"url": "assets/search/shards/ea.bin", "revision": "53d38546"},
+    {"url": "assets/search/shards/ec.bin", "revision": "6083991e"},
+    {"url": "assets/search/shards/ed.bin", "revision": "6b00ef45"},
+    {"url": "assets/search/shards/ef.bin", "revision": "819698f7"},
+    {"url": "assets/search/shards/ei.bin", "revision": "72db1a1c"},
+    {"url": "assets/search/shards/el.bin", "revision": "362f4fd0"},
+    {"url": "assets/search/shards/em.bin", "revision": "2c38ea16"},
+    {"url": "assets/search/shards/en.bin", "revision": "56548eb8"},
+    {"url": "assets/search/shards/eo.bin", "revision": "aacb80f2"},
+    {"url": "assets/search/shards/ep.bin", "revision": "9dfd7718"},
+    {"url": "assets/search/shards/eq.bin", "revision": "0e37d7dd"},
+    {"url": "assets/search/shards/er.bin", "revision": "5ee7d252"},
+    {"url": "assets/search/shards/es.bin", "revision": "f885a0d9"},
+    {"url": "assets/search/shards/et.bin", "revision": "9e03da8a"},
+    {"url": "assets/search/shards/eu.bin", "revision": "09cd46f2"},
+    {"url": "assets/search/shards/ev.bin", "revision": "44c917c1"},
+    {"url": "assets/search/shards/ex.bin", "revision": "c10fd50c"},
+    {"url": "assets/search/shards/f_.bin", "revision": "8d07f4c6"},
+    {"url": "assets/search/shards/fa.bin", "revision": "01c51b33"},
+    {"url": "assets/search/shards/fd.bin", "revision": "c036373e"},
+    {"url": "assets/search/shards/fe.bin", "revision": "c780faf5"},
+    {"url": "assets/search/shards/fi.bin", "revision": "7f4a057d"},
+    {"url": "assets/search/shards/fl.bin", "revision": "6daffe5c"},
+    {"url": "assets/search/shards/fm.bin", "revision": "d72b31bd"},
+    {"url": "assets/search/shards/fo.bin", "revision": "3fab3602"},
+    {"url": "assets/search/shards/fp.bin", "revision": "278ffdea"},
+    {"url": "assets/search/shards/fr.bin", "revision": "5f7f9348"},
+    {"url": "assets/search/shards/fs.bin", "revision": "b0f9029b"},
+    {"url": "assets/search/shards/fu.bin", "revision": "59897bd0"},
+    {"url": "assets/search/shards/g_.bin", "revision": "9f9e0698"},
+    {"url": "assets/search/shards/ga.bin", "revision": "11eb4e8a"},
+    {"url": "assets/search/shards/gb.bin", "revision": "bba07a6f"},
+    {"url": "assets/search/shards/gc.bin", "revision": "8767529d"},
+    {"url": "assets/search/shards/gd.bin", "revision": "d047d1c6"},
+    {"url": "assets/search/shards/ge.bin", "revision": "75160977"},
+    {"url": "assets/search/shards/gh.bin", "revision": "84c72e1d"},
+    {"url": "assets/search/shards/gi.bin", "revision": "07d62de9"},
+    {"url": "assets/search/shards/gl.bin", "revision": "271eca21"},
+    {"url": "assets/search/shards/gn.bin", "revision": "74c3ebf4"},
+    {"url": "assets/search/shards/go.bin", "revision": "0842cb86"},
+    {"url": "assets/search/shards/gp.bin", "revision": "30c793d6"},
+    {"url": "assets/search/shards/gr.bin", "revision": "401582fe"},
+    {"url": "assets/search/shards/gt.bin", "revision": "54397d13"},
+    {"url": "assets/search/shards/gu.bin", "revision": "ec95308e"},
+    {"url": "assets/search/shards/ha.bin", "revision": "f737cf52"},
+    {"url": "assets/search/shards/he.bin", "revision": "2c3e0a51"},
+    {"url": "assets/search/shards/hi.bin", "revision": "2e744ec9"},
+    {"url": "assets/search/shards/ho.bin", "revision": "10426c3e"},
+    {"url": "assets/search/shards/hp.bin", "revision": "ecde1d91"},
+    {"url": "assets/search/shards/hs.bin", "revision": "a40828a8"},
+    {"url": "assets/search/shards/ht.bin", "revision": "1fbe5e00"},
+    {"url": "assets/search/shards/hu.bin", "revision": "ec835ed1"},
+    {"url": "assets/search/shards/hy.bin", "revision": "2c1dda64"},
+    {"url": "assets/search/shards/hz.bin", "revision": "b08b940d"},
+    {"url": "assets/search/shards/i0.bin", "revision": "d42f0366"},
+    {"url": "assets/search/shards/i1.bin", "revision": "a945ef03"},
+    {"url": "assets/search/shards/i2.bin", "revision": "6e32875d"},
+    {"url": "assets/search/shards/i3.bin", "revision": "e54573c6"},
+    {"url": "assets/search/shards/i5.bin", "revision": "879abca7"},
+    {"url": "assets/search/shards/i7.bin", "revision": "54ed7ba1"},
+    {"url": "assets/search/shards/i9.bin", "revision": "5f15ed6b"},
+    {"url": "assets/search/shards/i_.bin", "revision": "240f476a"},
+    {"url": "assets/search/shards/ib.bin", "revision": "99147121"},
+    {"url": "assets/search/shards/id.bin", "revision": "fe077554"},
+    {"url": "assets/search/shards/ie.bin", "revision": "954df3e0"},
+    {"url": "assets/search/shards/if.bin", "revision": "3879ec4f"},
+    {"url": "assets/search/shards/ig.bin", "revision": "06d24335"},
+    {"url": "assets/search/shards/ii.bin", "revision": "36334340"},
+    {"url": "assets/search/shards/il.bin", "revision": "fb80f683"},
+    {"url": "assets/search/shards/im.bin", "revision": "357766f0"},
+    {"url": "assets/search/shards/in.bin", "revision": "464a3b95"},
+    {"url": "assets/search/shards/ip.bin", "revision": "e7627d2f"},
+    {"url": "assets/search/shards/ir.bin", "revision": "e1af2d2d"},
+    {"url": "assets/search/shards/is.bin", "revision": "c159654a"},
+    {"url": "assets/search/shards/it.bin", "revision": "610383c0"},
+    {"url": "assets/search/shards/j_.bin", "revision": "f9627ce9"},
+    {"url": "assets/search/shards/ja.bin", "revision": "4f9593ff"},
+    {"url": "assets/search/shards/jo.bin", "revision": "f9fd4c29"},
+    {"url": "assets/search/shards/jr.bin", "revision": "f6627d38"},
+    {"url": "assets/search/shards/ju.bin", "revision": "c708cbf0"},
+    {"url": "assets/search/shards/k_.bin", "revision": "0d88f890"},
+    {"url": "assets/search/shards/ka.bin", "revision": "67729f9a"},
+    {"url": "assets/search/shards/kb.bin", "revision": "558a1efb"},
+    {"url": "assets/search/shards/ke.bin", "revision": "e6973efb"},
+    {"url": "assets/search/shards/ki.bin", "revision": "155675c8"},
+    {"url": "assets/search/shards/kn.bin", "revision": "e2c7b788"},
+    {"url": "assets/search/shards/ko.bin", "revision": "086f7602"},
+    {"url": "assets/search/shards/l1.bin", "revision": "2f9fb369"},
+    {"url": "assets/search/shards/l2.bin", "revision": "02d5b8c8"},
+    {"url": "assets/search/shards/l3.bin", "revision": "f3605406"},
+    {"url": "assets/search/shards/l_.bin", "revision": "b3994b3b"},
+    {"url": "assets/search/shards/la.bin", "revision": "7e257304"},
+    {"url": "assets/search/shards/ld.bin", "revision": "422ba754"},
+    {"url": "assets/search/shards/le.bin", "revision": "fc6a3178"},
+    {"url": "assets/search/shards/lf.bin", "revision": "fec9ae99"},
+    {"url": "assets/search/shards/li.bin", "revision": "24594696"},
+    {"url": "assets/search/shards/ll.bin", "revision": "73315a31"},
+    {"url": "assets/search/shards/lo.bin", "revision": "cd2fd866"},
+    {"url": "assets/search/shards/lr.bin", "revision": "8a22aeae"},
+    {"url": "assets/search/shards/ls.bin", "revision": "aed07c7e"},
+    {"url": "assets/search/shards/lt.bin", "revision": "e74569ae"},
+    {"url": "assets/search/shards/lw.bin", "revision": "8c657ffb"},
+    {"url": "assets/search/shards/m_.bin", "revision": "d0b0c67f"},
+    {"url": "assets/search/shards/ma.bin", "revision": "cc7c2f3c"},
+    {"url": "assets/search/shards/mb.bin", "revision": "03670242"},
+    {"url": "assets/search/shards/me.bin", "revision": "82381161"},
+    {"url": "assets/search/shards/mh.bin", "revision": "6647661d"},
+    {"url": "assets/search/shards/mi.bin", "revision": "ff028332"},
+    {"url": "assets/search/shards/mm.bin", "revision": "93a090ce"},
+    {"url": "assets/search/shards/mn.bin", "revision": "688d3be1"},
+    {"url": "assets/search/shards/mo.bin", "revision": "3f09f55b"},
+    {"url": "assets/search/shards/mp.bin", "revision": "15ce8ae5"},
+    {"url": "assets/search/shards/ms.bin", "revision": "9f161635"},
+    {"url": "assets/search/shards/mt.bin", "revision": "2681f0a5"},
+    {"url": "assets/search/shards/mu.bin", "revision": "31abe6d2"},
+    {"url": "assets/search/shards/mv.bin", "revision": "744d1075"},
+    {"url": "assets/search/shards/n_.bin", "revision": "9fbbbf52"},
+    {"url": "assets/search/shards/na.bin", "revision": "98e5ef79"},
+    {"url": "assets/search/shards/nc.bin", "revision": "4330ea7a"},
+    {"url": "assets/search/shards/ne.bin", "revision": "3181d4f7"},
+    {"url": "assets/search/shards/nm.bin", "revision": "c9f69a7b"},
+    {"url": "assets/search/shards/no.bin", "revision": "06931e75"},
+    {"url": "assets/search/shards/np.bin", "revision": "03c19f21"},
+    {"url": "assets/search/shards/ns.bin", "revision": "65c4dc53"},
+    {"url": "assets/search/shards/nu.bin", "revision": "024b4681"},
+    {"url": "assets/search/shards/nv.bin", "revision": "2ad69d07"},
+    {"url": "assets/search/shards/o_.bin", "revision": "b2583dc5"},
+    {"url": "assets/search/shards/ob.bin", "revision": "cbed6b2d"},
+    {"url": "assets/search/shards/oc.bin", "revision": "88c73e6b"},
+    {"url": "assets/search/shards/of.bin", "revision": "f6452295"},
+    {"url": "assets/search/shards/ok.bin", "revision": "87d9de08"},
+    {"url": "assets/search/shards/ol.bin", "revision": "83c6ffb4"},
+    {"url": "assets/search/shards/om.bin", "revision": "76c35a2d"},
+    {"url": "assets/search/shards/on.bin", "revision": "bcea406b"},
+    {"url": "assets/search/shards/op.bin", "revision": "832d8498"},
+    {"url": "assets/search/shards/or.bin", "revision": "19dd4c4d"},
+    {"url": "assets/search/shards/os.bin", "revision": "f7f0eb90"},
+    {"url": "assets/search/shards/ot.bin", "revision": "2f855701"},
+    {"url": "assets/search/shards/ou.bin", "revision": "5e922a84"},
+    {"url": "assets/search/shards/ov.bin", "revision": "b196f277"},
+    {"url": "assets/search/shards/ow.bin", "revision": "23f9608d"},
+    {"url": "assets/search/shards/p_.bin", "revision": "4d5afd2b"},
+    {"url": "assets/search/shards/pa.bin", "revision": "dd9753da"},
+    {"url": "assets/search/shards/pc.bin", "revision": "d35bce02"},
+    {"url": "assets/search/shards/pe.bin", "revision": "41e864ff"},
+    {"url": "assets/search/shards/ph.bin", "revision": "8ead51b2"},
+    {"url": "assets/search/shards/pi.bin", "revision": "793aca63"},
+    {"url": "assets/search/shards/pl.bin", "revision": "db537e99"},
+    {"url": "assets/search/shards/po.bin", "revision": "a90367b7"},
+    {"url": "assets/search/shards/pr.bin", "revision": "b19e8dee"},
+    {"url": "assets/search/shards/ps.bin", "revision": "1f8be98f"},
+    {"url": "assets/search/shards/pt.bin", "revision": "23874ed6"},
+    {"url": "assets/search/shards/pu.bin", "revision": "237964ba"},
+    {"url": "assets/search/shards/py.bin", "revision": "a948d0d3"},
+    {"url": "assets/search/shards/q_.bin", "revision": "fff9cff1"},
+    {"url": "assets/search/shards/qe.bin", "revision": "771a3a0b"},
+    {"url": "assets/search/shards/qu.bin", "revision": "3613c294"},
+    {"url": "assets/search/shards/r0.bin", "revision": "2c0a7510"},
+    {"url": "assets/search/shards/r1.bin", "revision": "507532e0"},
+    {"url": "assets/search/shards/r2.bin", "revision": "e1ea4433"},
+    {"url": "assets/search/shards/r3.bin", "revision": "e586d783"},
+    {"url": "assets/search/shards/r4.bin", "revision": "c8e1e2a6"},
+    {"url": "assets/search/shards/r5.bin", "revision": "228fb80e"},
+    {"url": "assets/search/shards/r_.bin", "revision": "e51eb0af"},
+    {"url": "assets/search/shards/ra.bin", "revision": "e8593ede"},
+    {"url": "assets/search/shards/rc.bin", "revision": "9b26d223"},
+    {"url": "assets/search/shards/rd.bin", "revision": "277678de"},
+    {"url": "assets/search/shards/re.bin", "revision": "03cba71e"},
+    {"url": "assets/search/shards/rf.bin", "revision": "a975aba5"},
+    {"url": "assets/search/shards/rg.bin", "revision": "f20e8b34"},
+    {"url": "assets/search/shards/ri.bin", "revision": "ea50f55c"},
+    {"url": "assets/search/shards/rm.bin", "revision": "7ec87e78"},
+    {"url": "assets/search/shards/rn.bin", "revision": "9453d8a6"},
+    {"url": "assets/search/shards/ro.bin", "revision": "b8d3a12e"},
+    {"url": "assets/search/shards/rp.bin", "revision": "efa2e206"},
+    {"url": "assets/search/shards/rs.bin", "revision": "80a33d18"},
+    {"url": "assets/search/shards/rt.bin", "revision": "d8e42202"},
+    {"url": "assets/search/shards/ru.bin", "revision": "6cca49b2"},
+    {"url": "assets/search/shards/ry.bin", "revision": "03ac6dca"},
+    {"url": "assets/search/shards/s0.bin", "revision": "ac04bca7"},
+    {"url": "assets/search/shards/s_.bin", "revision": "1af648f6"},
+    {"url": "assets/search/shards/sa.bin", "revision": "b8a1927f"},
+    {"url": "assets/search/shards/sc.bin", "revision": "505e3d92"},
+    {"url": "assets/search/shards/sd.bin", "revision": "511953f9"},
+    {"url": "assets/search/shards/se.bin", "revision": "25f11f29"},
+    {"url": "assets/search/shards/sg.bin", "revision": "72438da4"},
+    {"url": "assets/search/shards/sh.bin", "revision": "b25cba27"},
+    {"url": "assets/search/shards/si.bin", "revision": "19d1d258"},
+    {"url": "assets/search/shards/sk.bin", "revision": "578c472f"},
+    {"url": "assets/search/shards/sl.bin", "revision": "5e544f30"},
+    {"url": "assets/search/shards/sm.bin", "revision": "a05bed93"},
+    {"url": "assets/search/shards/sn.bin", "revision": "fd1a87c8"},
+    {"url": "assets/search/shards/so.bin", "revision": "e7dca68a"},
+    {"url": "assets/search/shards/sp.bin", "revision": "00feabe5"},
+    {"url": "assets/search/shards/sq.bin", "revision": "63515f67"},
+    {"url": "assets/search/shards/sr.bin", "revision": "3eec413b"},
+    {"url": "assets/search/shards/ss.bin", "revision": "61f75301"},
+    {"url": "assets/search/shards/st.bin", "revision": "475944b3"},
+    {"url": "assets/search/shards/su.bin", "revision": "abfbe571"},
+    {"url": "assets/search/shards/sw.bin", "revision": "8dad7354"},
+    {"url": "assets/search/shards/sy.bin", "revision": "44ec8398"},
+    {"url": "assets/search/shards/t0.bin", "revision": "129394db"},
+    {"url": "assets/search/shards/t1.bin", "revision": "73f10acd"},
+    {"url": "assets/search/shards/t2.bin", "revision": "1379bab6"},
+    {"url": "assets/search/shards/t_.bin", "revision": "3a52954c"},
+    {"url": "assets/search/shards/ta.bin", "revision": "86b1cd50"},
+    {"url": "assets/search/shards/tb.bin", "revision": "800f98ef"},
+    {"url": "assets/search/shards/td.bin", "revision": "85d034a6"},
+    {"url": "assets/search/shards/te.bin", "revision": "e42f7d28"},
+    {"url": "assets/search/shards/th.bin", "revision": "00e82660"},
+    {"url": "assets/search/shards/ti.bin", "revision": "0d6cb6b2"},
+    {"url": "assets/search/shards/tl.bin", "revision": "caa09309"},
+    {"url": "assets/search/shards/to.bin", "revision": "2be70a8a"},
+    {"url": "assets/search/shards/tr.bin", "revision": "710fd670"},
+    {"url": "assets/search/shards/ts.bin", "revision": "d655863a"},
+    {"url": "assets/search/shards/tt.bin", "revision": "f0df80cf"},
+    {"url": "assets/search/shards/tu.bin", "revision": "6a7ba4f6"},
+    {"url": "assets/search/shards/tw.bin", "revision": "4055f4b4"},
+    {"url": "assets/search/shards/ty.bin", "revision": "4c5354f5"},
+    {"url": "assets/search/shards/u_.bin", "revision": "4f5857f2"},
+    {"url": "assets/search/shards/ub.bin", "revision": "a0379873"},
+    {"url": "assets/search/shards/ue.bin", "revision": "434305c5"},
+    {"url": "assets/search/shards/ul.bin", "revision": "13c61bdd"},
+    {"url": "assets/search/shards/um.bin", "revision": "2090455c"},
+    {"url": "assets/search/shards/un.bin", "revision": "9e3503bc"},
+    {"url": "assets/search/shards/up.bin", "revision": "d103c838"},
+    {"url": "assets/search/shards/ur.bin", "revision": "1701c8f7"},
+    {"url": "assets/search/shards/us.bin", "revision": "f736838d"},
+    {"url": "assets/search/shards/ut.bin", "revision": "19786c2c"},
+    {"url": "assets/search/shards/v2.bin", "revision": "2d23a483"},
+    {"url": "assets/search/shards/v_.bin", "revision": "ac829ace"},
+    {"url": "assets/search/shards/va.bin", "revision": "49b89a45"},
+    {"url": "assets/search/shards/ve.bin", "revision": "6544e0f1"},
+    {"url": "assets/search/shards/vi.bin", "revision": "ba65443b"},
+    {"url": "assets/search/shards/vo.bin", "revision": "b2e6c862"},
+    {"url": "assets/search/shards/vs.bin", "revision": "283f36a5"},
+    {"url": "assets/search/shards/w_.bin", "revision": "a09a52c9"},
+    {"url": "assets/search/shards/wa.bin", "revision": "e0376b0f"},
+    {"url": "assets/search/shards/wb.bin", "revision": "d2aa8b3e"},
+    {"url": "assets/search/shards/we.bin", "revision": "a3a97c60"},
+    {"url": "assets/search/shards/wh.bin", "revision": "cb7bee6c"},
+    {"url": "assets/search/shards/wi.bin", "revision": "188c5830"},
+    {"url": "assets/search/shards/wo.bin", "revision": "f8a0c9ba"},
+    {"url": "assets/search/shards/wr.bin", "revision": "b346fe39"},
+    {"url": "assets/search/shards/x8.bin", "revision": "b52ed3f7"},
+    {"url": "assets/search/shards/x_.bin", "revision": "742db6e1"},
+    {"url": "assets/search/shards/xe.bin", "revision": "6c3c1409"},
+    {"url": "assets/search/shards/xn.bin", "revision": "f642c11d"},
+    {"url": "assets/search/shards/xo.bin", "revision": "4349f4d0"},
+    {"url": "assets/search/shards/xx.bin", "revision": "8e136455"},
+    {"url": "assets/search/shards/y_.bin", "revision": "39ee264e"},
+    {"url": "assets/search/shards/ye.bin", "revision": "f583cc09"},
+    {"url": "assets/search/shards/yo.bin", "revision": "582851d5"},
+    {"url": "assets/search/shards/z_.bin", "revision": "2d13d101"},
+    {"url": "assets/search/shards/ze.bin", "revision": "5986c283"},
+    {"url": "assets/vendor/inter/inter.8e1b0549.woff2", "revision": null},
+    {"url": "assets/vendor/inter/inter.e35d8a2a.css", "revision": null},
+    {"url": "assets/vendor/katex/auto-render.min.e5372d19.js", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_AMS-Regular.0cdd387c.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Caligraphic-Bold.de7701e4.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Caligraphic-Regular.5d53e70a.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Fraktur-Bold.74444efd.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Fraktur-Regular.51814d27.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Main-Bold.0f60d1b8.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Main-BoldItalic.99cd42a3.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Main-Italic.97479ca6.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Main-Regular.c2342cd8.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Math-BoldItalic.dc47344d.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Math-Italic.7af58c5e.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_SansSerif-Bold.e99ae511.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_SansSerif-Italic.00b26ac8.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_SansSerif-Regular.68e8c73e.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Script-Regular.036d4e95.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Size1-Regular.6b47c401.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Size2-Regular.d04c5421.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Size3-Regular.73d59127.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Size4-Regular.a4af7d41.woff2", "revision": null},
+    {"url": "assets/vendor/katex/fonts/KaTeX_Typewriter-Regular.71d517d6.woff2", "revision": null},
+    {"url": "assets/vendor/katex/katex.min.759450e8.js", "revision": null},
+    {"url": "assets/vendor/katex/katex.min.d251b1a7.css", "revision": null},
+    {"url": "index.html", "revision": "48c57914"}
+  ]
+};
+
+(function () {
+  'use strict';
+
+  var PRECACHE = 'precache';
+  var RUNTIME = 'runtime';
+  var HASHED_NAME_RE = /\.[0-9a-f]{8}\.[A-Za-z0-9]+$/;
+  var RUNTIME_DESTINATIONS = ['style', 'script', 'font', 'image'];
+  var scope = self.registration.scope;
+
+  // Lookup form of a URL: same-origin paths decoded, so 'Moore%27s' and "Moore's" agree
+  function normalize(url) {
+    url = new URL(url, scope);
+    if (url.origin !== location.origin) return url.href;
+    try {
+      return url.origin + decodeURI(url.pathname);
+    } catch (e) {
+      return url.origin + url.pathname;
+    }
+  }
+
+  // URL -> cache key; keys of unhashed files carry their revision
+  var keys = {};
+  var entries = PRECACHE_MANIFEST.entries.map(function (entry) {
+    var url = new URL(entry.url, scope).href;
+    var key = entry.revision ? url + '?__rev=' + entry.revision : url;
+    keys[normalize(url)] = key;
+    return { url: url, key: key };
+  });
+  keys[normalize(scope)] = keys[normalize('index.html')];
+
+  function precacheEntry(cache, entry) {
+    return cache.match(entry.key).then(function (cached) {
+      if (cached) return;
+      var crossOrigin = new URL(entry.url).origin !== location.origin;
+      var request = new Request(entry.url, crossOrigin ? { mode: 'no-cors' } : { cache: 'no-cache' });
+      return fetch(request).then(function (response) {
+        if (!crossOrigin && !response.ok) throw new Error(entry.url + ': HTTP ' + response.status);
+        return cache.put(entry.key, response);
+      });
+    });
+  }
+
+  // Download what is not cached yet; an interrupted install resumes where it stopped
+  self.addEventListener('install', function (event) {
+    event.waitUntil(caches.open(PRECACHE).then(function (cache) {
+      return Promise.all(entries.map(function (entry) { return precacheEntry(cache, entry); }));
+    }).then(function () {
+      return self.skipWaiting();
+    }));
+  });
+
+  function prune(name, keep) {
+    return caches.open(name).then(function (cache) {
+      return cache.keys().then(function (requests) {
+        return Promise.all(requests.filter(function (request) {
+          return !keep(request.url);
+        }).map(function (request) {
+          return cache.delete(request);
+        }));
+      });
+    });
+  }
+
+  // Drop entries of an older manifest, and same-origin runtime copies the precache now covers
+  self.addEventListener('activate', function (event) {
+    var wanted = {};
+    entries.forEach(function (entry) { wanted[entry.key] = true; });
+    event.waitUntil(caches.keys().then(function (names) {
+      return Promise.all(names.filter(function (name) {
+        return name !== PRECACHE && name !== RUNTIME;
+      }).map(function (name) {
+        return caches.delete(name);
+      }));
+    }).then(function () {
+      return Promise.all([
+        prune(PRECACHE, function (url) { return wanted[url]; }),
+        prune(RUNTIME, function (url) { return new URL(url).origin !== location.origin; })
+      ]);
+    }).then(function () {
+      return self.clients.claim();
+    }));
+  });
+
+  function store(name, key, response) {
+    if (response.ok || response.type === 'opaque') {
+      var copy = response.clone();
+      caches.open(name).then(function (cache) { return cache.put(key, copy); });
+    }
+    return response;
+  }
+
+  function cacheFirst(request, key) {
+    return caches.match(key || request).then(function (cached) {
+      return cached || fetch(request).then(function (response) {
+        return store(key ? PRECACHE : RUNTIME, key || request, response);
+      });
+    });
+  }
+
+  function staleWhileRevalidate(request, key) {
+    var network = fetch(request).then(function (response) {
+      return store(key ? PRECACHE : RUNTIME, key || request, response);
+    });
+    return caches.match(key || request).then(function (cached) {
+      if (!cached) return network;
+      network.catch(function () {});
+      return cached;
+    });
+  }
+
+  self.addEventListener('fetch', function (event) {
+    var request = event.request;
+    if (request.method !== 'GET') return;
+    var url = new URL(request.url);
+    var sameOrigin = url.origin === location.origin;
+    var key = keys[normalize(url)];
+
+    if (!sameOrigin) {
+      // Pinned CDN versions and images never change under the same URL
+      if (key || RUNTIME_DESTINATIONS.indexOf(request.destination) !== -1) {
+        event.respondWith(cacheFirst(request, key));
+      }
+    } else if (HASHED_NAME_RE.test(url.pathname)) {
+      event.respondWith(cacheFirst(request, key));
+    } else if (key || request.mode === 'navigate') {
+      event.respondWith(staleWhileRevalidate(request, key));
+    }
+  });
+})();
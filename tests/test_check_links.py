@@ -0,0 +1,158 @@
+"""Tests for scripts/check_links.py: internal links over a temporary site tree, external ones against a local HTTP server."""
+
+import asyncio
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import check_links  # noqa: E402
+
+
+class CheckInternalTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.write('Lectures/html/lecture-01.html', '<h2 id="intro">Intro</h2>')
+        self.write('Lectures/html/complete-notes.html',
+                   '<h1 id="top">Notes</h1><div data-fragment="notes/lecture-02.html"></div>')
+        self.write('Lectures/html/notes/lecture-02.html', '<h2 id="lecture-2-loops">Loops</h2>')
+        self.write('Lectures/img/figure.png', '')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, rel_path, html):
+        path = self.root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(html, encoding='utf-8')
+
+    def problems(self, html):
+        self.write('index.html', html)
+        problems, _, _ = check_links.check_internal(check_links.collect_pages(self.root), self.root)
+        return [(problem['page'], problem['url'], problem['message']) for problem in problems]
+
+    def test_existing_targets(self):
+        html = ('<a href="Lectures/html/lecture-01.html#intro">1</a>'
+                '<img src="Lectures/img/figure.png"><a href="#top-of-index" id="top-of-index">top</a>')
+        self.assertEqual(self.problems(html), [])
+
+    def test_missing_file(self):
+        self.assertEqual(self.problems('<a href="Lectures/html/lecture-09.html">9</a>'),
+                         [('index.html', 'Lectures/html/lecture-09.html', 'file not found')])
+
+    def test_missing_anchor(self):
+        self.assertEqual(self.problems('<a href="Lectures/html/lecture-01.html#outro">1</a>'),
+                         [('index.html', 'Lectures/html/lecture-01.html#outro',
+                           'no element with id "outro" on Lectures/html/lecture-01.html')])
+
+    def test_anchor_in_merged_fragment(self):
+        pages = check_links.collect_pages(self.root)
+        self.assertIn('lecture-2-loops', pages['Lectures/html/complete-notes.html']['anchors'])
+        self.assertEqual(pages['Lectures/html/notes/lecture-02.html']['base'], 'Lectures/html/complete-notes.html')
+        self.assertEqual(self.problems('<a href="Lectures/html/complete-notes.html#lecture-2-loops">2</a>'), [])
+
+    def test_fragment_links_resolve_against_the_book_page(self):
+        self.write('Lectures/html/notes/lecture-02.html',
+                   '<h2 id="lecture-2-loops">Loops</h2><a href="lecture-01.html#intro">1</a>'
+                   '<a href="notes/lecture-02.html">self</a>')
+        self.assertEqual(self.problems(''), [])
+
+    def test_path_outside_the_site(self):
+        self.assertEqual(self.problems('<a href="../secrets.html">x</a><a href="/../x.html">y</a>'),
+                         [('index.html', '../secrets.html', 'points outside the site'),
+                          ('index.html', '/../x.html', 'points outside the site')])
+
+
+class Handler(BaseHTTPRequestHandler):
+    """/ok answers 200, /missing 404, /no-head 405 to HEAD but 200 to GET, /busy 429."""
+
+    requests = []
+
+    def respond(self):
+        Handler.requests.append((self.command, self.path))
+        if self.path == '/ok' or (self.path == '/no-head' and self.command == 'GET'):
+            status = 200
+        elif self.path == '/no-head':
+            status = 405
+        elif self.path == '/busy':
+            status = 429
+        else:
+            status = 404
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    do_HEAD = do_GET = respond
+
+    def log_message(self, *args):
+        pass
+
+
+class CheckExternalTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        Handler.requests = []
+        self.fetcher = check_links.UrllibFetcher(timeout=5, workers=4)
+
+    def tearDown(self):
+        self.fetcher.close()
+
+    def check(self, paths, cache=None, ttl=3600):
+        urls = [self.base + path for path in paths]
+        errors, cached = asyncio.run(check_links.check_external(urls, self.fetcher, 4, cache, ttl))
+        return {url[len(self.base):]: error for url, error in errors.items()}, cached
+
+    def test_ok(self):
+        self.assertEqual(self.check(['/ok']), ({}, 0))
+
+    def test_not_found(self):
+        errors, _ = self.check(['/missing'])
+        self.assertEqual(errors, {'/missing': 'HTTP 404'})
+
+    def test_head_refused_falls_back_to_get(self):
+        errors, _ = self.check(['/no-head'])
+        self.assertEqual(errors, {})
+        self.assertEqual(Handler.requests, [('HEAD', '/no-head'), ('GET', '/no-head')])
+
+    def test_too_many_requests_is_not_an_error(self):
+        cache = {}
+        errors, _ = self.check(['/busy'], cache)
+        self.assertEqual(errors, {})
+        self.assertEqual(cache, {})
+
+    def test_cached_url_is_not_fetched_again(self):
+        cache = {}
+        self.assertEqual(self.check(['/ok', '/missing'], cache), ({'/missing': 'HTTP 404'}, 0))
+        self.assertEqual(list(cache), [self.base + '/ok'])
+
+        Handler.requests = []
+        errors, cached = self.check(['/ok', '/missing'], cache)
+        self.assertEqual((errors, cached), ({'/missing': 'HTTP 404'}, 1))
+        self.assertEqual(Handler.requests, [('HEAD', '/missing')])
+
+    def test_expired_cache_entry_is_fetched_again(self):
+        cache = {}
+        self.check(['/ok'], cache)
+        Handler.requests = []
+        self.assertEqual(self.check(['/ok'], cache, ttl=0), ({}, 0))
+        self.assertEqual(Handler.requests, [('HEAD', '/ok')])
+
+
+if __name__ == '__main__':
+    unittest.main()